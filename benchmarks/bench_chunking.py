@@ -0,0 +1,84 @@
+"""Benchmark splitting large pages.
+
+"characters x2" is the previous setup: the analyzer and the repository
+each split the text with their own character-based splitter. "tokens,
+shared" splits once with the shared TextChunker, whose second split is
+served from its cache.
+
+Token counting uses CHUNK_ENCODING. tiktoken downloads encodings on first
+use; without network access the chunker falls back to a length estimate,
+which the output notes.
+
+Usage:
+    python -m benchmarks.bench_chunking [--sizes 50000 200000 1000000]
+"""
+import argparse
+import random
+import statistics
+import time
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from src.services.chunking.chunker import TextChunker
+
+WORDS = "the of and to in a is that for it as was with be by on not he this are or his from at which".split()
+
+
+def page(size: int, rng: random.Random) -> str:
+    """Build a page of paragraphs with about ``size`` characters."""
+    paragraphs, length = [], 0
+    while length < size:
+        sentences = [
+            " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 25))).capitalize() + "."
+            for _ in range(rng.randint(2, 8))
+        ]
+        paragraphs.append(" ".join(sentences))
+        length += len(paragraphs[-1]) + 2
+    return "\n\n".join(paragraphs)
+
+
+def timed(run, repeats: int) -> float:
+    """Median wall time of ``run`` in milliseconds."""
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main(sizes: list, repeats: int) -> None:
+    """Time both setups for each page size."""
+    rng = random.Random(0)
+    probe = TextChunker()
+    if probe.encoding is None:
+        print("Tokenizer unavailable: token counts are estimated\n")
+    
+    print(f"{'characters':>12}{'chunks':>8}{'characters x2 (ms)':>20}{'tokens (ms)':>14}{'tokens, cached (ms)':>21}")
+    for size in sizes:
+        text = page(size, rng)
+        splitter = RecursiveCharacterTextSplitter(
+            chunk_size=2000, chunk_overlap=200, separators=["\n\n", "\n", ". ", " ", ""]
+        )
+        
+        def characters_twice():
+            splitter.split_text(text)
+            splitter.split_text(text)
+        
+        def tokens_uncached():
+            TextChunker(encoding=probe.encoding).split(text)
+        
+        chunker = TextChunker(encoding=probe.encoding)
+        chunks = chunker.split(text)
+        print(
+            f"{len(text):>12}{len(chunks):>8}{timed(characters_twice, repeats):>20.1f}"
+            f"{timed(tokens_uncached, repeats):>14.1f}{timed(lambda: chunker.split(text), repeats):>21.3f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50000, 200000, 1000000], help="page sizes in characters")
+    parser.add_argument("--repeats", type=int, default=5, help="timed runs per size")
+    args = parser.parse_args()
+    main(args.sizes, args.repeats)
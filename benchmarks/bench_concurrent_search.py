@@ -0,0 +1,127 @@
+"""Benchmark /api/search/content latency while ingestion runs.
+
+"inline" runs the synchronous Chroma and embedding calls directly on the
+event loop, as the repository used to. "thread pool" runs them on the
+repository's bounded executor.
+
+A deterministic fake embedding model with a fixed delay per call stands in
+for the OpenAI round trip, so the numbers show how much an ingestion
+blocks concurrent searches.
+
+Usage:
+    python -m benchmarks.bench_concurrent_search [--requests 200] [--embed-delay 0.05]
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from contextlib import nullcontext
+from typing import List
+from unittest.mock import patch
+import httpx
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from src.core.config import get_settings
+from src.core.factory import SERVICE_FACTORIES, get_repository
+from src.models.content import Content
+from src.services.storage.repository import ChromaRepository
+
+
+class SlowFakeEmbedding(DeterministicFakeEmbedding):
+    """Fake embedding model that sleeps like a network round trip."""
+
+    delay: float = 0.05
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        time.sleep(self.delay)
+        return super().embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        time.sleep(self.delay)
+        return super().embed_query(text)
+
+
+async def run_inline(self, func, *args):
+    """Old behaviour: call blocking functions on the event loop."""
+    return func(*args)
+
+
+def percentile(values: list, pct: float) -> float:
+    """Return the given percentile of a list of values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def article(i: int) -> Content:
+    """Build a synthetic article."""
+    return Content(
+        url=f"https://example.com/{i}",
+        title=f"Article {i}",
+        content=f"Article {i} about topic {i % 10}. " * 200,
+        source="example.com"
+    )
+
+
+async def ingest(stop: asyncio.Event) -> None:
+    """Store new articles until stopped."""
+    repository = get_repository()
+    i = 1000
+    while not stop.is_set():
+        await repository.store_multiple([article(i), article(i + 1)])
+        i += 2
+        # Steady ingestion traffic rather than a tight loop
+        await asyncio.sleep(0.1)
+
+
+async def measure(client: httpx.AsyncClient, requests: int, concurrency: int) -> list:
+    """Issue concurrent searches during ingestion and return latencies in milliseconds."""
+    stop = asyncio.Event()
+    ingestion = asyncio.create_task(ingest(stop))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> float:
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get("/api/search/content", params={"query": f"topic {i % 10}", "limit": 5})
+            response.raise_for_status()
+            return (time.perf_counter() - started) * 1000
+
+    try:
+        return await asyncio.gather(*(one(i) for i in range(requests)))
+    finally:
+        stop.set()
+        await ingestion
+
+
+async def main(requests: int, concurrency: int, embed_delay: float) -> None:
+    """Seed a temporary store and compare both execution models."""
+    settings = get_settings()
+    with tempfile.TemporaryDirectory() as persist_dir, \
+         patch.object(settings, "chroma_persist_dir", persist_dir), \
+         patch.object(settings, "embedding_cache_enabled", False), \
+         patch("src.services.storage.repository.OpenAIEmbeddings",
+               side_effect=lambda **kwargs: SlowFakeEmbedding(size=1536, delay=embed_delay)):
+        from src.main import app
+
+        await get_repository().store_multiple([article(i) for i in range(50)])
+        transport = httpx.ASGITransport(app=app)
+        print(f"{'mode':<14}{'median (ms)':>14}{'p99 (ms)':>12}")
+        for name, inline in (("inline", True), ("thread pool", False)):
+            with patch.object(ChromaRepository, "_run", run_inline) if inline else nullcontext():
+                async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                    timings = await measure(client, requests, concurrency)
+            print(f"{name:<14}{statistics.median(timings):>14.2f}{percentile(timings, 0.99):>12.2f}")
+
+        await get_repository().close()
+        for factory in SERVICE_FACTORIES:
+            factory.cache_clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="search requests per mode")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent search requests")
+    parser.add_argument("--embed-delay", type=float, default=0.05, help="seconds per fake embedding call")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.embed_delay))
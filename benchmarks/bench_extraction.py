@@ -0,0 +1,59 @@
+"""Benchmark main-text extraction on saved HTML fixtures.
+
+Compares the legacy script, which joined ``textContent`` of every element,
+with the single-pass readability script used by ``PlaywrightExtractor``.
+Reports the payload size returned from the page and the evaluation latency.
+
+Usage:
+    python -m benchmarks.bench_extraction [--runs 20]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+from playwright.async_api import async_playwright
+
+from src.services.extraction.extractor import READABILITY_SCRIPT
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+LEGACY_SCRIPT = """
+    Array.from(document.body.getElementsByTagName('*'))
+        .map(el => el.textContent)
+        .join('\\n')
+"""
+
+
+async def measure(page, script: str, runs: int) -> tuple:
+    """Return payload size in bytes and median latency in milliseconds."""
+    timings = []
+    result = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = await page.evaluate(script)
+        timings.append((time.perf_counter() - started) * 1000)
+    payload = len(json.dumps(result).encode("utf-8"))
+    return payload, statistics.median(timings)
+
+
+async def main(runs: int) -> None:
+    """Run the benchmark over every fixture."""
+    print(f"{'fixture':<24}{'script':<12}{'payload (KB)':>14}{'median (ms)':>14}")
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        page = await browser.new_page()
+        for fixture in sorted(FIXTURES_DIR.glob("*.html")):
+            await page.set_content(fixture.read_text(encoding="utf-8"))
+            for name, script in (("legacy", LEGACY_SCRIPT), ("readability", READABILITY_SCRIPT)):
+                payload, latency = await measure(page, script, runs)
+                print(f"{fixture.stem:<24}{name:<12}{payload / 1024:>14.1f}{latency:>14.2f}")
+        await browser.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="evaluations per script and fixture")
+    args = parser.parse_args()
+    asyncio.run(main(args.runs))
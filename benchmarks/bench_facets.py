@@ -0,0 +1,75 @@
+"""Benchmark top-N facet reads and upserts as the corpus grows.
+
+Synthetic articles with Zipf-like topic and keyword frequencies are
+counted into a FacetIndex; after each size step the median latency of
+reading the top 50 values of every facet and of re-upserting an existing
+article with new facet values is reported.
+
+Usage:
+    python -m benchmarks.bench_facets [--sizes 1000 10000 50000]
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from src.models.content import Content
+from src.services.storage.facets import FACETS, FacetIndex
+
+
+def article(i: int, rng: random.Random) -> Content:
+    """Build a synthetic article with skewed facet values."""
+    def pick(prefix: str, count: int) -> list:
+        return list({f"{prefix}{int(rng.paretovariate(1.2))}" for _ in range(count)})
+
+    return Content(
+        url=f"https://example.com/{i}",
+        title=f"Article {i}",
+        content="Body",
+        source=f"source{int(rng.paretovariate(1.5))}.com",
+        topics=pick("topic", 4),
+        keywords=pick("keyword", 8),
+        sentiment=rng.choice(["positive", "neutral", "negative"])
+    )
+
+
+def main(sizes: list, reads: int, writes: int) -> None:
+    """Grow the index step by step and time top-N reads and upserts."""
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        index = FacetIndex(str(Path(tmp) / "facets.sqlite3"))
+        stored = 0
+        print(f"{'articles':>10}{'distinct values':>18}{'median top-50 (ms)':>22}{'median upsert (ms)':>22}")
+        for size in sizes:
+            while stored < size:
+                index.upsert(article(stored, rng))
+                stored += 1
+            timings = []
+            for _ in range(reads):
+                started = time.perf_counter()
+                index.top(list(FACETS), 50)
+                timings.append((time.perf_counter() - started) * 1000)
+            # Rewriting existing articles exercises both count updates and deletes
+            write_timings = []
+            for _ in range(writes):
+                updated = article(rng.randrange(stored), rng)
+                started = time.perf_counter()
+                index.upsert(updated)
+                write_timings.append((time.perf_counter() - started) * 1000)
+            distinct = index._conn.execute("SELECT COUNT(*) FROM facet_counts").fetchone()[0]
+            print(
+                f"{size:>10}{distinct:>18}{statistics.median(timings):>22.3f}"
+                f"{statistics.median(write_timings):>22.3f}"
+            )
+        index.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000], help="corpus sizes")
+    parser.add_argument("--reads", type=int, default=100, help="timed reads per size")
+    parser.add_argument("--writes", type=int, default=200, help="timed upserts per size")
+    args = parser.parse_args()
+    main(args.sizes, args.reads, args.writes)
@@ -0,0 +1,73 @@
+"""Benchmark peak memory of bulk ingestion.
+
+"single call" builds the chunks of every article and hands them to one
+``add_documents`` call, as ``store_multiple`` used to. "streaming" feeds
+a generator through ``ChromaRepository.store_stream``.
+
+A deterministic fake embedding model replaces OpenAI. Peak memory is
+measured with tracemalloc, so only Python allocations are counted.
+
+Usage:
+    python -m benchmarks.bench_ingest_memory [--articles 250 1000]
+"""
+import argparse
+import asyncio
+import tempfile
+import tracemalloc
+from unittest.mock import patch
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from src.models.content import Content
+from src.services.storage.repository import ChromaRepository
+
+
+def articles(count: int):
+    """Generate synthetic articles lazily."""
+    for i in range(count):
+        yield Content(
+            url=f"https://example.com/{i}",
+            title=f"Article {i}",
+            content=f"Article {i} about topic {i % 10}. " * 400,
+            source="example.com"
+        )
+
+
+async def single_call(repository: ChromaRepository, count: int) -> None:
+    """Old behaviour: one add_documents call for everything."""
+    documents = [doc for content in articles(count) for doc in repository._create_document(content)]
+    repository.vectorstore.add_documents(documents)
+
+
+async def streaming(repository: ChromaRepository, count: int) -> None:
+    """Streaming pipeline."""
+    async for result in repository.store_stream(articles(count)):
+        assert result.ok, result.error
+
+
+async def peak(mode, count: int) -> float:
+    """Run one ingestion into a fresh store and return the peak in MB."""
+    with tempfile.TemporaryDirectory() as persist_dir:
+        repository = ChromaRepository(persist_dir=persist_dir)
+        tracemalloc.start()
+        await mode(repository, count)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        await repository.close()
+    return peak_bytes / 2 ** 20
+
+
+async def main(counts: list) -> None:
+    """Compare both modes for each corpus size."""
+    print(f"{'articles':>10}{'single call (MB)':>20}{'streaming (MB)':>18}")
+    with patch("src.services.storage.repository.OpenAIEmbeddings",
+               side_effect=lambda **kwargs: DeterministicFakeEmbedding(size=1536)), \
+         patch("src.services.storage.repository.settings.embedding_cache_enabled", False):
+        for count in counts:
+            print(f"{count:>10}{await peak(single_call, count):>20.1f}{await peak(streaming, count):>18.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, nargs="+", default=[250, 1000], help="corpus sizes")
+    args = parser.parse_args()
+    asyncio.run(main(args.articles))
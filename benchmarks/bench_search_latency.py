@@ -0,0 +1,78 @@
+"""Benchmark /api/search/content latency with per-request vs shared services.
+
+"Per-request" clears the factory caches before every request, which is how
+the old factory behaved: a new PersistentClient, embeddings client and
+collection handle for each call. "Shared" reuses the instance built once.
+
+A deterministic fake embedding model replaces OpenAI so the numbers show
+local overhead only, without network latency or API cost.
+
+Usage:
+    python -m benchmarks.bench_search_latency [--requests 200]
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from src.core.config import get_settings
+from src.core.factory import SERVICE_FACTORIES, get_repository
+from src.models.content import Content
+
+
+def percentile(values: list, pct: float) -> float:
+    """Return the given percentile of a list of values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def run(client: TestClient, requests: int, per_request: bool) -> list:
+    """Issue search requests and return latencies in milliseconds."""
+    timings = []
+    for i in range(requests):
+        if per_request:
+            for factory in SERVICE_FACTORIES:
+                factory.cache_clear()
+        started = time.perf_counter()
+        response = client.get("/api/search/content", params={"query": f"topic {i % 10}", "limit": 5})
+        timings.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+    return timings
+
+
+def main(requests: int) -> None:
+    """Seed a temporary store and compare both modes."""
+    settings = get_settings()
+    with tempfile.TemporaryDirectory() as persist_dir, \
+         patch.object(settings, "chroma_persist_dir", persist_dir), \
+         patch("src.services.storage.repository.OpenAIEmbeddings",
+               side_effect=lambda **kwargs: DeterministicFakeEmbedding(size=1536)):
+        from src.main import app
+
+        asyncio.run(get_repository().store_multiple([
+            Content(
+                url=f"https://example.com/{i}",
+                title=f"Article {i}",
+                content=f"Article {i} about topic {i % 10}. " * 50,
+                source="example.com"
+            ) for i in range(50)
+        ]))
+
+        client = TestClient(app)
+        print(f"{'mode':<14}{'median (ms)':>14}{'p95 (ms)':>12}")
+        for name, per_request in (("per-request", True), ("shared", False)):
+            for factory in SERVICE_FACTORIES:
+                factory.cache_clear()
+            timings = run(client, requests, per_request)
+            print(f"{name:<14}{statistics.median(timings):>14.2f}{percentile(timings, 0.95):>12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200, help="requests per mode")
+    args = parser.parse_args()
+    main(args.requests)
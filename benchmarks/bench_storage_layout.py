@@ -0,0 +1,110 @@
+"""Benchmark disk size and search latency of the vector store layouts.
+
+"legacy" copies the full article text and summary into the metadata of
+every chunk, as ChromaRepository used to. "normalized" stores only the
+content id per chunk and keeps each article once in the article store.
+
+A deterministic fake embedding model replaces OpenAI so only local
+storage and query costs are measured.
+
+Usage:
+    python -m benchmarks.bench_storage_layout [--articles 200] [--paragraphs 40]
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+from langchain.schema import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from src.models.content import Content
+from src.services.storage.repository import ChromaRepository
+
+PARAGRAPH = (
+    "The council approved the transit budget on Tuesday after months of debate, "
+    "officials said, adding that construction on the new lines would start next spring. "
+)
+
+
+class LegacyChromaRepository(ChromaRepository):
+    """Repository writing the old denormalized chunk metadata."""
+
+    def _create_document(self, content: Content) -> List[Document]:
+        documents = super()._create_document(content)
+        metadata = {
+            "url": content.url,
+            "title": content.title,
+            "source": content.source,
+            "summary": content.summary,
+            "content": content.content,
+            "author": content.author,
+            "published_at": str(content.published_at),
+            "language": content.language,
+            "sentiment": content.sentiment,
+            "reading_time": content.reading_time,
+            "topics": ", ".join(content.topics),
+            "keywords": ", ".join(content.keywords)
+        }
+        return [Document(page_content=doc.page_content, metadata=metadata) for doc in documents]
+
+    async def store(self, content: Content) -> None:
+        self.vectorstore.add_documents(self._create_document(content))
+
+    async def store_multiple(self, contents: List[Content]) -> None:
+        self.vectorstore.add_documents([doc for content in contents for doc in self._create_document(content)])
+
+
+def directory_size(path: Path) -> int:
+    """Total size of all files below a directory, in bytes."""
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+async def measure(repository_class, persist_dir: Path, contents: List[Content], queries: int) -> tuple:
+    """Store the contents, then return disk size and median search latency."""
+    repository = repository_class(persist_dir=str(persist_dir))
+    for start in range(0, len(contents), 50):
+        await repository.store_multiple(contents[start:start + 50])
+
+    timings = []
+    for i in range(queries):
+        started = time.perf_counter()
+        await repository.search(f"transit budget {i}", limit=5)
+        timings.append((time.perf_counter() - started) * 1000)
+    await repository.close()
+    return directory_size(persist_dir), statistics.median(timings)
+
+
+async def main(articles: int, paragraphs: int, queries: int) -> None:
+    """Compare both layouts on the same synthetic corpus."""
+    contents = [
+        Content(
+            url=f"https://example.com/article/{i}",
+            title=f"Article {i}",
+            content=PARAGRAPH * paragraphs,
+            source="example.com",
+            summary="A summary of the transit budget decision. " * 3,
+            topics=["transit", "budget"],
+            keywords=["council", "transit"]
+        ) for i in range(articles)
+    ]
+    print(f"{'layout':<12}{'disk (MB)':>12}{'median search (ms)':>20}")
+    with patch("src.services.storage.repository.OpenAIEmbeddings",
+               side_effect=lambda **kwargs: DeterministicFakeEmbedding(size=1536)), \
+         patch("src.services.storage.repository.settings.embedding_cache_enabled", False):
+        for name, repository_class in (("legacy", LegacyChromaRepository), ("normalized", ChromaRepository)):
+            with tempfile.TemporaryDirectory() as tmp:
+                size, latency = await measure(repository_class, Path(tmp), contents, queries)
+            print(f"{name:<12}{size / 2 ** 20:>12.1f}{latency:>20.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=200, help="number of articles to store")
+    parser.add_argument("--paragraphs", type=int, default=40, help="paragraphs per article")
+    parser.add_argument("--queries", type=int, default=100, help="search queries to time")
+    args = parser.parse_args()
+    asyncio.run(main(args.articles, args.paragraphs, args.queries))
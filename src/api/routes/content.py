@@ -1,21 +1,29 @@
 """Content-related API routes."""
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import List, Literal
 
 from src.models.content import Content
 from src.models.analyze import ProcessUrlRequest
+from src.models.job import JobResponse
 from src.core.exceptions import ContentExtractionError, ContentAnalysisError
 from src.services.extraction.interface import ContentExtractorInterface
 from src.services.analysis.interface import ContentAnalyzerInterface
 from src.services.storage.interface import ContentRepositoryInterface
-from src.core.factory import get_extractor, get_analyzer, get_repository
+from src.services.jobs.pipeline import ProcessingPipeline
+from src.services.jobs.workers import JobWorkers
+from src.core.factory import get_extractor, get_analyzer, get_repository, get_job_workers
 
 router = APIRouter(prefix="/api/content")
 
+NDJSON = "application/x-ndjson"
+
 
 @router.post("/process", response_model=Content | List[Content])
 async def process_url(
     request: ProcessUrlRequest,
+    http_request: Request,
+    output_format: Literal["json", "ndjson"] = Query("json", alias="format"),
     extractor: ContentExtractorInterface = Depends(get_extractor),
     analyzer: ContentAnalyzerInterface = Depends(get_analyzer),
     repository: ContentRepositoryInterface = Depends(get_repository)
@@ -26,11 +34,25 @@ async def process_url(
     1. Extracts content from the provided URL(s)
     2. Analyzes the content using LLM
     3. Stores the processed content in the database
+    
+    With ``format=ndjson`` (or ``Accept: application/x-ndjson``) every URL
+    moves through the stages on its own and one result per URL is streamed
+    back as soon as it is done.
     """
     try:
         request.validate_request()
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e))
+    
+    if output_format == "ndjson" or NDJSON in http_request.headers.get("accept", ""):
+        urls = [str(request.url)] if request.url else [str(url) for url in request.urls]
+        pipeline = ProcessingPipeline(extractor, analyzer, repository)
+        
+        async def lines():
+            async for result in pipeline.process(urls):
+                yield result.model_dump_json() + "\n"
+        
+        return StreamingResponse(lines(), media_type=NDJSON)
         
     try:
         if request.url:
@@ -63,4 +85,35 @@ async def process_url(
     except (ContentExtractionError, ContentAnalysisError) as e:
         raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/jobs", response_model=JobResponse, status_code=202)
+async def create_job(
+    request: ProcessUrlRequest,
+    jobs: JobWorkers = Depends(get_job_workers)
+):
+    """Queue one or multiple URLs for processing.
+    
+    Returns immediately; poll the job for per-URL status and results.
+    """
+    try:
+        request.validate_request()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    urls = [str(request.url)] if request.url else [str(url) for url in request.urls]
+    try:
+        job = await jobs.submit(urls)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return JobResponse.from_job(job)
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, jobs: JobWorkers = Depends(get_job_workers)):
+    """Get the status and results of a queued job."""
+    job = await jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JobResponse.from_job(job)
@@ -1,26 +1,183 @@
 """Search-related API routes."""
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+import base64
+import hashlib
+import json
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import Dict, List, Literal, Optional, Set
+from pydantic import ValidationError
 
-from src.models.content import Content
+from src.models.content import FacetCount, SearchFilters, SearchResult
 from src.services.storage.interface import ContentRepositoryInterface
+from src.core.config import get_settings
 from src.core.factory import get_repository
 from src.core.exceptions import SearchError
 
+settings = get_settings()
+
 router = APIRouter(prefix="/api/search")
 
+NDJSON = "application/x-ndjson"
+
+
+def _search_key(query: str, mode: str, aggregation: str, diversity: float, filters: SearchFilters) -> str:
+    """Fingerprint the parameters a cursor is valid for."""
+    payload = json.dumps([query, mode, aggregation, diversity, filters.model_dump(mode="json")], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
 
-@router.get("/content", response_model=List[Content])
+def _encode_cursor(offset: int, key: str) -> str:
+    """Build an opaque cursor pointing at the next page."""
+    raw = json.dumps({"offset": offset, "key": key}).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, key: str) -> int:
+    """Read the offset from a cursor issued for the same search."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        offset = int(data["offset"])
+        valid = data["key"] == key and offset >= 0
+    except Exception:
+        valid = False
+    if not valid:
+        raise HTTPException(status_code=400, detail="Invalid cursor for this search")
+    return offset
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[Set[str]]:
+    """Parse a comma-separated field projection; ``url`` is always kept."""
+    if not fields:
+        return None
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - set(SearchResult.model_fields)
+    if unknown:
+        raise HTTPException(status_code=422, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return requested | {"url"}
+
+
+@router.get("/content", response_model=List[SearchResult])
 async def search_content(
+    request: Request,
+    response: Response,
+    query: str,
+    limit: int = Query(None, ge=1),
+    aggregation: Literal["max", "sum"] = None,
+    diversity: float = Query(None, ge=0.0, le=1.0),
+    mode: Literal["vector", "keyword", "hybrid"] = None,
+    source: List[str] = Query(None),
+    sentiment: List[str] = Query(None),
+    language: List[str] = Query(None),
+    topics: List[str] = Query(None),
+    published_after: datetime = None,
+    published_before: datetime = None,
+    cursor: str = None,
+    fields: str = None,
+    output_format: Literal["json", "ndjson"] = Query("json", alias="format"),
+    repository: ContentRepositoryInterface = Depends(get_repository)
+):
+    """Search content by query.
+    
+    Returns up to ``limit`` distinct articles. ``mode`` picks embedding,
+    BM25 keyword or hybrid ranking; ``aggregation`` sets how chunk scores
+    combine per article and ``diversity`` enables MMR reranking. Repeated
+    ``source``, ``sentiment``, ``language`` and ``topics`` values match any
+    of them; the publication date range is inclusive.
+    
+    When more results exist, the ``X-Next-Cursor`` header holds a cursor for
+    the next page. ``fields`` limits the returned fields, and ``format=ndjson``
+    (or ``Accept: application/x-ndjson``) streams one result per line.
+    """
+    try:
+        filters = SearchFilters(
+            source=source or [],
+            sentiment=sentiment or [],
+            language=language or [],
+            topics=topics or [],
+            published_after=published_after,
+            published_before=published_before
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    key = _search_key(query, mode, aggregation, diversity, filters)
+    offset = _decode_cursor(cursor, key) if cursor else 0
+    include = _parse_fields(fields)
+    options = dict(aggregation=aggregation, diversity=diversity, mode=mode, filters=filters, offset=offset)
+    
+    try:
+        if output_format == "ndjson" or NDJSON in request.headers.get("accept", ""):
+            return await _stream_results(repository, query, limit, options, include)
+        
+        # One extra result tells whether there is a next page
+        page_size = limit or settings.max_results
+        results = await repository.search(query, page_size + 1, **options)
+        headers = {}
+        if len(results) > page_size:
+            results = results[:page_size]
+            headers["X-Next-Cursor"] = _encode_cursor(offset + page_size, key)
+        
+        if include is None:
+            response.headers.update(headers)
+            return results
+        return JSONResponse(
+            [result.model_dump(mode="json", include=include) for result in results],
+            headers=headers
+        )
+    except SearchError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
+
+
+async def _stream_results(
+    repository: ContentRepositoryInterface,
     query: str,
-    limit: int = None,
+    limit: Optional[int],
+    options: dict,
+    include: Optional[Set[str]]
+) -> StreamingResponse:
+    """Stream search results as NDJSON.
+    
+    The first result is awaited before responding, so a failing search
+    still produces an error status instead of a truncated stream.
+    """
+    stream = repository.search_stream(query, limit, **options)
+    try:
+        first = await anext(stream)
+    except StopAsyncIteration:
+        first = None
+    
+    async def lines():
+        if first is None:
+            return
+        yield first.model_dump_json(include=include) + "\n"
+        async for result in stream:
+            yield result.model_dump_json(include=include) + "\n"
+    
+    return StreamingResponse(lines(), media_type=NDJSON)
+
+
+@router.get("/facets", response_model=Dict[str, List[FacetCount]])
+async def search_facets(
+    facet: List[Literal["topics", "keywords", "source", "sentiment"]] = Query(None),
+    limit: int = Query(None, ge=1, le=1000),
     repository: ContentRepositoryInterface = Depends(get_repository)
 ):
-    """Search content by query."""
+    """Get the most frequent topics, keywords, sources and sentiments.
+    
+    ``facet`` can be repeated to select facets; all are returned by default.
+    """
     try:
-        results = await repository.search(query, limit)
-        return results
+        return await repository.facets(facet, limit)
     except SearchError as e:
         raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Facet lookup failed: {str(e)}")
+
+
+@router.get("/stats")
+async def search_stats(repository: ContentRepositoryInterface = Depends(get_repository)):
+    """Get hit rates of the search result and embedding caches."""
+    return await repository.stats()
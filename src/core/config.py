@@ -1,5 +1,7 @@
 """Application configuration."""
 import os
+from functools import lru_cache
+from typing import Literal
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
@@ -19,9 +21,59 @@ class Settings(BaseSettings):
     openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
     openai_model: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     openai_temperature: float = float(os.getenv("OPENAI_TEMPERATURE", "0.0"))
+    openai_requests_per_minute: int = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "500"))
+    openai_tokens_per_minute: int = int(os.getenv("OPENAI_TOKENS_PER_MINUTE", "200000"))
+    openai_max_retries: int = int(os.getenv("OPENAI_MAX_RETRIES", "5"))
+    openai_retry_base_delay: float = float(os.getenv("OPENAI_RETRY_BASE_DELAY", "1.0"))
+    openai_retry_max_delay: float = float(os.getenv("OPENAI_RETRY_MAX_DELAY", "30.0"))
+    analysis_concurrency: int = int(os.getenv("ANALYSIS_CONCURRENCY", "4"))
+    analysis_output_mode: Literal["parser", "structured"] = os.getenv("ANALYSIS_OUTPUT_MODE", "parser")
+    
+    # Analysis Cache Configuration
+    analysis_cache_enabled: bool = os.getenv("ANALYSIS_CACHE_ENABLED", "true").lower() == "true"
+    analysis_cache_path: str = os.getenv("ANALYSIS_CACHE_PATH", "./data/cache/analysis.sqlite3")
+    analysis_cache_ttl: int = int(os.getenv("ANALYSIS_CACHE_TTL", str(30 * 24 * 3600)))
+    analysis_cache_max_entries: int = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "100000"))
+    
+    # Long Content Analysis Configuration
+    analysis_mode: Literal["first_chunk", "map_reduce", "adaptive"] = os.getenv("ANALYSIS_MODE", "adaptive")
+    analysis_map_reduce_threshold: int = int(os.getenv("ANALYSIS_MAP_REDUCE_THRESHOLD", "2000"))
+    analysis_map_chunk_tokens: int = int(os.getenv("ANALYSIS_MAP_CHUNK_TOKENS", "2000"))
+    analysis_map_token_budget: int = int(os.getenv("ANALYSIS_MAP_TOKEN_BUDGET", "24000"))
+    analysis_map_concurrency: int = int(os.getenv("ANALYSIS_MAP_CONCURRENCY", "4"))
+    
+    # Packed Analysis Configuration
+    analysis_packing_enabled: bool = os.getenv("ANALYSIS_PACKING_ENABLED", "false").lower() == "true"
+    analysis_packing_item_tokens: int = int(os.getenv("ANALYSIS_PACKING_ITEM_TOKENS", "1500"))
+    analysis_packing_max_tokens: int = int(os.getenv("ANALYSIS_PACKING_MAX_TOKENS", "6000"))
+    analysis_packing_max_items: int = int(os.getenv("ANALYSIS_PACKING_MAX_ITEMS", "8"))
     
     # Database Configuration
     chroma_persist_dir: str = os.getenv("PERSIST_DIRECTORY", "./data/chroma")
+    chroma_host: str = os.getenv("CHROMA_HOST", "")
+    chroma_port: int = int(os.getenv("CHROMA_PORT", "8000"))
+    repository_workers: int = int(os.getenv("REPOSITORY_WORKERS", "4"))
+    
+    # Ingestion Configuration
+    embedding_batch_tokens: int = int(os.getenv("EMBEDDING_BATCH_TOKENS", "50000"))
+    embedding_batch_size: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "256"))
+    ingest_queue_size: int = int(os.getenv("INGEST_QUEUE_SIZE", "2"))
+    
+    # Job Queue Configuration
+    job_queue_path: str = os.getenv("JOB_QUEUE_PATH", "./data/jobs.sqlite3")
+    job_workers: int = int(os.getenv("JOB_WORKERS", "2"))
+    job_poll_interval: float = float(os.getenv("JOB_POLL_INTERVAL", "1.0"))
+    job_lease: int = int(os.getenv("JOB_LEASE", "600"))
+    job_max_attempts: int = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+    
+    # Pipeline Configuration
+    pipeline_store_concurrency: int = int(os.getenv("PIPELINE_STORE_CONCURRENCY", "2"))
+    pipeline_queue_size: int = int(os.getenv("PIPELINE_QUEUE_SIZE", "4"))
+    
+    # Embedding Cache Configuration
+    embedding_cache_enabled: bool = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+    embedding_cache_path: str = os.getenv("EMBEDDING_CACHE_PATH", "./data/cache/embeddings.sqlite3")
+    embedding_query_cache_size: int = int(os.getenv("EMBEDDING_QUERY_CACHE_SIZE", "1024"))
     
     # API Configuration
     api_title: str = os.getenv("API_TITLE", "Content Processing API")
@@ -29,11 +81,61 @@ class Settings(BaseSettings):
     api_version: str = os.getenv("API_VERSION", "1.0.0")
     
     # Content Extraction Configuration
-    chunk_size: int = int(os.getenv("CHUNK_SIZE", "2000"))
-    chunk_overlap: int = int(os.getenv("CHUNK_OVERLAP", "200"))
+    chunk_tokens: int = int(os.getenv("CHUNK_TOKENS", "500"))
+    chunk_overlap_tokens: int = int(os.getenv("CHUNK_OVERLAP_TOKENS", "50"))
+    chunk_encoding: str = os.getenv("CHUNK_ENCODING", "cl100k_base")
+    chunk_cache_size: int = int(os.getenv("CHUNK_CACHE_SIZE", "256"))
     max_results: int = int(os.getenv("MAX_RESULTS", "5"))
+    
+    # Search Configuration
+    search_overfetch_factor: int = int(os.getenv("SEARCH_OVERFETCH_FACTOR", "4"))
+    search_max_chunks: int = int(os.getenv("SEARCH_MAX_CHUNKS", "500"))
+    search_aggregation: Literal["max", "sum"] = os.getenv("SEARCH_AGGREGATION", "max")
+    search_diversity: float = float(os.getenv("SEARCH_DIVERSITY", "0.0"))
+    search_snippet_length: int = int(os.getenv("SEARCH_SNIPPET_LENGTH", "300"))
+    search_mode: Literal["vector", "keyword", "hybrid"] = os.getenv("SEARCH_MODE", "vector")
+    search_rrf_k: int = int(os.getenv("SEARCH_RRF_K", "60"))
+    facet_limit: int = int(os.getenv("FACET_LIMIT", "20"))
+    
+    # Search Cache Configuration
+    search_cache_enabled: bool = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+    search_cache_size: int = int(os.getenv("SEARCH_CACHE_SIZE", "1024"))
+    search_cache_ttl: int = int(os.getenv("SEARCH_CACHE_TTL", "300"))
+    search_cache_backend: str = os.getenv("SEARCH_CACHE_BACKEND", "")
+    
+    # Browser Pool Configuration
+    browser_pool_size: int = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+    browser_max_pages: int = int(os.getenv("BROWSER_MAX_PAGES", "100"))
+    
+    # Batch Extraction Configuration
+    extraction_concurrency: int = int(os.getenv("EXTRACTION_CONCURRENCY", "4"))
+    extraction_per_host_concurrency: int = int(os.getenv("EXTRACTION_PER_HOST_CONCURRENCY", "2"))
+    extraction_host_delay: float = float(os.getenv("EXTRACTION_HOST_DELAY", "0.0"))
+    
+    # Extraction Tier Configuration
+    extraction_mode: Literal["playwright", "tiered"] = os.getenv("EXTRACTION_MODE", "playwright")
+    http_timeout: float = float(os.getenv("HTTP_TIMEOUT", "10.0"))
+    http_max_connections: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+    http_min_content_length: int = int(os.getenv("HTTP_MIN_CONTENT_LENGTH", "500"))
+    http_user_agent: str = os.getenv(
+        "HTTP_USER_AGENT",
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0 Safari/537.36"
+    )
+    
+    # Page Loading Configuration
+    page_wait_until: Literal["commit", "domcontentloaded", "load", "networkidle"] = os.getenv(
+        "PAGE_WAIT_UNTIL", "domcontentloaded"
+    )
+    page_timeout_ms: int = int(os.getenv("PAGE_TIMEOUT_MS", "30000"))
+    blocked_resource_types: str = os.getenv("BLOCKED_RESOURCE_TYPES", "image,media,font")
+    blocked_domains: str = os.getenv(
+        "BLOCKED_DOMAINS",
+        "doubleclick.net,googlesyndication.com,google-analytics.com,googletagmanager.com,"
+        "facebook.net,scorecardresearch.com,adnxs.com,taboola.com,outbrain.com,chartbeat.com"
+    )
 
 
+@lru_cache
 def get_settings() -> Settings:
     """Get application settings."""
     return Settings() 
\ No newline at end of file
@@ -8,6 +8,11 @@ class ContentExtractionError(ContentProcessingException):
     pass
 
 
+class RenderingRequiredError(ContentExtractionError):
+    """Raised when a page needs a browser to render its content."""
+    pass
+
+
 class ContentAnalysisError(ContentProcessingException):
     """Raised when content analysis fails."""
     pass
@@ -1,25 +1,80 @@
-"""Service factory module."""
+"""Service factory module.
+
+Services are created once per process and shared by all requests. The
+application lifespan builds them on startup and closes them on shutdown.
+"""
+from functools import lru_cache
+
 from src.services.extraction.interface import ContentExtractorInterface
 from src.services.analysis.interface import ContentAnalyzerInterface
 from src.services.storage.interface import ContentRepositoryInterface
 from src.services.extraction.extractor import PlaywrightExtractor
+from src.services.extraction.tiered_extractor import TieredExtractor
 from src.services.analysis.analyzer import OpenAIAnalyzer
 from src.services.storage.repository import ChromaRepository
+from src.services.jobs.workers import JobWorkers
+from src.services.extraction.browser_pool import get_browser_pool
+from src.services.extraction.http_extractor import get_http_client
 from src.core.config import get_settings
 
 settings = get_settings()
 
 
+@lru_cache
 def get_extractor() -> ContentExtractorInterface:
     """Get content extractor instance."""
+    if settings.extraction_mode == "tiered":
+        return TieredExtractor()
     return PlaywrightExtractor()
 
 
+@lru_cache
 def get_analyzer() -> ContentAnalyzerInterface:
     """Get content analyzer instance."""
     return OpenAIAnalyzer()
 
 
+@lru_cache
 def get_repository() -> ContentRepositoryInterface:
     """Get content repository instance."""
-    return ChromaRepository() 
\ No newline at end of file
+    return ChromaRepository()
+
+
+@lru_cache
+def get_job_workers() -> JobWorkers:
+    """Get the job worker pool."""
+    return JobWorkers(get_extractor(), get_analyzer(), get_repository())
+
+
+SERVICE_FACTORIES = (get_extractor, get_analyzer, get_repository, get_job_workers)
+
+
+def init_services() -> None:
+    """Create the shared service instances."""
+    for factory in SERVICE_FACTORIES:
+        factory()
+
+
+async def shutdown_services() -> None:
+    """Close the shared service instances and drop them from the cache.
+    
+    Services are closed in reverse order, so none outlives its dependencies,
+    followed by the HTTP client and browser pool they share.
+    """
+    try:
+        for factory in reversed(SERVICE_FACTORIES):
+            if factory.cache_info().currsize:
+                await factory().close()
+                factory.cache_clear()
+    finally:
+        await close_shared_clients()
+
+
+async def close_shared_clients() -> None:
+    """Close the process-wide HTTP client and browser pool, if created, and drop them."""
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
+    if get_browser_pool.cache_info().currsize:
+        await get_browser_pool().stop()
+        get_browser_pool.cache_clear()
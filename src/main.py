@@ -1,17 +1,37 @@
 """Main application module."""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
 from src.core.config import get_settings
+from src.core.factory import init_services, shutdown_services, get_job_workers
 from src.api.routes import content, search
 from src.web.routes import router as web_router
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start shared resources on startup and release them on shutdown.
+    
+    The browser pool starts on first use, so deployments that never render
+    a page do not need Chromium. Whatever was created is released even if
+    startup fails.
+    """
+    try:
+        init_services()
+        get_job_workers().start()
+        yield
+    finally:
+        await shutdown_services()
+
+
 app = FastAPI(
     title=settings.api_title,
     description=settings.api_description,
-    version=settings.api_version
+    version=settings.api_version,
+    lifespan=lifespan
 )
 
 # Mount static files
@@ -66,3 +66,17 @@ class ContentAnalysis(BaseModel):
         description="Content author if available"
     )
 
+class ContentAnalysisSchema(BaseModel):
+    """Response schema of structured-output analysis.
+    
+    OpenAI's strict JSON schema mode requires every field and rejects
+    ``default`` and ``minItems``, so this mirrors ContentAnalysis without them.
+    """
+    
+    title: str = Field(description="Title of the content")
+    summary: str = Field(description="A concise summary (2-3 sentences)")
+    topics: List[str] = Field(description="Main topics discussed (3-5 topics)")
+    sentiment: str = Field(description="Overall sentiment (positive/negative/neutral)")
+    keywords: List[str] = Field(description="Key terms and phrases (3-5 terms)")
+    reading_time: int = Field(description="Estimated reading time in minutes")
+    author: str = Field(description="Content author if available, else empty")
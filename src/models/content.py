@@ -1,7 +1,17 @@
 """Content models for the application."""
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
-from pydantic import BaseModel, ConfigDict, field_validator, Field
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator, Field
+
+# Topics kept in chunk metadata for filtering, as topic_0 .. topic_N-1
+MAX_FILTER_TOPICS = 5
+
+
+def to_timestamp(value: datetime) -> int:
+    """Convert a datetime to Unix seconds, reading naive values as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
 
 
 class Content(BaseModel):
@@ -71,6 +81,96 @@ class Content(BaseModel):
             "topics": ",".join(str(t) for t in self.topics)
         }
 
+    def to_filter_metadata(self) -> dict:
+        """Convert content to the compact ChromaDB metadata used for filtering.
+        
+        ``published_at`` is a Unix timestamp so range filters run inside the
+        index; topics are lowercased into fixed ``topic_<i>`` slots.
+        """
+        metadata = {
+            "source": str(self.source),
+            "language": str(self.language),
+            "sentiment": str(self.sentiment),
+            "published_at": to_timestamp(self.published_at)
+        }
+        for i, topic in enumerate(self.topics[:MAX_FILTER_TOPICS]):
+            metadata[f"topic_{i}"] = topic.strip().lower()
+        return metadata
+
+
+class SearchFilters(BaseModel):
+    """Structured search filters, pushed down into ChromaDB where clauses.
+    
+    List filters match any of their values; all given filters must match.
+    """
+    
+    source: List[str] = Field(default_factory=list)
+    sentiment: List[str] = Field(default_factory=list)
+    language: List[str] = Field(default_factory=list)
+    topics: List[str] = Field(default_factory=list)
+    published_after: Optional[datetime] = None
+    published_before: Optional[datetime] = None
+    
+    @model_validator(mode="after")
+    def check_date_range(self) -> "SearchFilters":
+        """Validate that the date range is not empty."""
+        if (self.published_after and self.published_before
+                and to_timestamp(self.published_after) > to_timestamp(self.published_before)):
+            raise ValueError("published_after must not be later than published_before")
+        return self
+    
+    def is_empty(self) -> bool:
+        """Whether no filter is set."""
+        return self.to_where() is None
+    
+    def to_where(self) -> Optional[dict]:
+        """Build the ChromaDB where clause, or None without filters."""
+        conditions = []
+        for field in ("source", "sentiment", "language"):
+            values = getattr(self, field)
+            if values:
+                conditions.append({field: {"$in": values}})
+        if self.topics:
+            topics = [topic.strip().lower() for topic in self.topics]
+            conditions.append({"$or": [
+                {f"topic_{i}": {"$in": topics}} for i in range(MAX_FILTER_TOPICS)
+            ]})
+        if self.published_after:
+            conditions.append({"published_at": {"$gte": to_timestamp(self.published_after)}})
+        if self.published_before:
+            conditions.append({"published_at": {"$lte": to_timestamp(self.published_before)}})
+        
+        if not conditions:
+            return None
+        return conditions[0] if len(conditions) == 1 else {"$and": conditions}
+    
+    def matches(self, content: Content) -> bool:
+        """Check an article against the filters outside of ChromaDB."""
+        metadata = content.to_filter_metadata()
+        topics = {metadata[key] for key in metadata if key.startswith("topic_")}
+        return (
+            (not self.source or content.source in self.source)
+            and (not self.sentiment or content.sentiment in self.sentiment)
+            and (not self.language or content.language in self.language)
+            and (not self.topics or bool(topics & {t.strip().lower() for t in self.topics}))
+            and (not self.published_after or metadata["published_at"] >= to_timestamp(self.published_after))
+            and (not self.published_before or metadata["published_at"] <= to_timestamp(self.published_before))
+        )
+
+
+class SearchResult(Content):
+    """Model for an article returned by search, with its relevance."""
+    
+    score: float = 0.0
+    snippet: str = ""
+
+
+class FacetCount(BaseModel):
+    """Model for the number of articles sharing a facet value."""
+    
+    value: str
+    count: int
+
 
 class SearchQuery(BaseModel):
     """Model for enhanced search query with semantic expansion."""
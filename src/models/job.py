@@ -0,0 +1,52 @@
+"""Ingestion job models."""
+from datetime import datetime
+from typing import List, Literal, Optional
+from pydantic import BaseModel
+
+from src.models.content import Content
+
+ItemStatus = Literal["pending", "running", "done", "failed"]
+JobStatus = Literal["pending", "running", "completed"]
+
+
+class JobItem(BaseModel):
+    """Status and result of one URL of a job."""
+    
+    url: str
+    status: ItemStatus = "pending"
+    content: Optional[Content] = None
+    error: Optional[str] = None
+
+
+class Job(BaseModel):
+    """Queued processing of one or more URLs."""
+    
+    id: str
+    created_at: datetime
+    updated_at: datetime
+    items: List[JobItem]
+    
+    @property
+    def status(self) -> JobStatus:
+        """Overall status derived from the item statuses."""
+        statuses = {item.status for item in self.items}
+        if statuses <= {"done", "failed"}:
+            return "completed"
+        if statuses == {"pending"}:
+            return "pending"
+        return "running"
+
+
+class JobResponse(BaseModel):
+    """Job as returned by the API."""
+    
+    id: str
+    status: JobStatus
+    created_at: datetime
+    updated_at: datetime
+    items: List[JobItem]
+    
+    @classmethod
+    def from_job(cls, job: Job) -> "JobResponse":
+        """Build the response for a job."""
+        return cls(**job.model_dump(), status=job.status)
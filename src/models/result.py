@@ -0,0 +1,18 @@
+"""Per-item processing result models."""
+from typing import Optional
+from pydantic import BaseModel
+
+from src.models.content import Content
+
+
+class ProcessingResult(BaseModel):
+    """Outcome of processing a single URL in a batch."""
+    
+    url: str
+    content: Optional[Content] = None
+    error: Optional[str] = None
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the item was processed successfully."""
+        return self.error is None
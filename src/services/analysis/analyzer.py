@@ -1,39 +1,94 @@
 """Content analysis service."""
-from typing import List
+import asyncio
+import json
+from typing import List, Optional
+from loguru import logger
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_core.runnables import RunnablePassthrough
 from langchain.output_parsers import PydanticOutputParser
+from pydantic import BaseModel
 
 from src.models.content import Content
-from src.models.analyze import ContentAnalysis
+from src.models.analyze import ContentAnalysis, ContentAnalysisSchema
+from src.models.result import ProcessingResult
 from src.core.exceptions import ContentAnalysisError
 from src.core.config import get_settings
 from src.services.analysis.interface import ContentAnalyzerInterface
+from src.services.analysis.rate_limit import RateLimiter, with_retries
+from src.services.analysis.cache import AnalysisCache
+from src.services.analysis.repair import repair_json
+from src.services.chunking.chunker import get_chunker
 
 settings = get_settings()
 
+# Prompt, format instructions and expected completion, in tokens
+ANALYSIS_TOKEN_OVERHEAD = 800
+
+# Expected completion per extra article of a packed request, in tokens
+PACKED_ITEM_OVERHEAD = 250
+
+# Bump whenever the analysis prompt changes so cached results are not reused
+PROMPT_VERSION = "1"
+REDUCE_PROMPT_VERSION = "reduce-1"
+
 
 class OpenAIAnalyzer(ContentAnalyzerInterface):
     """Service for analyzing content using OpenAI models."""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[AnalysisCache] = None):
         """Initialize the OpenAIAnalyzer."""
         self.llm = ChatOpenAI(
             model_name=settings.openai_model,
             temperature=settings.openai_temperature,
-            api_key=settings.openai_api_key
+            api_key=settings.openai_api_key,
+            # Retries are scheduled by with_retries under the shared rate limiter
+            max_retries=0
         )
-        
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=settings.chunk_size,
-            chunk_overlap=settings.chunk_overlap,
-            separators=["\n\n", "\n", " ", ""]
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=settings.openai_requests_per_minute,
+            tokens_per_minute=settings.openai_tokens_per_minute
         )
         
+        # Shared with the repository, which reuses the same splits
+        self.chunker = get_chunker()
+        self.map_chunker = get_chunker(settings.analysis_map_chunk_tokens)
+        
         self.parser = PydanticOutputParser(pydantic_object=ContentAnalysis)
+        self.format_instructions = self.parser.get_format_instructions()
         self.analysis_chain = self._create_analysis_chain()
+        self.reduce_chain = self._create_reduce_chain()
+        self.packed_chain = self._create_packed_chain()
+        
+        if cache is None and settings.analysis_cache_enabled:
+            cache = AnalysisCache()
+        self.cache = cache
+
+    async def close(self) -> None:
+        """Close the OpenAI HTTP clients and the analysis cache."""
+        if self.cache is not None:
+            self.cache.close()
+        if getattr(self.llm, "root_async_client", None):
+            await self.llm.root_async_client.close()
+        if getattr(self.llm, "root_client", None):
+            self.llm.root_client.close()
+
+    def _create_chain(self, template: str, structured: bool = None):
+        """Create a chain from a prompt template taking ``text``.
+        
+        The format instructions are rendered into the prompt once. In
+        structured mode the model is held to the strict
+        ContentAnalysisSchema instead, and the instructions are left out.
+        """
+        structured = settings.analysis_output_mode == "structured" if structured is None else structured
+        prompt = ChatPromptTemplate.from_template(template).partial(
+            format_instructions="" if structured else self.format_instructions
+        )
+        llm = (
+            self.llm.with_structured_output(ContentAnalysisSchema, method="json_schema", include_raw=True)
+            if structured else self.llm
+        )
+        return {"text": RunnablePassthrough()} | prompt | llm
 
     def _create_analysis_chain(self):
         """Create the analysis chain."""
@@ -51,56 +106,357 @@ class OpenAIAnalyzer(ContentAnalyzerInterface):
             {text}
         """
 
-        prompt = ChatPromptTemplate.from_template(template)
+        return self._create_chain(template)
+
+    def _create_reduce_chain(self):
+        """Create the chain merging analyses of an article's sections."""
+        template = """The following are analyses of consecutive sections of one article.
+            Combine them into a single analysis of the whole article:
+            1. A concise summary of the article as a whole
+            2. Its main topics, most important first
+            3. Its overall sentiment
+            4. Author name if mentioned
+            5. Its key terms and phrases
+
+            {format_instructions}
+
+            Section analyses:
+            {text}
+        """
+
+        return self._create_chain(template)
+
+    def _create_packed_chain(self):
+        """Create the chain analyzing several short articles in one request."""
+        template = """Analyze each of the following articles separately and extract key information.
+            For every article provide:
+            1. A concise summary capturing the main points
+            2. Main topics discussed
+            3. Overall sentiment
+            4. Author name if mentioned
+            5. Key terms and phrases
+
+            Respond with a JSON array holding one analysis per article, in the
+            order the articles are given. Each analysis is formatted as follows,
+            with an extra "article" field holding the article's number.
+
+            {format_instructions}
+
+            Articles:
+            {text}
+        """
+
+        # Always parsed from text, as the response is an array of analyses
+        return self._create_chain(template, structured=False)
+
+    def _estimate_tokens(self, text: str) -> int:
+        """Estimate the tokens a call on ``text`` consumes."""
+        return self.chunker.count_tokens(text) + ANALYSIS_TOKEN_OVERHEAD
+
+    async def _invoke(self, text: str, chain=None, extra_tokens: int = 0):
+        """Run the analysis chain under the rate limiter, with retries."""
+        chain = chain or self.analysis_chain
+        
+        async def call():
+            await self.rate_limiter.acquire(self._estimate_tokens(text) + extra_tokens)
+            return await chain.ainvoke(text)
         
-        return (
-            {"text": RunnablePassthrough(), "format_instructions": lambda _: self.parser.get_format_instructions()}
-            | prompt 
-            | self.llm
+        return await with_retries(
+            call,
+            max_retries=settings.openai_max_retries,
+            base_delay=settings.openai_retry_base_delay,
+            max_delay=settings.openai_retry_max_delay
         )
 
+    def _parse_text(self, text: str) -> ContentAnalysis:
+        """Parse an analysis, repairing near-valid JSON locally first.
+        
+        The output parser's lenient fallback can silently drop fields of
+        malformed JSON, so it only runs when the repair fails.
+        """
+        try:
+            return ContentAnalysis.model_validate_json(repair_json(text))
+        except ValueError:
+            return self.parser.parse(text)
+
+    def _parse_result(self, result) -> ContentAnalysis:
+        """Get the analysis from a chain result.
+        
+        Structured chains return the parsed analysis along with the raw
+        message, whose text is repaired locally if the schema parse failed
+        or its payload does not validate.
+        """
+        if isinstance(result, dict):
+            parsed = result.get("parsed")
+            if parsed is not None:
+                try:
+                    return ContentAnalysis.model_validate(
+                        parsed.model_dump() if isinstance(parsed, BaseModel) else parsed
+                    )
+                except ValueError as e:
+                    logger.warning(f"Structured analysis did not validate, repairing raw output: {str(e)}")
+            result = result.get("raw")
+        if not result or not result.content:
+            raise ContentAnalysisError("Analysis produced no results")
+        return self._parse_text(result.content)
+
+    async def _analyze_text(self, text: str, chain=None, prompt_version: str = PROMPT_VERSION) -> ContentAnalysis:
+        """Analyze a chunk of text, reusing cached analyses when available."""
+        key = None
+        if self.cache is not None:
+            key = AnalysisCache.make_key(text, settings.openai_model, settings.openai_temperature, prompt_version)
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                return cached
+        
+        result = await self._invoke(text, chain)
+        analysis = self._parse_result(result)
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.set, key, analysis)
+        return analysis
+
+    def _within_budget(self, sections: List[str]) -> List[str]:
+        """Pick evenly spaced sections whose map calls fit the token budget."""
+        per_section = sum(self._estimate_tokens(section) for section in sections) / len(sections)
+        count = max(1, int(settings.analysis_map_token_budget // per_section))
+        if count >= len(sections):
+            return sections
+        if count == 1:
+            return sections[:1]
+        step = (len(sections) - 1) / (count - 1)
+        return [sections[round(i * step)] for i in range(count)]
+
+    async def _map_reduce(self, text: str) -> ContentAnalysis:
+        """Analyze sections of the text concurrently and merge the results.
+        
+        Sections beyond the token budget are skipped evenly across the text,
+        so the analysis still covers the whole article.
+        """
+        sections = self.map_chunker.split(text)
+        if len(sections) == 1:
+            return await self._analyze_text(sections[0])
+        selected = self._within_budget(sections)
+        
+        limit = asyncio.Semaphore(settings.analysis_map_concurrency)
+        
+        async def analyze_section(section: str) -> ContentAnalysis:
+            async with limit:
+                return await self._analyze_text(section)
+        
+        partials = await asyncio.gather(*(analyze_section(section) for section in selected))
+        
+        merged = await self._analyze_text(
+            json.dumps([partial.model_dump(exclude={"reading_time"}) for partial in partials], indent=1),
+            chain=self.reduce_chain,
+            prompt_version=REDUCE_PROMPT_VERSION
+        )
+        # Reading time adds up over the sections, scaled up for skipped ones
+        reading_time = sum(partial.reading_time for partial in partials) * len(sections) / len(selected)
+        return merged.model_copy(update={
+            "reading_time": round(reading_time),
+            "author": merged.author or next((partial.author for partial in partials if partial.author), "")
+        })
+
     async def analyze_content(self, content: Content) -> Content:
-        """Analyze content using LLM."""
+        """Analyze content using LLM.
+        
+        How much of the text is analyzed depends on ANALYSIS_MODE: only the
+        first chunk, all of it with map-reduce, or adaptively all of it in
+        one call up to ANALYSIS_MAP_REDUCE_THRESHOLD tokens and with
+        map-reduce above.
+        """
         try:
-            # Split and take first chunk (most important content)
-            chunks = self.text_splitter.split_text(content.content)
+            chunks = self.chunker.split(content.content)
             if not chunks:
                 raise ContentAnalysisError("No content to analyze")
             
-            main_chunk = chunks[0]
-            
             # Run analysis and parse result
-            result = await self.analysis_chain.ainvoke(main_chunk)
-            if not result or not result.content:
-                raise ContentAnalysisError("Analysis produced no results")
+            if settings.analysis_mode == "first_chunk":
+                analysis = await self._analyze_text(chunks[0])
+            elif (settings.analysis_mode == "adaptive"
+                  and self.chunker.count_tokens(content.content) <= settings.analysis_map_reduce_threshold):
+                analysis = await self._analyze_text(content.content)
+            else:
+                analysis = await self._map_reduce(content.content)
             
-            analysis = self.parser.parse(result.content)
-            
-            # Update content with analysis results
-            content.summary = analysis.summary
-            content.topics = analysis.topics
-            content.sentiment = analysis.sentiment
-            content.keywords = analysis.keywords
-            content.reading_time = analysis.reading_time
-            if analysis.author:
-                content.author = analysis.author
-            
-            return content
+            return self._apply_analysis(content, analysis)
             
         except Exception as e:
             raise ContentAnalysisError(f"Content analysis failed: {str(e)}")
 
+    @staticmethod
+    def _apply_analysis(content: Content, analysis: ContentAnalysis) -> Content:
+        """Update content with analysis results."""
+        content.summary = analysis.summary
+        content.topics = analysis.topics
+        content.sentiment = analysis.sentiment
+        content.keywords = analysis.keywords
+        content.reading_time = analysis.reading_time
+        if analysis.author:
+            content.author = analysis.author
+        return content
+
+    def _pack(self, contents: List[Content]) -> List[List[int]]:
+        """Group short contents into packs that fit the packing token budget.
+        
+        Returns:
+            List of packs, each a list of indices into ``contents``. Long
+            contents are left out.
+        """
+        packs, pack, pack_tokens = [], [], 0
+        for index, content in enumerate(contents):
+            tokens = self.chunker.count_tokens(content.content)
+            if tokens > settings.analysis_packing_item_tokens:
+                continue
+            if pack and (pack_tokens + tokens > settings.analysis_packing_max_tokens
+                         or len(pack) >= settings.analysis_packing_max_items):
+                packs.append(pack)
+                pack, pack_tokens = [], 0
+            pack.append(index)
+            pack_tokens += tokens
+        if pack:
+            packs.append(pack)
+        return packs
+
+    @staticmethod
+    def _parse_packed(text: str, count: int) -> List[Optional[ContentAnalysis]]:
+        """Parse a JSON array of numbered analyses, with None for unusable entries.
+        
+        Analyses are matched to articles by their "article" number. An array
+        that does not number each of the ``count`` articles exactly once is
+        rejected as a whole, as its analyses cannot be attributed reliably.
+        """
+        try:
+            items = json.loads(repair_json(text))
+        except json.JSONDecodeError:
+            return [None] * count
+        if not isinstance(items, list) or len(items) != count:
+            return [None] * count
+        
+        numbered = {}
+        for item in items:
+            number = item.get("article") if isinstance(item, dict) else None
+            if not isinstance(number, int) or not 1 <= number <= count or number in numbered:
+                return [None] * count
+            numbered[number] = item
+        
+        analyses = []
+        for number in range(1, count + 1):
+            try:
+                analyses.append(ContentAnalysis.model_validate(numbered[number]))
+            except ValueError:
+                analyses.append(None)
+        return analyses
+
+    async def _analyze_pack(self, contents: List[Content]) -> List[Optional[ContentAnalysis]]:
+        """Analyze several short contents with one request.
+        
+        Returns:
+            One analysis per content, or None where the response could not
+            be used and the content needs a request of its own.
+        """
+        analyses: List[Optional[ContentAnalysis]] = [None] * len(contents)
+        keys = [None] * len(contents)
+        if self.cache is not None:
+            for index, content in enumerate(contents):
+                keys[index] = AnalysisCache.make_key(
+                    content.content, settings.openai_model, settings.openai_temperature, PROMPT_VERSION
+                )
+                analyses[index] = await asyncio.to_thread(self.cache.get, keys[index])
+        
+        missing = [index for index, analysis in enumerate(analyses) if analysis is None]
+        if len(missing) < 2:
+            return analyses
+        
+        text = "\n\n".join(
+            f"=== Article {number} ===\n{contents[index].content}"
+            for number, index in enumerate(missing, start=1)
+        )
+        try:
+            result = await self._invoke(
+                text, self.packed_chain, extra_tokens=PACKED_ITEM_OVERHEAD * (len(missing) - 1)
+            )
+            parsed = self._parse_packed(result.content, len(missing)) if result and result.content else []
+        except Exception as e:
+            logger.warning(f"Packed analysis of {len(missing)} items failed: {str(e)}")
+            return analyses
+        
+        for index, analysis in zip(missing, parsed):
+            if analysis is not None:
+                analyses[index] = analysis
+                if self.cache is not None:
+                    await asyncio.to_thread(self.cache.set, keys[index], analysis)
+        return analyses
+
+    async def _analyze_concurrently(self, contents: List[Content], concurrency: int = None) -> list:
+        """Analyze contents concurrently, returning a result or exception per item.
+        
+        With packing enabled, short contents are analyzed several per request;
+        contents a packed response does not cover are analyzed on their own.
+        """
+        limit = asyncio.Semaphore(concurrency or settings.analysis_concurrency)
+        
+        async def analyze_one(content: Content) -> Content:
+            async with limit:
+                return await self.analyze_content(content)
+        
+        if not settings.analysis_packing_enabled:
+            return await asyncio.gather(
+                *(analyze_one(content) for content in contents),
+                return_exceptions=True
+            )
+        
+        results = [None] * len(contents)
+        
+        async def analyze_packed(indices: List[int]) -> None:
+            async with limit:
+                analyses = await self._analyze_pack([contents[index] for index in indices])
+            for index, analysis in zip(indices, analyses):
+                if analysis is not None:
+                    results[index] = self._apply_analysis(contents[index], analysis)
+        
+        packs = [pack for pack in self._pack(contents) if len(pack) > 1]
+        await asyncio.gather(*(analyze_packed(pack) for pack in packs))
+        
+        remaining = [index for index, result in enumerate(results) if result is None]
+        singles = await asyncio.gather(
+            *(analyze_one(contents[index]) for index in remaining),
+            return_exceptions=True
+        )
+        for index, result in zip(remaining, singles):
+            results[index] = result
+        return results
+
+    async def analyze_batch(self, contents: List[Content], concurrency: int = None) -> List[ProcessingResult]:
+        """Analyze multiple content items concurrently.
+        
+        Args:
+            contents: List of content items to analyze.
+            concurrency: Maximum number of analyses in flight.
+            
+        Returns:
+            List[ProcessingResult]: One result per item, in input order. Failed
+            items carry an error message instead of content.
+        """
+        results = await self._analyze_concurrently(contents, concurrency)
+        return [
+            ProcessingResult(url=content.url, error=str(result))
+            if isinstance(result, Exception)
+            else ProcessingResult(url=content.url, content=result)
+            for content, result in zip(contents, results)
+        ]
+
     async def analyze_multiple(self, contents: List[Content]) -> List[Content]:
         """Analyze multiple content items."""
         analyzed_contents = []
-        for content in contents:
-            try:
-                analyzed = await self.analyze_content(content)
-                analyzed_contents.append(analyzed)
-            except ContentAnalysisError as e:
+        results = await self._analyze_concurrently(contents)
+        for content, result in zip(contents, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Analysis of {content.url} failed: {result}")
                 continue
+            analyzed_contents.append(result)
         
         if not analyzed_contents:
             raise ContentAnalysisError("Failed to analyze any content")
         
-        return analyzed_contents 
\ No newline at end of file
+        return analyzed_contents
@@ -0,0 +1,121 @@
+"""Persistent cache of LLM analysis results."""
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Optional
+
+from src.models.analyze import ContentAnalysis
+from src.core.config import get_settings
+
+settings = get_settings()
+
+WHITESPACE = re.compile(r"\s+")
+
+
+class AnalysisCache:
+    """SQLite-backed cache of parsed analyses keyed by content hash.
+
+    Entries expire after ``ttl`` seconds, and the least recently used
+    entries are evicted once the cache holds more than ``max_entries``.
+    """
+
+    def __init__(self, path: str = None, ttl: int = None, max_entries: int = None):
+        """Initialize the AnalysisCache."""
+        self.path = path or settings.analysis_cache_path
+        self.ttl = ttl or settings.analysis_cache_ttl
+        self.max_entries = max_entries or settings.analysis_cache_max_entries
+        self.hits = 0
+        self.misses = 0
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS analysis_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS analysis_cache_accessed ON analysis_cache (accessed_at)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(text: str, model: str, temperature: float, prompt_version: str) -> str:
+        """Build a cache key from normalized text and the analysis parameters.
+
+        Whitespace and Unicode normalization let syndicated copies of an
+        article that differ only in formatting share one entry.
+        """
+        normalized = WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+        digest = hashlib.sha256()
+        for part in (model, repr(float(temperature)), prompt_version, normalized):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[ContentAnalysis]:
+        """Get a cached analysis, or None on a miss or an expired entry."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM analysis_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl:
+                if row is not None:
+                    self._conn.execute("DELETE FROM analysis_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE analysis_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return ContentAnalysis.model_validate_json(row[0])
+
+    def set(self, key: str, analysis: ContentAnalysis) -> None:
+        """Store an analysis, evicting least recently used entries if full."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, analysis.model_dump_json(), now, now)
+            )
+            overflow = self._size() - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    """DELETE FROM analysis_cache WHERE key IN (
+                        SELECT key FROM analysis_cache ORDER BY accessed_at LIMIT ?
+                    )""",
+                    (overflow,)
+                )
+            self._conn.commit()
+
+    def _size(self) -> int:
+        """Count the cached entries."""
+        return self._conn.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0]
+
+    def stats(self) -> dict:
+        """Get hit/miss counters and the number of cached entries."""
+        with self._lock:
+            size = self._size()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": size
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,102 @@
+"""Client-side rate limiting and retries for LLM calls."""
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, TypeVar
+import openai
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate."""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """Initialize the TokenBucket.
+
+        Args:
+            capacity: Maximum number of tokens the bucket holds.
+            refill_rate: Tokens added per second.
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+    @property
+    def unlimited(self) -> bool:
+        """Whether the bucket was configured without a limit (capacity or rate <= 0)."""
+        return self.capacity <= 0 or self.refill_rate <= 0
+
+    async def acquire(self, amount: float = 1) -> None:
+        """Wait until ``amount`` tokens are available and take them.
+
+        Waiters sleep without holding the lock and check again on waking,
+        so they wait concurrently. Requests larger than the bucket are
+        capped at its capacity so they cannot wait forever.
+        """
+        if self.unlimited:
+            return
+        amount = min(amount, self.capacity)
+        while True:
+            async with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                wait = (amount - self._tokens) / self.refill_rate
+            await asyncio.sleep(wait)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute limits for an API.
+
+    A limit of zero or less means no limit.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """Initialize the RateLimiter."""
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60)
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60)
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait for one request slot and ``tokens`` tokens."""
+        await self.requests.acquire(1)
+        await self.tokens.acquire(tokens)
+
+
+def is_retryable(error: Exception) -> bool:
+    """Check whether an API error is worth retrying (429, 5xx, network)."""
+    if isinstance(error, (openai.APIConnectionError, openai.APITimeoutError)):
+        return True
+    status = getattr(error, "status_code", None)
+    return status == 429 or (status is not None and status >= 500)
+
+
+async def with_retries(
+    call: Callable[[], Awaitable[T]],
+    max_retries: int,
+    base_delay: float,
+    max_delay: float
+) -> T:
+    """Run ``call``, retrying retryable errors with exponential backoff.
+
+    Delays use full jitter: a random wait between zero and
+    ``min(max_delay, base_delay * 2 ** attempt)`` seconds.
+    """
+    attempt = 0
+    while True:
+        try:
+            return await call()
+        except Exception as e:
+            if attempt >= max_retries or not is_retryable(e):
+                raise
+            await asyncio.sleep(random.uniform(0, min(max_delay, base_delay * 2 ** attempt)))
+            attempt += 1
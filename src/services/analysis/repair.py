@@ -0,0 +1,59 @@
+"""Local repair of near-valid JSON model output."""
+import re
+
+FENCE = re.compile(r"^```[a-zA-Z]*\s*|\s*```$")
+TRAILING_COMMA = re.compile(r",\s*([}\]])")
+LITERALS = {"True": "true", "False": "false", "None": "null"}
+SMART_QUOTES = str.maketrans({"“": '"', "”": '"'})
+
+
+def _close_brackets(text: str) -> str:
+    """Close strings and brackets left open by a truncated response."""
+    stack, in_string, escaped = [], False, False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]" and stack:
+            stack.pop()
+    
+    if in_string:
+        text += '"'
+    text = TRAILING_COMMA.sub(r"\1", text.rstrip().rstrip(",") + "".join(reversed(stack)))
+    return text
+
+
+def _replace_literals(text: str) -> str:
+    """Replace Python literals outside of strings with their JSON spelling."""
+    parts = re.split(r'("(?:[^"\\]|\\.)*")', text)
+    for i in range(0, len(parts), 2):
+        parts[i] = re.sub(r"\b(True|False|None)\b", lambda m: LITERALS[m.group(1)], parts[i])
+    return "".join(parts)
+
+
+def repair_json(text: str) -> str:
+    """Fix the usual defects of JSON written by a language model.
+    
+    Removes Markdown code fences and text around the JSON value, trailing
+    commas and Python literals, replaces typographic quotes, and closes
+    strings and brackets of truncated output. The result is not
+    guaranteed to be valid; it is meant for a second parse attempt.
+    """
+    text = FENCE.sub("", text.strip().translate(SMART_QUOTES))
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    if not starts:
+        return text
+    text = text[min(starts):]
+    end = max(text.rfind("}"), text.rfind("]"))
+    # Drop trailing prose, unless the value was cut off before its end
+    if end >= 0 and _close_brackets(text[:end + 1]) == text[:end + 1]:
+        text = text[:end + 1]
+    return _close_brackets(_replace_literals(TRAILING_COMMA.sub(r"\1", text)))
@@ -0,0 +1,95 @@
+"""Token-aware text chunking shared by the analyzer and the repository."""
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Optional, Union
+
+import tiktoken
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from loguru import logger
+
+from src.core.config import get_settings
+
+settings = get_settings()
+
+SEPARATORS = ["\n\n", "\n", ". ", " ", ""]
+
+
+@lru_cache
+def load_encoding(name: str) -> Optional[tiktoken.Encoding]:
+    """Load a tiktoken encoding, or None if it cannot be loaded.
+    
+    tiktoken downloads encodings on first use; without network access
+    token counts fall back to an estimate of four characters per token.
+    """
+    try:
+        return tiktoken.get_encoding(name)
+    except Exception as e:
+        logger.warning(f"Tokenizer {name} unavailable, estimating token counts: {str(e)}")
+        return None
+
+
+class TextChunker:
+    """Recursive text splitter measuring chunk sizes in model tokens.
+
+    Splits prefer paragraph, line and sentence boundaries, and chunks are
+    filled up to ``chunk_tokens``. Results are memoized per content hash,
+    so services sharing a chunker split each text only once.
+    """
+
+    def __init__(
+        self,
+        chunk_tokens: int = None,
+        overlap_tokens: int = None,
+        encoding: Union[str, tiktoken.Encoding, None] = None,
+        cache_size: int = None
+    ):
+        """Initialize the TextChunker."""
+        self.chunk_tokens = chunk_tokens or settings.chunk_tokens
+        self.overlap_tokens = settings.chunk_overlap_tokens if overlap_tokens is None else overlap_tokens
+        if not isinstance(encoding, tiktoken.Encoding):
+            encoding = load_encoding(encoding or settings.chunk_encoding)
+        self.encoding = encoding
+        self.cache_size = cache_size or settings.chunk_cache_size
+        self.hits = 0
+        self.misses = 0
+        
+        self._splitter = RecursiveCharacterTextSplitter(
+            chunk_size=self.chunk_tokens,
+            chunk_overlap=self.overlap_tokens,
+            length_function=self.count_tokens,
+            separators=SEPARATORS
+        )
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[bytes, tuple]" = OrderedDict()
+
+    def count_tokens(self, text: str) -> int:
+        """Count the tokens of a text."""
+        if self.encoding is None:
+            return (len(text) + 3) // 4
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+    def split(self, text: str) -> List[str]:
+        """Split a text into chunks, reusing the result of an earlier split."""
+        key = hashlib.sha256(text.encode("utf-8")).digest()
+        with self._lock:
+            chunks = self._cache.get(key)
+            if chunks is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return list(chunks)
+        
+        chunks = tuple(self._splitter.split_text(text))
+        with self._lock:
+            self.misses += 1
+            self._cache[key] = chunks
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return list(chunks)
+
+
+@lru_cache
+def get_chunker(chunk_tokens: int = None) -> TextChunker:
+    """Get the process-wide chunker for a chunk size (default CHUNK_TOKENS)."""
+    return TextChunker(chunk_tokens)
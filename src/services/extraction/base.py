@@ -0,0 +1,105 @@
+"""Shared behaviour for content extractors."""
+import asyncio
+from datetime import datetime
+from typing import List, Optional
+from urllib.parse import urlparse
+from loguru import logger
+
+from src.models.content import Content
+from src.models.result import ProcessingResult
+from src.core.exceptions import ContentExtractionError
+from src.core.config import get_settings
+from src.services.extraction.interface import ContentExtractorInterface
+from src.services.extraction.politeness import HostThrottle
+
+settings = get_settings()
+
+
+class BaseExtractor(ContentExtractorInterface):
+    """Base extractor providing concurrent batch extraction.
+
+    Subclasses implement ``extract_content``; batches run it concurrently
+    under global and per-host politeness limits.
+    """
+
+    def _extract_domain(self, url: str) -> str:
+        """Extract domain from URL."""
+        return urlparse(url).netloc
+
+    def _parse_published(self, value: str) -> Optional[datetime]:
+        """Parse a publish date from page metadata, if it is ISO 8601."""
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+
+    def _build_content(self, url: str, article: dict) -> Content:
+        """Create content from a readability result.
+
+        Args:
+            url: URL the article was extracted from.
+            article: Dict with ``title``, ``content``, ``byline`` and ``published``.
+        """
+        title = article.get("title")
+        text = article.get("content")
+        if not title or not text:
+            raise ContentExtractionError("Failed to extract content: Empty title or content")
+        
+        content = Content(
+            url=url,
+            title=title,
+            content=text,
+            source=self._extract_domain(url),
+            author=article.get("byline") or ""
+        )
+        published_at = self._parse_published(article.get("published"))
+        if published_at:
+            content.published_at = published_at
+        return content
+
+    async def extract_batch(
+        self,
+        urls: List[str],
+        concurrency: int = None,
+        per_host_concurrency: int = None,
+        host_delay: float = None
+    ) -> List[ProcessingResult]:
+        """Extract content from multiple URLs concurrently.
+        
+        Args:
+            urls: List of URLs to extract content from.
+            concurrency: Maximum number of pages loading at once.
+            per_host_concurrency: Maximum number of pages loading at once per host.
+            host_delay: Minimum number of seconds between page loads on one host.
+            
+        Returns:
+            List[ProcessingResult]: One result per URL, in input order. Failed
+            URLs carry an error message instead of content.
+        """
+        limit = asyncio.Semaphore(concurrency or settings.extraction_concurrency)
+        throttle = HostThrottle(
+            per_host_limit=per_host_concurrency or settings.extraction_per_host_concurrency,
+            min_delay=settings.extraction_host_delay if host_delay is None else host_delay
+        )
+        
+        async def extract_one(url: str) -> ProcessingResult:
+            # Take the host slot first so pacing waits don't hold a global slot
+            async with throttle.slot(self._extract_domain(url)):
+                async with limit:
+                    try:
+                        content = await self.extract_content(url)
+                    except Exception as e:
+                        return ProcessingResult(url=url, error=str(e))
+            return ProcessingResult(url=url, content=content)
+        
+        return list(await asyncio.gather(*(extract_one(url) for url in urls)))
+
+    async def extract_multiple(self, urls: List[str]) -> List[Content]:
+        """Extract content from multiple URLs."""
+        results = await self.extract_batch(urls)
+        for result in results:
+            if not result.ok:
+                logger.warning(f"Extraction of {result.url} failed: {result.error}")
+        return [result.content for result in results if result.ok]
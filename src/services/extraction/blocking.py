@@ -0,0 +1,59 @@
+"""Request interception policy for page loads."""
+from typing import Iterable
+from urllib.parse import urlparse
+from playwright.async_api import Route
+
+from src.core.config import get_settings
+
+settings = get_settings()
+
+
+def _split(value: str) -> list:
+    """Split a comma-separated setting into clean, lowercase items."""
+    return [item.strip().lower() for item in value.split(",") if item.strip()]
+
+
+class ResourceBlockPolicy:
+    """Abort requests we never read: heavy resource types and tracker domains."""
+
+    def __init__(self, resource_types: Iterable[str] = (), domains: Iterable[str] = ()):
+        """Initialize the ResourceBlockPolicy.
+
+        Args:
+            resource_types: Playwright resource types to block, e.g. ``image``.
+            domains: Domains to block, including all of their subdomains.
+        """
+        self.resource_types = frozenset(t.lower() for t in resource_types)
+        self.domains = tuple(d.lower().lstrip(".") for d in domains)
+
+    @classmethod
+    def from_settings(cls) -> "ResourceBlockPolicy":
+        """Create the policy configured in application settings."""
+        return cls(
+            resource_types=_split(settings.blocked_resource_types),
+            domains=_split(settings.blocked_domains)
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the policy blocks anything at all."""
+        return bool(self.resource_types or self.domains)
+
+    def _blocked_domain(self, url: str) -> bool:
+        """Check whether the URL's host is, or is under, a blocked domain."""
+        host = (urlparse(url).hostname or "").lower()
+        return any(host == domain or host.endswith("." + domain) for domain in self.domains)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """Decide whether a request should be aborted."""
+        if resource_type in self.resource_types:
+            return True
+        return bool(self.domains) and self._blocked_domain(url)
+
+    async def handle(self, route: Route) -> None:
+        """Route handler aborting blocked requests and continuing the rest."""
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            await route.abort()
+        else:
+            await route.continue_()
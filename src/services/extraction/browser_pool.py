@@ -0,0 +1,140 @@
+"""Shared Chromium browser pool."""
+import asyncio
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+
+from src.core.exceptions import ContentExtractionError
+from src.core.config import get_settings
+
+settings = get_settings()
+
+
+class _BrowserSlot:
+    """A pooled browser together with the number of pages it has served."""
+
+    def __init__(self):
+        self.browser: Optional[Browser] = None
+        self.pages_served = 0
+
+
+class BrowserPool:
+    """Process-wide pool of long-lived Chromium browsers.
+
+    Every caller gets its own isolated ``BrowserContext`` on one of the pooled
+    browsers, so per-URL extraction only pays for a new context and page.
+    Browsers are recycled after ``max_pages`` pages and relaunched
+    automatically when they crash or disconnect.
+    """
+
+    def __init__(self, size: int = None, max_pages: int = None, launch_options: dict = None):
+        """Initialize the BrowserPool."""
+        self.size = size or settings.browser_pool_size
+        self.max_pages = max_pages or settings.browser_max_pages
+        self.launch_options = launch_options or {}
+
+        self._playwright: Optional[Playwright] = None
+        self._slots: List[_BrowserSlot] = []
+        self._available: Optional[asyncio.Queue] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def started(self) -> bool:
+        """Whether the pool has been started."""
+        return self._playwright is not None
+
+    async def start(self) -> None:
+        """Start Playwright and launch the pooled browsers."""
+        async with self._lock:
+            if self.started:
+                return
+
+            self._playwright = await async_playwright().start()
+            self._slots = [_BrowserSlot() for _ in range(self.size)]
+            self._available = asyncio.Queue()
+            try:
+                await asyncio.gather(*(self._ensure_browser(slot) for slot in self._slots))
+            except Exception as e:
+                await self._shutdown()
+                raise ContentExtractionError(f"Browser pool startup failed: {str(e)}")
+
+            for slot in self._slots:
+                self._available.put_nowait(slot)
+
+    async def stop(self) -> None:
+        """Close all pooled browsers and stop Playwright."""
+        async with self._lock:
+            if self.started:
+                await self._shutdown()
+
+    async def _shutdown(self) -> None:
+        """Release every browser and the Playwright driver."""
+        for slot in self._slots:
+            await self._close_browser(slot)
+        self._slots = []
+        self._available = None
+
+        playwright, self._playwright = self._playwright, None
+        await playwright.stop()
+
+    async def _close_browser(self, slot: _BrowserSlot) -> None:
+        """Close the slot's browser, ignoring browsers that already died."""
+        browser, slot.browser = slot.browser, None
+        slot.pages_served = 0
+        if browser is None:
+            return
+        try:
+            await browser.close()
+        except Exception:
+            pass
+
+    async def _ensure_browser(self, slot: _BrowserSlot) -> Browser:
+        """Return a usable browser for the slot, relaunching it if needed.
+
+        A browser is replaced when it was never launched, has crashed or
+        disconnected, or has served ``max_pages`` pages.
+        """
+        browser = slot.browser
+        if browser is not None and browser.is_connected() and slot.pages_served < self.max_pages:
+            return browser
+
+        await self._close_browser(slot)
+        slot.browser = await self._playwright.chromium.launch(**self.launch_options)
+        return slot.browser
+
+    @asynccontextmanager
+    async def context(self, **options) -> AsyncIterator[BrowserContext]:
+        """Acquire an isolated browser context from the pool.
+
+        Args:
+            options: Keyword arguments forwarded to ``Browser.new_context``.
+
+        Yields:
+            BrowserContext: A fresh context that is closed on exit.
+        """
+        if not self.started:
+            await self.start()
+
+        available = self._available
+        slot = await available.get()
+        try:
+            browser = await self._ensure_browser(slot)
+            browser_context = await browser.new_context(**options)
+            try:
+                yield browser_context
+            finally:
+                slot.pages_served += 1
+                try:
+                    await browser_context.close()
+                except Exception:
+                    # The browser went away mid-page; it is relaunched on next use
+                    pass
+        finally:
+            available.put_nowait(slot)
+
+
+@lru_cache
+def get_browser_pool() -> BrowserPool:
+    """Get the process-wide browser pool."""
+    return BrowserPool()
@@ -1,70 +1,43 @@
 """Content extraction service."""
-from datetime import datetime
-from typing import List
-from urllib.parse import urlparse
-from playwright.async_api import async_playwright
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+from pathlib import Path
 
 from src.models.content import Content
 from src.core.exceptions import ContentExtractionError
 from src.core.config import get_settings
-from src.services.extraction.interface import ContentExtractorInterface
+from src.services.extraction.base import BaseExtractor
+from src.services.extraction.browser_pool import BrowserPool, get_browser_pool
+from src.services.extraction.blocking import ResourceBlockPolicy
 
 settings = get_settings()
 
+# Single-pass main content extractor evaluated in the page
+READABILITY_SCRIPT = (Path(__file__).parent / "readability.js").read_text(encoding="utf-8")
 
-class PlaywrightExtractor(ContentExtractorInterface):
+
+class PlaywrightExtractor(BaseExtractor):
     """Service for extracting content from web pages using Playwright."""
 
-    def __init__(self):
+    def __init__(self, browser_pool: BrowserPool = None, resource_policy: ResourceBlockPolicy = None):
         """Initialize the PlaywrightExtractor."""
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=settings.chunk_size,
-            chunk_overlap=settings.chunk_overlap,
-            separators=["\n\n", "\n", " ", ""]
-        )
-
-    def _extract_domain(self, url: str) -> str:
-        """Extract domain from URL."""
-        return urlparse(url).netloc
+        self.browser_pool = browser_pool or get_browser_pool()
+        self.resource_policy = resource_policy or ResourceBlockPolicy.from_settings()
 
     async def extract_content(self, url: str) -> Content:
         """Extract content from a URL."""
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch()
-                page = await browser.new_page()
-                await page.goto(url)
-                
-                # Extract title and content
-                title = await page.evaluate("document.title")
-                content = await page.evaluate("""
-                    Array.from(document.body.getElementsByTagName('*'))
-                        .map(el => el.textContent)
-                        .join('\\n')
-                """)
-                
-                await browser.close()
+            async with self.browser_pool.context() as context:
+                if self.resource_policy.enabled:
+                    await context.route("**/*", self.resource_policy.handle)
                 
-                if not title or not content:
-                    raise ContentExtractionError("Failed to extract content: Empty title or content")
-                
-                return Content(
-                    url=url,
-                    title=title,
-                    content=content,
-                    source=urlparse(url).netloc
+                page = await context.new_page()
+                await page.goto(
+                    url,
+                    wait_until=settings.page_wait_until,
+                    timeout=settings.page_timeout_ms
                 )
+                
+                # Extract main content, title, byline and publish date
+                article = await page.evaluate(READABILITY_SCRIPT)
+                return self._build_content(url, article)
         except Exception as e:
             raise ContentExtractionError(f"Failed to extract content: {str(e)}")
-
-    async def extract_multiple(self, urls: List[str]) -> List[Content]:
-        """Extract content from multiple URLs."""
-        contents = []
-        for url in urls:
-            try:
-                content = await self.extract_content(url)
-                contents.append(content)
-            except Exception as e:
-                pass
-        return contents 
\ No newline at end of file
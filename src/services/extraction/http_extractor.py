@@ -0,0 +1,68 @@
+"""Lightweight HTTP content extraction service."""
+import asyncio
+import re
+from functools import lru_cache
+import httpx
+
+from src.models.content import Content
+from src.core.exceptions import ContentExtractionError, RenderingRequiredError
+from src.core.config import get_settings
+from src.services.extraction.base import BaseExtractor
+from src.services.extraction.readability import extract_article
+
+settings = get_settings()
+
+# Mount points and notices typical of client-side rendered pages
+JS_APP_MARKERS = re.compile(
+    r"""id=["'](root|app|__next|__nuxt|___gatsby)["']|enable javascript|requires javascript""",
+    re.IGNORECASE
+)
+
+
+@lru_cache
+def get_http_client() -> httpx.AsyncClient:
+    """Get the process-wide pooled HTTP client."""
+    return httpx.AsyncClient(
+        follow_redirects=True,
+        timeout=settings.http_timeout,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_connections
+        ),
+        headers={"User-Agent": settings.http_user_agent}
+    )
+
+
+class HttpExtractor(BaseExtractor):
+    """Service for extracting server-rendered pages without a browser."""
+
+    def __init__(self, client: httpx.AsyncClient = None, min_content_length: int = None):
+        """Initialize the HttpExtractor."""
+        self.client = client or get_http_client()
+        self.min_content_length = min_content_length or settings.http_min_content_length
+
+    def _needs_browser(self, html: str, text: str) -> bool:
+        """Check whether a fetched page looks JS-rendered or too small."""
+        if len(text) < self.min_content_length:
+            return True
+        # App shells may carry some server-rendered text, but rarely a full article
+        return bool(JS_APP_MARKERS.search(html)) and len(text) < 3 * self.min_content_length
+
+    async def extract_content(self, url: str) -> Content:
+        """Extract content from a URL."""
+        try:
+            response = await self.client.get(url)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise ContentExtractionError(f"Failed to fetch content: {str(e)}")
+        
+        if "html" not in response.headers.get("content-type", ""):
+            raise ContentExtractionError("Failed to extract content: Response is not HTML")
+        
+        html = response.text
+        # Parsing large pages is CPU-bound, keep it off the event loop
+        article = await asyncio.to_thread(extract_article, html)
+        if article is None or self._needs_browser(html, article.get("content") or ""):
+            raise RenderingRequiredError("Failed to extract content: Page requires JavaScript rendering")
+        
+        return self._build_content(url, article)
@@ -33,4 +33,11 @@ class ContentExtractorInterface(ABC):
         Returns:
             List[Content]: List of extracted content items.
         """
-        pass 
\ No newline at end of file
+        pass
+    
+    async def close(self) -> None:
+        """Release resources held by the service.
+        
+        Called once on application shutdown. The default does nothing.
+        """
+        pass
@@ -0,0 +1,41 @@
+"""Per-host politeness limits for concurrent extraction."""
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+
+
+class HostThrottle:
+    """Limit concurrent requests per host and space out their start times."""
+
+    def __init__(self, per_host_limit: int, min_delay: float = 0.0):
+        """Initialize the HostThrottle.
+
+        Args:
+            per_host_limit: Maximum number of in-flight requests per host.
+            min_delay: Minimum number of seconds between request starts per host.
+        """
+        self.per_host_limit = per_host_limit
+        self.min_delay = min_delay
+        self._semaphores: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.per_host_limit)
+        )
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._next_start: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        """Wait for a free slot for ``host`` and hold it for the request."""
+        async with self._semaphores[host]:
+            if self.min_delay > 0:
+                await self._wait_turn(host)
+            yield
+
+    async def _wait_turn(self, host: str) -> None:
+        """Sleep until at least ``min_delay`` has passed since the last start."""
+        loop = asyncio.get_running_loop()
+        async with self._locks[host]:
+            wait = self._next_start.get(host, 0.0) - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_start[host] = loop.time() + self.min_delay
@@ -0,0 +1,127 @@
+() => {
+    // Single-pass, readability-style main content extraction.
+    //
+    // The DOM is walked once. Text is collected per block element (p, li,
+    // headings, ...) so every text node is emitted exactly once, and each
+    // block scores its parent and grandparent as candidate containers. The
+    // best-scoring container selects which blocks make up the article body.
+    const SKIP_TAGS = new Set([
+        'SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE', 'IFRAME', 'SVG', 'CANVAS',
+        'NAV', 'FOOTER', 'ASIDE', 'FORM', 'BUTTON', 'SELECT', 'TEXTAREA'
+    ]);
+    const BLOCK_TAGS = new Set([
+        'P', 'PRE', 'BLOCKQUOTE', 'LI', 'H1', 'H2', 'H3', 'H4', 'H5', 'H6',
+        'FIGCAPTION', 'TD', 'DD', 'DT'
+    ]);
+    const SKIP_PATTERN = /(^|[\s_-])(comment|share|social|promo|advert|ad-|ads|banner|sponsor|related|recommend|newsletter|cookie|popup|modal|sidebar|menu|breadcrumb)/i;
+    const MIN_BLOCK_LENGTH = 25;
+    const MIN_CONTENT_LENGTH = 200;
+
+    const blocks = [];
+    const scores = new Map();
+
+    const meta = (selector) => {
+        const el = document.querySelector(selector);
+        return el ? (el.getAttribute('content') || el.getAttribute('datetime') || el.textContent || '').trim() : '';
+    };
+
+    const isSkipped = (el) => {
+        if (SKIP_TAGS.has(el.tagName)) return true;
+        if (el.getAttribute('aria-hidden') === 'true' || el.hidden) return true;
+        // Class hints are too noisy on page-level containers
+        if (el === document.body || el.tagName === 'ARTICLE' || el.tagName === 'MAIN') return false;
+        const hint = (el.id || '') + ' ' + (typeof el.className === 'string' ? el.className : '');
+        return hint.length > 1 && SKIP_PATTERN.test(hint);
+    };
+
+    const addScore = (el, score) => {
+        if (el && el !== document.documentElement) {
+            scores.set(el, (scores.get(el) || 0) + score);
+        }
+    };
+
+    const closeBlock = (block) => {
+        const text = block.parts.join('').replace(/\s+/g, ' ').trim();
+        if (text.length < MIN_BLOCK_LENGTH && !/^H[1-6]$/.test(block.el.tagName)) return;
+        if (!text) return;
+
+        block.text = text;
+        blocks.push(block);
+
+        const linkDensity = Math.min(block.linkChars / text.length, 1);
+        const score = (1 + text.split(',').length + Math.min(text.length / 100, 3)) * (1 - linkDensity);
+        const parent = block.el.parentElement;
+        addScore(parent, score);
+        addScore(parent && parent.parentElement, score / 2);
+    };
+
+    // Iterative depth-first walk; `exit` markers close blocks and links.
+    const stack = [{ node: document.body }];
+    let current = null;
+    let linkDepth = 0;
+    while (stack.length) {
+        const item = stack.pop();
+        if (item.exit) {
+            if (item.exit === 'block') {
+                closeBlock(current);
+                current = null;
+            } else {
+                linkDepth--;
+            }
+            continue;
+        }
+
+        const node = item.node;
+        if (node.nodeType === Node.TEXT_NODE) {
+            if (current) {
+                current.parts.push(node.data);
+                if (linkDepth) current.linkChars += node.data.trim().length;
+            } else if (node.data.trim().length >= MIN_BLOCK_LENGTH && node.parentElement) {
+                // Loose text directly inside a container (e.g. <div>text</div>)
+                closeBlock({ el: node.parentElement, parts: [node.data], linkChars: 0 });
+            }
+            continue;
+        }
+        if (node.nodeType !== Node.ELEMENT_NODE || isSkipped(node)) continue;
+
+        if (!current && BLOCK_TAGS.has(node.tagName)) {
+            current = { el: node, parts: [], linkChars: 0 };
+            stack.push({ exit: 'block' });
+        } else if (node.tagName === 'A') {
+            linkDepth++;
+            stack.push({ exit: 'link' });
+        } else if (current && node.tagName === 'BR') {
+            current.parts.push('\n');
+        }
+
+        const children = node.childNodes;
+        for (let i = children.length - 1; i >= 0; i--) {
+            stack.push({ node: children[i] });
+        }
+    }
+
+    let top = null;
+    let topScore = 0;
+    for (const [el, score] of scores) {
+        if (score > topScore) {
+            top = el;
+            topScore = score;
+        }
+    }
+
+    const selected = top ? blocks.filter(block => top.contains(block.el)) : blocks;
+    let content = selected.map(block => block.text).join('\n\n');
+    if (content.length < MIN_CONTENT_LENGTH) {
+        content = blocks.map(block => block.text).join('\n\n');
+    }
+
+    const heading = (top && top.querySelector('h1')) || document.querySelector('h1');
+    return {
+        title: meta('meta[property="og:title"]') || (heading ? heading.textContent.trim() : '') || document.title,
+        byline: meta('meta[name="author"]') || meta('[itemprop="author"] [itemprop="name"]') ||
+            meta('[itemprop="author"]') || meta('[rel="author"]') || meta('.byline, [class*="byline"]'),
+        published: meta('meta[property="article:published_time"]') || meta('meta[itemprop="datePublished"]') ||
+            meta('[itemprop="datePublished"]') || meta('meta[name="date"]') || meta('time[datetime]'),
+        content: content
+    };
+}
@@ -0,0 +1,195 @@
+"""Single-pass, readability-style main content extraction for raw HTML.
+
+Server-side counterpart of ``readability.js``: the same block collection,
+container scoring and metadata lookups, applied to an lxml tree so pages
+can be extracted without a browser.
+"""
+import re
+from typing import Dict, List, Optional
+import lxml.html
+from lxml.etree import ParserError
+
+SKIP_TAGS = {
+    "script", "style", "noscript", "template", "iframe", "svg", "canvas",
+    "nav", "footer", "aside", "form", "button", "select", "textarea"
+}
+BLOCK_TAGS = {
+    "p", "pre", "blockquote", "li", "h1", "h2", "h3", "h4", "h5", "h6",
+    "figcaption", "td", "dd", "dt"
+}
+HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+SKIP_PATTERN = re.compile(
+    r"(^|[\s_-])(comment|share|social|promo|advert|ad-|ads|banner|sponsor|related|recommend"
+    r"|newsletter|cookie|popup|modal|sidebar|menu|breadcrumb)",
+    re.IGNORECASE
+)
+WHITESPACE = re.compile(r"\s+")
+MIN_BLOCK_LENGTH = 25
+MIN_CONTENT_LENGTH = 200
+
+_ENTER, _EXIT = 0, 1
+
+
+class _Block:
+    """Text collected for one block element."""
+
+    __slots__ = ("el", "parts", "link_chars", "text")
+
+    def __init__(self, el, parts: List[str] = None):
+        self.el = el
+        self.parts = parts if parts is not None else []
+        self.link_chars = 0
+        self.text = ""
+
+
+def _is_skipped(el) -> bool:
+    """Check whether an element's subtree is boilerplate."""
+    if not isinstance(el.tag, str):  # Comments and processing instructions
+        return True
+    tag = el.tag.lower()
+    if tag in SKIP_TAGS:
+        return True
+    if el.get("aria-hidden") == "true" or el.get("hidden") is not None:
+        return True
+    # Class hints are too noisy on page-level containers
+    if tag in ("body", "article", "main"):
+        return False
+    hint = f"{el.get('id') or ''} {el.get('class') or ''}"
+    return len(hint) > 1 and bool(SKIP_PATTERN.search(hint))
+
+
+def _first(doc, *xpaths: str) -> str:
+    """Return the first non-empty value matched by the XPath expressions."""
+    for xpath in xpaths:
+        for match in doc.xpath(xpath):
+            if isinstance(match, str):
+                value = match
+            else:
+                value = match.get("content") or match.get("datetime") or match.text_content()
+            value = (value or "").strip()
+            if value:
+                return value
+    return ""
+
+
+def extract_article(html: str) -> Optional[Dict[str, str]]:
+    """Extract main content, title, byline and publish date from HTML.
+
+    Args:
+        html: Raw HTML document.
+
+    Returns:
+        Optional[Dict[str, str]]: ``title``, ``byline``, ``published`` and
+        ``content``, or None if the document cannot be parsed.
+    """
+    try:
+        doc = lxml.html.document_fromstring(html)
+    except (ParserError, ValueError):
+        return None
+
+    body = doc.find("body")
+    blocks: List[_Block] = []
+    scores: Dict[object, float] = {}
+
+    def add_score(el, score: float) -> None:
+        if el is not None and el is not doc:
+            scores[el] = scores.get(el, 0.0) + score
+
+    def close_block(block: _Block) -> None:
+        text = WHITESPACE.sub(" ", "".join(block.parts)).strip()
+        if not text or (len(text) < MIN_BLOCK_LENGTH and block.el.tag not in HEADING_TAGS):
+            return
+        block.text = text
+        blocks.append(block)
+
+        link_density = min(block.link_chars / len(text), 1.0)
+        score = (1 + len(text.split(",")) + min(len(text) / 100, 3)) * (1 - link_density)
+        parent = block.el.getparent()
+        add_score(parent, score)
+        add_score(parent.getparent() if parent is not None else None, score / 2)
+
+    current: Optional[_Block] = None
+    link_depth = 0
+
+    def add_text(data: Optional[str], parent) -> None:
+        if not data:
+            return
+        if current is not None:
+            current.parts.append(data)
+            if link_depth:
+                current.link_chars += len(data.strip())
+        elif len(data.strip()) >= MIN_BLOCK_LENGTH and parent is not None:
+            # Loose text directly inside a container (e.g. <div>text</div>)
+            close_block(_Block(parent, [data]))
+
+    # Iterative depth-first walk. lxml keeps text after an element in its
+    # ``tail``, which belongs to the parent and is emitted on exit.
+    stack = [(_ENTER, body, None)] if body is not None else []
+    while stack:
+        action, el, opened = stack.pop()
+        if action == _EXIT:
+            if opened == "block":
+                close_block(current)
+                current = None
+            elif opened == "link":
+                link_depth -= 1
+            add_text(el.tail, el.getparent())
+            continue
+
+        if _is_skipped(el):
+            add_text(el.tail, el.getparent())
+            continue
+
+        tag = el.tag.lower()
+        opened = None
+        if current is None and tag in BLOCK_TAGS:
+            current = _Block(el)
+            opened = "block"
+        elif tag == "a":
+            link_depth += 1
+            opened = "link"
+        elif current is not None and tag == "br":
+            current.parts.append("\n")
+
+        stack.append((_EXIT, el, opened))
+        add_text(el.text, el)
+        for child in reversed(el):
+            stack.append((_ENTER, child, None))
+
+    # Like readability.js, only a container with a positive score is chosen
+    top = max(scores, key=scores.get) if scores else None
+    if top is not None and scores[top] <= 0:
+        top = None
+    if top is not None:
+        inside = set(top.iter())
+        selected = [block for block in blocks if block.el in inside]
+    else:
+        selected = blocks
+    content = "\n\n".join(block.text for block in selected)
+    if len(content) < MIN_CONTENT_LENGTH:
+        content = "\n\n".join(block.text for block in blocks)
+
+    heading = _first(top, ".//h1") if top is not None else ""
+    return {
+        "title": (
+            _first(doc, '//meta[@property="og:title"]/@content')
+            or heading
+            or _first(doc, "//h1", "//title")
+        ),
+        "byline": _first(
+            doc,
+            '//meta[@name="author"]/@content',
+            '//*[@itemprop="author"]//*[@itemprop="name"]',
+            '//*[@itemprop="author"]',
+            '//*[@rel="author"]',
+            '//*[contains(@class, "byline")]'
+        ),
+        "published": _first(
+            doc,
+            '//meta[@property="article:published_time"]/@content',
+            '//*[@itemprop="datePublished"]',
+            '//meta[@name="date"]/@content',
+            '//time[@datetime]/@datetime'
+        ),
+        "content": content
+    }
@@ -0,0 +1,74 @@
+"""Tiered content extraction service."""
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional
+from loguru import logger
+
+from src.models.content import Content
+from src.core.exceptions import ContentExtractionError
+from src.services.extraction.base import BaseExtractor
+from src.services.extraction.extractor import PlaywrightExtractor
+from src.services.extraction.http_extractor import HttpExtractor
+
+HTTP_TIER = "http"
+BROWSER_TIER = "browser"
+
+
+class TierMemory:
+    """Bounded per-domain memory of the extraction tier that last worked."""
+
+    def __init__(self, max_domains: int = 10000):
+        """Initialize the TierMemory."""
+        self.max_domains = max_domains
+        self._tiers: "OrderedDict[str, str]" = OrderedDict()
+
+    def get(self, domain: str) -> Optional[str]:
+        """Get the tier remembered for a domain."""
+        return self._tiers.get(domain)
+
+    def remember(self, domain: str, tier: str) -> None:
+        """Remember the tier that worked for a domain."""
+        self._tiers[domain] = tier
+        self._tiers.move_to_end(domain)
+        while len(self._tiers) > self.max_domains:
+            self._tiers.popitem(last=False)
+
+
+@lru_cache
+def get_tier_memory() -> TierMemory:
+    """Get the process-wide extraction tier memory."""
+    return TierMemory()
+
+
+class TieredExtractor(BaseExtractor):
+    """Service extracting over plain HTTP first and escalating to Playwright.
+
+    Domains whose pages needed the browser skip the HTTP tier on later fetches.
+    """
+
+    def __init__(
+        self,
+        http_extractor: HttpExtractor = None,
+        browser_extractor: PlaywrightExtractor = None,
+        tier_memory: TierMemory = None
+    ):
+        """Initialize the TieredExtractor."""
+        self.http_extractor = http_extractor or HttpExtractor()
+        self.browser_extractor = browser_extractor or PlaywrightExtractor()
+        self.tier_memory = tier_memory or get_tier_memory()
+
+    async def extract_content(self, url: str) -> Content:
+        """Extract content from a URL."""
+        domain = self._extract_domain(url)
+        
+        if self.tier_memory.get(domain) != BROWSER_TIER:
+            try:
+                content = await self.http_extractor.extract_content(url)
+                self.tier_memory.remember(domain, HTTP_TIER)
+                return content
+            except ContentExtractionError as e:
+                logger.debug(f"HTTP extraction of {url} failed, escalating to browser: {e}")
+        
+        content = await self.browser_extractor.extract_content(url)
+        self.tier_memory.remember(domain, BROWSER_TIER)
+        return content
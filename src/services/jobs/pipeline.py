@@ -0,0 +1,134 @@
+"""Streaming extract, analyze and store pipeline."""
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, List, Union
+from urllib.parse import urlparse
+
+from src.models.content import Content
+from src.models.result import ProcessingResult
+from src.core.exceptions import ContentExtractionError
+from src.core.config import get_settings
+from src.services.extraction.interface import ContentExtractorInterface
+from src.services.extraction.politeness import HostThrottle
+from src.services.analysis.interface import ContentAnalyzerInterface
+from src.services.storage.interface import ContentRepositoryInterface
+
+settings = get_settings()
+
+# A stage handler forwards content downstream or returns a failed result
+Handler = Callable[[object], Awaitable[Union[Content, ProcessingResult]]]
+
+
+class ProcessingPipeline:
+    """Process URLs with every URL moving through the stages on its own.
+
+    Extraction, analysis and storage each run their own pool of workers,
+    joined by bounded queues, so pages are loaded while earlier ones are
+    analyzed and stored. A full queue makes the stage before it wait.
+    """
+
+    def __init__(
+        self,
+        extractor: ContentExtractorInterface,
+        analyzer: ContentAnalyzerInterface,
+        repository: ContentRepositoryInterface,
+        extract_concurrency: int = None,
+        analyze_concurrency: int = None,
+        store_concurrency: int = None,
+        queue_size: int = None
+    ):
+        """Initialize the ProcessingPipeline."""
+        self.extractor = extractor
+        self.analyzer = analyzer
+        self.repository = repository
+        self.extract_concurrency = extract_concurrency or settings.extraction_concurrency
+        self.analyze_concurrency = analyze_concurrency or settings.analysis_concurrency
+        self.store_concurrency = store_concurrency or settings.pipeline_store_concurrency
+        self.queue_size = queue_size or settings.pipeline_queue_size
+        self.throttle = HostThrottle(
+            per_host_limit=settings.extraction_per_host_concurrency,
+            min_delay=settings.extraction_host_delay
+        )
+
+    async def _extract(self, url: str) -> Union[Content, ProcessingResult]:
+        """Extract one URL, waiting for a slot on its host."""
+        try:
+            async with self.throttle.slot(urlparse(url).netloc):
+                content = await self.extractor.extract_content(url)
+            if not content:
+                raise ContentExtractionError("Failed to extract content")
+            return content
+        except Exception as e:
+            return ProcessingResult(url=url, error=str(e))
+
+    async def _analyze(self, content: Content) -> Union[Content, ProcessingResult]:
+        """Analyze one content item."""
+        try:
+            return await self.analyzer.analyze_content(content)
+        except Exception as e:
+            return ProcessingResult(url=content.url, error=str(e))
+
+    async def _store(self, content: Content) -> ProcessingResult:
+        """Store one content item."""
+        try:
+            await self.repository.store(content)
+        except Exception as e:
+            return ProcessingResult(url=content.url, error=str(e))
+        return ProcessingResult(url=content.url, content=content)
+
+    @staticmethod
+    async def _run_stage(
+        handler: Handler,
+        workers: int,
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue,
+        results: asyncio.Queue,
+        downstream_workers: int
+    ) -> None:
+        """Run a stage's workers until the inbox ends, then end the outbox.
+        
+        Failed results skip the remaining stages and go straight to results.
+        """
+        async def work():
+            while (item := await inbox.get()) is not None:
+                output = await handler(item)
+                await (results if isinstance(output, ProcessingResult) else outbox).put(output)
+        
+        await asyncio.gather(*(work() for _ in range(workers)))
+        for _ in range(downstream_workers):
+            await outbox.put(None)
+
+    async def process(self, urls: List[str]) -> AsyncIterator[ProcessingResult]:
+        """Process URLs, yielding each result as soon as its URL is done.
+        
+        Args:
+            urls: URLs to extract, analyze and store.
+            
+        Yields:
+            ProcessingResult: One result per URL, in completion order.
+        """
+        pending = asyncio.Queue()
+        for url in urls:
+            pending.put_nowait(url)
+        for _ in range(self.extract_concurrency):
+            pending.put_nowait(None)
+        
+        extracted = asyncio.Queue(maxsize=self.queue_size)
+        analyzed = asyncio.Queue(maxsize=self.queue_size)
+        results = asyncio.Queue()
+        stages = [
+            asyncio.create_task(self._run_stage(
+                self._extract, self.extract_concurrency, pending, extracted, results, self.analyze_concurrency
+            )),
+            asyncio.create_task(self._run_stage(
+                self._analyze, self.analyze_concurrency, extracted, analyzed, results, self.store_concurrency
+            )),
+            asyncio.create_task(self._run_stage(
+                self._store, self.store_concurrency, analyzed, results, results, 0
+            ))
+        ]
+        try:
+            for _ in urls:
+                yield await results.get()
+        finally:
+            for stage in stages:
+                stage.cancel()
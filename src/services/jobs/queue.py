@@ -0,0 +1,162 @@
+"""Persistent queue of ingestion jobs."""
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from src.models.content import Content
+from src.models.job import Job, JobItem
+from src.core.config import get_settings
+
+settings = get_settings()
+
+
+class JobQueue:
+    """SQLite queue of URLs to process, grouped into jobs.
+
+    Items are claimed one at a time with an atomic update, so several
+    worker processes can share the queue file. A claimed item that is
+    not finished within ``lease`` seconds, e.g. because its worker died,
+    is handed out again, up to ``max_attempts`` times.
+    """
+
+    def __init__(self, path: str = None, lease: int = None, max_attempts: int = None):
+        """Initialize the JobQueue."""
+        self.path = path or settings.job_queue_path
+        self.lease = lease or settings.job_lease
+        self.max_attempts = max_attempts or settings.job_max_attempts
+
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS job_items (
+                job_id TEXT NOT NULL,
+                position INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                claimed_at REAL,
+                data TEXT,
+                error TEXT,
+                UNIQUE (job_id, position)
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS job_items_claim ON job_items (status, claimed_at)"
+        )
+        self._conn.commit()
+
+    def enqueue(self, urls: List[str]) -> Job:
+        """Create a job processing the given URLs."""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, created_at, updated_at) VALUES (?, ?, ?)", (job_id, now, now)
+            )
+            self._conn.executemany(
+                "INSERT INTO job_items (job_id, position, url, status) VALUES (?, ?, ?, 'pending')",
+                [(job_id, position, url) for position, url in enumerate(urls)]
+            )
+            self._conn.commit()
+        return self.get(job_id)
+
+    def claim(self) -> Optional[Tuple[str, int, str]]:
+        """Claim the oldest pending item.
+
+        Returns:
+            (job_id, position, url) of the claimed item, or None if the
+            queue is empty.
+        """
+        while True:
+            now = time.time()
+            with self._lock:
+                row = self._conn.execute(
+                    """UPDATE job_items SET status = 'running', attempts = attempts + 1, claimed_at = ?
+                       WHERE rowid = (
+                           SELECT rowid FROM job_items
+                           WHERE status = 'pending' OR (status = 'running' AND claimed_at < ?)
+                           ORDER BY rowid LIMIT 1
+                       )
+                       RETURNING job_id, position, url, attempts""",
+                    (now, now - self.lease)
+                ).fetchone()
+                self._conn.commit()
+            if row is None:
+                return None
+            job_id, position, url, attempts = row
+            if attempts <= self.max_attempts:
+                return job_id, position, url
+            self.fail(job_id, position, f"Gave up after {self.max_attempts} attempts")
+
+    def _finish(self, job_id: str, position: int, status: str, data: str = None, error: str = None) -> None:
+        """Record the outcome of an item."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE job_items SET status = ?, data = ?, error = ? WHERE job_id = ? AND position = ?",
+                (status, data, error, job_id, position)
+            )
+            self._conn.execute("UPDATE jobs SET updated_at = ? WHERE id = ?", (time.time(), job_id))
+            self._conn.commit()
+
+    def complete(self, job_id: str, position: int, content: Content) -> None:
+        """Mark an item as processed and keep its result."""
+        self._finish(job_id, position, "done", data=content.model_dump_json())
+
+    def fail(self, job_id: str, position: int, error: str) -> None:
+        """Mark an item as failed."""
+        self._finish(job_id, position, "failed", error=error)
+
+    def release(self, job_id: str, position: int) -> None:
+        """Return an unfinished item to the queue without counting the attempt."""
+        with self._lock:
+            self._conn.execute(
+                """UPDATE job_items SET status = 'pending', attempts = attempts - 1, claimed_at = NULL
+                   WHERE job_id = ? AND position = ? AND status = 'running'""",
+                (job_id, position)
+            )
+            self._conn.commit()
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job with the status and result of each item."""
+        with self._lock:
+            job = self._conn.execute(
+                "SELECT created_at, updated_at FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            if job is None:
+                return None
+            rows = self._conn.execute(
+                "SELECT url, status, data, error FROM job_items WHERE job_id = ? ORDER BY position",
+                (job_id,)
+            ).fetchall()
+        return Job(
+            id=job_id,
+            created_at=datetime.fromtimestamp(job[0], timezone.utc),
+            updated_at=datetime.fromtimestamp(job[1], timezone.utc),
+            items=[
+                JobItem(
+                    url=url,
+                    status=status,
+                    content=Content.model_validate_json(data) if data else None,
+                    error=error
+                )
+                for url, status, data, error in rows
+            ]
+        )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,119 @@
+"""Worker pool processing queued ingestion jobs."""
+import asyncio
+from typing import Callable, List, Optional
+from loguru import logger
+
+from src.models.job import Job
+from src.core.exceptions import ContentExtractionError
+from src.core.config import get_settings
+from src.services.extraction.interface import ContentExtractorInterface
+from src.services.analysis.interface import ContentAnalyzerInterface
+from src.services.storage.interface import ContentRepositoryInterface
+from src.services.jobs.queue import JobQueue
+
+settings = get_settings()
+
+
+class JobWorkers:
+    """Asyncio workers running the extract, analyze and store pipeline.
+
+    Each worker claims one URL at a time from the JobQueue, so the URLs of
+    a job are processed in parallel and a slow page does not hold up the
+    rest. Workers sleep until a job is submitted in this process or the
+    poll interval passes, which picks up jobs submitted elsewhere. Queue
+    calls run in a thread so SQLite never blocks the event loop.
+    """
+
+    def __init__(
+        self,
+        extractor: ContentExtractorInterface,
+        analyzer: ContentAnalyzerInterface,
+        repository: ContentRepositoryInterface,
+        queue: JobQueue = None,
+        workers: int = None,
+        poll_interval: float = None
+    ):
+        """Initialize the JobWorkers."""
+        self.extractor = extractor
+        self.analyzer = analyzer
+        self.repository = repository
+        self.queue = queue or JobQueue()
+        self.workers = settings.job_workers if workers is None else workers
+        self.poll_interval = poll_interval or settings.job_poll_interval
+        self._wakeup = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Start the workers on the running event loop."""
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def submit(self, urls: List[str]) -> Job:
+        """Queue a job and wake the workers."""
+        job = await asyncio.to_thread(self.queue.enqueue, urls)
+        self._wakeup.set()
+        return job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by id."""
+        return await asyncio.to_thread(self.queue.get, job_id)
+
+    async def _work(self) -> None:
+        """Process queued items until cancelled."""
+        while True:
+            try:
+                claimed = await asyncio.to_thread(self.queue.claim)
+            except Exception as e:
+                logger.error(f"Failed to claim a job item: {str(e)}")
+                await asyncio.sleep(self.poll_interval)
+                continue
+            if claimed is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._process(*claimed)
+
+    async def _record(self, method: Callable[..., None], job_id: str, position: int, *args) -> None:
+        """Record an item's outcome, backing off if the queue is unavailable.
+        
+        An unrecorded item keeps its claim and is retried once the lease expires.
+        """
+        try:
+            await asyncio.to_thread(method, job_id, position, *args)
+        except Exception as e:
+            logger.error(f"Failed to record outcome of job {job_id} item {position}: {str(e)}")
+            await asyncio.sleep(self.poll_interval)
+
+    async def _process(self, job_id: str, position: int, url: str) -> None:
+        """Run the pipeline for one URL and record the outcome."""
+        try:
+            content = await self.extractor.extract_content(url)
+            if not content:
+                raise ContentExtractionError("Failed to extract content")
+            content = await self.analyzer.analyze_content(content)
+            await self.repository.store(content)
+        except asyncio.CancelledError:
+            try:
+                await asyncio.to_thread(self.queue.release, job_id, position)
+            except Exception as e:
+                logger.error(f"Failed to release job {job_id} item {position}: {str(e)}")
+            raise
+        except Exception as e:
+            logger.warning(f"Job {job_id} failed for {url}: {str(e)}")
+            await self._record(self.queue.fail, job_id, position, str(e))
+        else:
+            await self._record(self.queue.complete, job_id, position, content)
+
+    async def close(self) -> None:
+        """Stop the workers and close the queue.
+        
+        Items being processed go back to the queue.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self.queue.close()
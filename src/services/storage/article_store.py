@@ -0,0 +1,95 @@
+"""Article-level storage for the normalized vector store layout."""
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional
+
+from src.models.content import Content
+
+
+def content_id_for(url: str) -> str:
+    """Derive the stable content id of an article from its URL."""
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+
+
+class ArticleStore:
+    """SQLite store holding each article once, keyed by URL.
+
+    Vector store chunks only reference an article by content id; the
+    article fields are fetched from here for the hits a search returns.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the ArticleStore."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS articles (
+                url TEXT PRIMARY KEY,
+                content_id TEXT NOT NULL UNIQUE,
+                data TEXT NOT NULL
+            )"""
+        )
+        self._conn.commit()
+
+    def upsert(self, content: Content) -> str:
+        """Insert or replace an article and return its content id."""
+        content_id = content_id_for(content.url)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO articles (url, content_id, data) VALUES (?, ?, ?)",
+                (content.url, content_id, content.model_dump_json())
+            )
+            self._conn.commit()
+        return content_id
+
+    def get(self, url: str) -> Optional[Content]:
+        """Get an article by URL."""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM articles WHERE url = ?", (url,)).fetchone()
+        return Content.model_validate_json(row[0]) if row else None
+
+    def get_many(self, content_ids: Iterable[str]) -> Dict[str, Content]:
+        """Get articles by content id."""
+        content_ids = list(dict.fromkeys(content_ids))
+        found = {}
+        with self._lock:
+            for start in range(0, len(content_ids), 500):
+                batch = content_ids[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT content_id, data FROM articles WHERE content_id IN ({','.join('?' * len(batch))})",
+                    batch
+                ).fetchall()
+                for content_id, data in rows:
+                    found[content_id] = Content.model_validate_json(data)
+        return found
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[Content]:
+        """Iterate over all articles, reading them in batches."""
+        last_url = ""
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT url, data FROM articles WHERE url > ? ORDER BY url LIMIT ?",
+                    (last_url, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for _, data in rows:
+                yield Content.model_validate_json(data)
+            last_url = rows[-1][0]
+
+    def delete(self, url: str) -> None:
+        """Delete an article by URL."""
+        with self._lock:
+            self._conn.execute("DELETE FROM articles WHERE url = ?", (url,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
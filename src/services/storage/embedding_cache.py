@@ -0,0 +1,165 @@
+"""Caching wrapper for embedding models."""
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+from langchain_core.embeddings import Embeddings
+
+from src.core.config import get_settings
+
+settings = get_settings()
+
+
+class EmbeddingStore:
+    """Compact on-disk store of float32 vectors keyed by content hash."""
+
+    def __init__(self, path: str):
+        """Initialize the EmbeddingStore."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+        self._conn.commit()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Get the stored vectors for the given keys."""
+        found = {}
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})",
+                    batch
+                ).fetchall()
+                for key, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[key] = vector.tolist()
+        return found
+
+    def set_many(self, items: Dict[str, List[float]]) -> None:
+        """Store vectors as float32 blobs."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, array("f", vector).tobytes()) for key, vector in items.items()]
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper caching vectors by content hash.
+
+    Document and query vectors are persisted in an ``EmbeddingStore``; hot
+    query vectors are also kept in an in-memory LRU. Only cache misses are
+    sent to the wrapped model, in a single batched call.
+    """
+
+    def __init__(self, embeddings: Embeddings, path: str = None, query_cache_size: int = None):
+        """Initialize the CachedEmbeddings."""
+        self.embeddings = embeddings
+        self.namespace = getattr(embeddings, "model", None) or type(embeddings).__name__
+        self.store = EmbeddingStore(path or settings.embedding_cache_path)
+        self.query_cache_size = query_cache_size or settings.embedding_query_cache_size
+        # Guards the query LRU and the counters; the repository calls in from
+        # several pool threads
+        self._lock = threading.Lock()
+        self._queries: "OrderedDict[str, List[float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, text: str) -> str:
+        """Hash the text together with the embedding model name."""
+        return hashlib.sha256(f"{self.namespace}\0{text}".encode("utf-8")).hexdigest()
+
+    def _lookup(self, texts: List[str]) -> tuple:
+        """Return keys, cached vectors and the unique texts still to embed."""
+        keys = [self._key(text) for text in texts]
+        cached = self.store.get_many(list(set(keys)))
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+        with self._lock:
+            self.hits += len(texts) - len(missing)
+            self.misses += len(missing)
+        return keys, cached, missing
+
+    def _remember_query(self, key: str, vector: List[float]) -> None:
+        """Put a query vector into the in-memory LRU."""
+        with self._lock:
+            self._queries[key] = vector
+            self._queries.move_to_end(key)
+            while len(self._queries) > self.query_cache_size:
+                self._queries.popitem(last=False)
+
+    def _cached_query(self, key: str) -> Optional[List[float]]:
+        """Get a query vector from the in-memory LRU."""
+        with self._lock:
+            vector = self._queries.get(key)
+            if vector is not None:
+                self._queries.move_to_end(key)
+                self.hits += 1
+        return vector
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents, calling the model only for cache misses."""
+        keys, cached, missing = self._lookup(texts)
+        if missing:
+            vectors = self.embeddings.embed_documents(list(missing.values()))
+            new = dict(zip(missing.keys(), vectors))
+            self.store.set_many(new)
+            cached.update(new)
+        return [cached[key] for key in keys]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents asynchronously, calling the model only for cache misses."""
+        keys, cached, missing = await asyncio.to_thread(self._lookup, texts)
+        if missing:
+            vectors = await self.embeddings.aembed_documents(list(missing.values()))
+            new = dict(zip(missing.keys(), vectors))
+            await asyncio.to_thread(self.store.set_many, new)
+            cached.update(new)
+        return [cached[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query, serving repeated queries from memory."""
+        key = self._key(text)
+        vector = self._cached_query(key)
+        if vector is None:
+            vector = self.embed_documents([text])[0]
+            self._remember_query(key, vector)
+        return vector
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """Embed a query asynchronously, serving repeated queries from memory."""
+        key = self._key(text)
+        vector = self._cached_query(key)
+        if vector is None:
+            vector = (await self.aembed_documents([text]))[0]
+            self._remember_query(key, vector)
+        return vector
+
+    def stats(self) -> dict:
+        """Get hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    def close(self) -> None:
+        """Close the on-disk store."""
+        self.store.close()
@@ -0,0 +1,120 @@
+"""Incrementally maintained facet counters."""
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+from src.models.content import Content
+from src.services.storage.article_store import content_id_for
+
+# Content fields counted as facets
+FACETS = ("topics", "keywords", "source", "sentiment")
+
+
+class FacetIndex:
+    """SQLite counters of facet values over all stored articles.
+
+    Each article's values are remembered, so re-storing an article only
+    moves the counts that changed. Top-N reads use an index on the counts
+    and do not depend on the corpus size.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the FacetIndex."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS facet_counts (
+                facet TEXT NOT NULL,
+                value TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (facet, value)
+            ) WITHOUT ROWID"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS facet_counts_top ON facet_counts (facet, count DESC, value)"
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS article_facets (
+                content_id TEXT NOT NULL,
+                facet TEXT NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (content_id, facet, value)
+            ) WITHOUT ROWID"""
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _values(content: Content) -> Set[Tuple[str, str]]:
+        """Collect the (facet, value) pairs of an article."""
+        values = set()
+        for facet in FACETS:
+            field = getattr(content, facet)
+            for value in field if isinstance(field, list) else [field]:
+                value = value.strip()
+                if value:
+                    values.add((facet, value))
+        return values
+
+    def _apply(self, content_id: str, new: Set[Tuple[str, str]]) -> None:
+        """Replace an article's facet values and adjust the counters."""
+        old = set(self._conn.execute(
+            "SELECT facet, value FROM article_facets WHERE content_id = ?", (content_id,)
+        ).fetchall())
+        added, removed = new - old, old - new
+
+        self._conn.executemany(
+            """INSERT INTO facet_counts (facet, value, count) VALUES (?, ?, 1)
+               ON CONFLICT (facet, value) DO UPDATE SET count = count + 1""",
+            added
+        )
+        self._conn.executemany(
+            "UPDATE facet_counts SET count = count - 1 WHERE facet = ? AND value = ?", removed
+        )
+        # Only the decremented counters can have dropped to zero
+        self._conn.executemany(
+            "DELETE FROM facet_counts WHERE facet = ? AND value = ? AND count <= 0", removed
+        )
+        self._conn.executemany(
+            "INSERT INTO article_facets (content_id, facet, value) VALUES (?, ?, ?)",
+            [(content_id, facet, value) for facet, value in added]
+        )
+        self._conn.executemany(
+            "DELETE FROM article_facets WHERE content_id = ? AND facet = ? AND value = ?",
+            [(content_id, facet, value) for facet, value in removed]
+        )
+
+    def upsert(self, content: Content) -> None:
+        """Count an article's facet values, replacing its previous version."""
+        with self._lock:
+            self._apply(content_id_for(content.url), self._values(content))
+            self._conn.commit()
+
+    def delete(self, url: str) -> None:
+        """Remove an article's facet values from the counters."""
+        with self._lock:
+            self._apply(content_id_for(url), set())
+            self._conn.commit()
+
+    def top(self, facets: List[str], limit: int) -> Dict[str, List[Tuple[str, int]]]:
+        """Get the most frequent values of each facet.
+
+        Returns:
+            Dict mapping each facet to (value, count) pairs, most frequent first.
+        """
+        with self._lock:
+            return {
+                facet: self._conn.execute(
+                    "SELECT value, count FROM facet_counts WHERE facet = ? ORDER BY count DESC, value LIMIT ?",
+                    (facet, limit)
+                ).fetchall()
+                for facet in facets
+            }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,8 +1,8 @@
 """Content storage interface."""
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, Dict, List
 
-from src.models.content import Content
+from src.models.content import Content, FacetCount
 
 
 class ContentRepositoryInterface(ABC):
@@ -46,4 +46,46 @@ class ContentRepositoryInterface(ABC):
         Raises:
             SearchError: If search fails.
         """
-        pass 
\ No newline at end of file
+        pass
+    
+    async def search_stream(self, query: str, limit: int = None, **kwargs) -> AsyncIterator[Content]:
+        """Search content in database, yielding results one by one.
+        
+        Takes the same arguments as ``search``. The default runs ``search``
+        and yields its results; implementations can stream incrementally.
+        
+        Raises:
+            SearchError: If search fails.
+        """
+        for result in await self.search(query, limit, **kwargs):
+            yield result
+    
+    @abstractmethod
+    async def facets(self, facets: List[str] = None, limit: int = None) -> Dict[str, List[FacetCount]]:
+        """Get the most frequent facet values over all stored content.
+        
+        Args:
+            facets: Facets to count, among topics, keywords, source and sentiment.
+            limit: Maximum number of values per facet.
+            
+        Returns:
+            Dict[str, List[FacetCount]]: Values per facet, most frequent first.
+            
+        Raises:
+            SearchError: If reading the counters fails.
+        """
+        pass
+    
+    async def stats(self) -> dict:
+        """Get cache statistics of the service.
+        
+        The default reports nothing.
+        """
+        return {}
+    
+    async def close(self) -> None:
+        """Release resources held by the service.
+        
+        Called once on application shutdown. The default does nothing.
+        """
+        pass
@@ -0,0 +1,96 @@
+"""Local keyword index for BM25 search."""
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Tuple
+
+from src.models.content import Content
+from src.services.storage.article_store import content_id_for
+
+TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# bm25() column weights: content_id (unindexed), title, tags, body
+BM25_WEIGHTS = (0.0, 3.0, 2.0, 1.0)
+
+
+class KeywordIndex:
+    """On-disk inverted index over articles, ranked with BM25.
+
+    Backed by an SQLite FTS5 table with Porter stemming. Articles are
+    indexed incrementally as they are stored; title and tag matches weigh
+    more than body matches.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the KeywordIndex."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE VIRTUAL TABLE IF NOT EXISTS keyword_index USING fts5(
+                content_id UNINDEXED, title, tags, body,
+                tokenize = 'porter unicode61 remove_diacritics 2'
+            )"""
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _match_expression(query: str) -> str:
+        """Turn free text into an FTS5 query matching any of its terms."""
+        return " OR ".join(f'"{token}"' for token in TOKEN.findall(query.lower()))
+
+    def upsert(self, content: Content) -> None:
+        """Index an article, replacing its previous version."""
+        content_id = content_id_for(content.url)
+        with self._lock:
+            self._conn.execute("DELETE FROM keyword_index WHERE content_id = ?", (content_id,))
+            self._conn.execute(
+                "INSERT INTO keyword_index (content_id, title, tags, body) VALUES (?, ?, ?, ?)",
+                (
+                    content_id,
+                    content.title,
+                    " ".join(content.topics + content.keywords),
+                    f"{content.summary}\n{content.content}"
+                )
+            )
+            self._conn.commit()
+
+    def delete(self, url: str) -> None:
+        """Remove an article from the index."""
+        with self._lock:
+            self._conn.execute("DELETE FROM keyword_index WHERE content_id = ?", (content_id_for(url),))
+            self._conn.commit()
+
+    def search(self, query: str, limit: int) -> List[Tuple[str, float, str]]:
+        """Find the articles best matching the query terms.
+
+        Returns:
+            List of (content_id, score, snippet) tuples, best first. Scores
+            are BM25 scores; higher is better.
+        """
+        expression = self._match_expression(query)
+        if not expression:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                f"""SELECT content_id, bm25(keyword_index, {', '.join(map(str, BM25_WEIGHTS))}) AS rank,
+                           snippet(keyword_index, 3, '', '', '…', 48)
+                    FROM keyword_index WHERE keyword_index MATCH ?
+                    ORDER BY rank LIMIT ?""",
+                (expression, limit)
+            ).fetchall()
+        # FTS5 reports BM25 negated so that smaller sorts first
+        return [(content_id, -rank, snippet) for content_id, rank, snippet in rows]
+
+    def count(self) -> int:
+        """Count the indexed articles."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM keyword_index").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
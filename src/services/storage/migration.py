@@ -0,0 +1,146 @@
+"""Migration of vector store collections to the normalized layout.
+
+Older versions copied the whole article into the metadata of every chunk.
+This moves the article fields into the article store and rewrites such
+chunks to carry only the content id and the compact filter fields. Chunk
+embeddings are reused, so nothing is re-embedded. Chunks are rewritten in
+place batch by batch; back up the persist directory before running.
+Normalized chunks written before filter fields existed get them added,
+and the keyword index and facet counters are rebuilt from the article
+store.
+
+Usage:
+    python -m src.services.storage.migration
+"""
+from src.core.exceptions import DatabaseError
+from src.services.storage.repository import ChromaRepository
+
+
+def _is_legacy(metadata: dict) -> bool:
+    """Check whether a chunk uses the denormalized layout."""
+    return bool(metadata) and "content_id" not in metadata and bool(metadata.get("url"))
+
+
+def migrate_legacy_layout(repository: ChromaRepository, batch_size: int = 256) -> int:
+    """Migrate legacy chunks of a repository to the normalized layout.
+
+    Args:
+        repository: Repository whose collection should be migrated.
+        batch_size: Number of chunks read and rewritten at once.
+
+    Returns:
+        int: Number of migrated chunks.
+
+    Raises:
+        DatabaseError: If the migration fails.
+    """
+    try:
+        collection = repository.chroma_client.get_or_create_collection("content")
+        ids = collection.get(include=[])["ids"]
+        migrated = 0
+        stored_urls = set()
+
+        for start in range(0, len(ids), batch_size):
+            batch = collection.get(
+                ids=ids[start:start + batch_size],
+                include=["embeddings", "documents", "metadatas"]
+            )
+            legacy = [i for i, metadata in enumerate(batch["metadatas"]) if _is_legacy(metadata)]
+            if not legacy:
+                continue
+
+            # Articles first, so rewritten chunks never point at a missing article
+            for i in legacy:
+                metadata = batch["metadatas"][i]
+                if metadata["url"] not in stored_urls:
+                    repository.article_store.upsert(ChromaRepository._content_from_metadata(metadata))
+                    stored_urls.add(metadata["url"])
+
+            # Chroma merges metadata on update, so stale keys need a rewrite
+            legacy_ids = [batch["ids"][i] for i in legacy]
+            collection.delete(ids=legacy_ids)
+            collection.add(
+                ids=legacy_ids,
+                embeddings=[batch["embeddings"][i] for i in legacy],
+                documents=[batch["documents"][i] for i in legacy],
+                metadatas=[
+                    ChromaRepository._chunk_metadata(ChromaRepository._content_from_metadata(batch["metadatas"][i]))
+                    for i in legacy
+                ]
+            )
+            migrated += len(legacy)
+
+        return migrated
+    except Exception as e:
+        raise DatabaseError(f"Layout migration failed: {str(e)}")
+
+
+def backfill_filter_metadata(repository: ChromaRepository, batch_size: int = 256) -> int:
+    """Add filter fields to normalized chunks that only carry a content id.
+    
+    Args:
+        repository: Repository whose collection should be updated.
+        batch_size: Number of chunks read and updated at once.
+        
+    Returns:
+        int: Number of updated chunks.
+        
+    Raises:
+        DatabaseError: If the backfill fails.
+    """
+    try:
+        collection = repository.chroma_client.get_or_create_collection("content")
+        ids = collection.get(include=[])["ids"]
+        updated = 0
+        
+        for start in range(0, len(ids), batch_size):
+            batch = collection.get(ids=ids[start:start + batch_size], include=["metadatas"])
+            missing = [
+                (id, metadata["content_id"]) for id, metadata in zip(batch["ids"], batch["metadatas"])
+                if metadata and "content_id" in metadata and "published_at" not in metadata
+            ]
+            articles = repository.article_store.get_many(content_id for _, content_id in missing)
+            missing = [(id, content_id) for id, content_id in missing if content_id in articles]
+            if not missing:
+                continue
+            
+            # Metadata updates merge keys, which is exactly what a backfill needs
+            collection.update(
+                ids=[id for id, _ in missing],
+                metadatas=[ChromaRepository._chunk_metadata(articles[content_id]) for _, content_id in missing]
+            )
+            updated += len(missing)
+        
+        return updated
+    except Exception as e:
+        raise DatabaseError(f"Filter metadata backfill failed: {str(e)}")
+
+
+def rebuild_indexes(repository: ChromaRepository) -> int:
+    """Index every stored article in the keyword index and facet counters.
+    
+    Args:
+        repository: Repository whose keyword index should be rebuilt.
+        
+    Returns:
+        int: Number of indexed articles.
+        
+    Raises:
+        DatabaseError: If the rebuild fails.
+    """
+    try:
+        indexed = 0
+        for content in repository.article_store.iter_all():
+            repository.keyword_index.upsert(content)
+            repository.facet_index.upsert(content)
+            indexed += 1
+        return indexed
+    except Exception as e:
+        raise DatabaseError(f"Index rebuild failed: {str(e)}")
+
+
+if __name__ == "__main__":
+    repository = ChromaRepository()
+    print(f"Migrated {migrate_legacy_layout(repository)} chunks")
+    print(f"Added filter fields to {backfill_filter_metadata(repository)} chunks")
+    print(f"Indexed {rebuild_indexes(repository)} articles")
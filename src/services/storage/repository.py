@@ -1,19 +1,35 @@
 """Content storage service."""
-from typing import List
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple, Union
 from pathlib import Path
 import chromadb
+import numpy as np
+from loguru import logger
 from langchain_chroma import Chroma
 from langchain_openai import OpenAIEmbeddings
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.schema import Document
 
-from src.models.content import Content
+from src.models.content import Content, FacetCount, SearchFilters, SearchResult
+from src.models.result import ProcessingResult
 from src.core.exceptions import DatabaseError, SearchError
 from src.core.config import get_settings
 from src.services.storage.interface import ContentRepositoryInterface
+from src.services.storage.embedding_cache import CachedEmbeddings
+from src.services.storage.article_store import ArticleStore, content_id_for
+from src.services.storage.keyword_index import KeywordIndex
+from src.services.storage.facets import FACETS, FacetIndex
+from src.services.storage.search_cache import SearchCache, SharedGeneration
+from src.services.chunking.chunker import get_chunker
 
 settings = get_settings()
 
+# Planned upsert of one article:
+# (content, new chunk documents, their ids, stale ids, metadata updates by id)
+Upsert = Tuple[Content, List[Document], List[str], List[str], Dict[str, dict]]
+
 
 class ChromaRepository(ContentRepositoryInterface):
     """Service for storing and retrieving content using ChromaDB."""
@@ -22,24 +38,49 @@ class ChromaRepository(ContentRepositoryInterface):
         """Initialize the ChromaRepository."""
         self.persist_dir = persist_dir or settings.chroma_persist_dir
         
-        # Initialize text splitter for proper chunking
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=settings.chunk_size,
-            chunk_overlap=settings.chunk_overlap,
-            separators=["\n\n", "\n", ". ", " ", ""]
+        # Chroma and the embedding model are synchronous; they run on a
+        # bounded pool so they never block the event loop
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.repository_workers,
+            thread_name_prefix="repository"
         )
         
-        # Initialize embeddings
+        # Shared with the analyzer, so an article analyzed before storing
+        # is not split again
+        self.chunker = get_chunker()
+        
+        # Initialize embeddings, cached by content hash
         self.embeddings = OpenAIEmbeddings(
             api_key=settings.openai_api_key
         )
+        if settings.embedding_cache_enabled:
+            self.embeddings = CachedEmbeddings(self.embeddings)
         
         try:
             # Create persist directory if it doesn't exist
             Path(self.persist_dir).mkdir(parents=True, exist_ok=True)
             
-            # Initialize ChromaDB client
-            self.chroma_client = chromadb.PersistentClient(path=self.persist_dir)
+            # Initialize ChromaDB client; the embedded client keeps its index
+            # in process memory, so several processes need a Chroma server
+            if settings.chroma_host:
+                self.chroma_client = chromadb.HttpClient(host=settings.chroma_host, port=settings.chroma_port)
+            else:
+                self.chroma_client = chromadb.PersistentClient(path=self.persist_dir)
+            
+            # Article-level fields live once per article, outside the chunks
+            self.article_store = ArticleStore(str(Path(self.persist_dir) / "articles.sqlite3"))
+            
+            # BM25 keyword index, kept in step with the article store
+            self.keyword_index = KeywordIndex(str(Path(self.persist_dir) / "keywords.sqlite3"))
+            
+            # Facet counters for the tag cloud, updated as articles are stored
+            self.facet_index = FacetIndex(str(Path(self.persist_dir) / "facets.sqlite3"))
+            
+            # Search results, invalidated by every write; the generation lives
+            # next to the articles so writes from other processes count too
+            self.search_cache = SearchCache(
+                shared_generation=SharedGeneration(str(Path(self.persist_dir) / "articles.sqlite3"))
+            ) if settings.search_cache_enabled else None
             
             # Initialize LangChain's Chroma with the client and collection name
             self.vectorstore = Chroma(
@@ -48,6 +89,9 @@ class ChromaRepository(ContentRepositoryInterface):
                 client=self.chroma_client
             )
             
+            # Raw collection handle for writes with precomputed embeddings
+            self.collection = self.chroma_client.get_collection("content")
+            
             # Initialize retriever
             self.retriever = self.vectorstore.as_retriever(
                 search_kwargs={"k": settings.max_results}
@@ -56,96 +100,678 @@ class ChromaRepository(ContentRepositoryInterface):
         except Exception as e:
             raise DatabaseError(f"Vector store initialization failed: {str(e)}")
 
+    async def _run(self, func: Callable, *args: Any) -> Any:
+        """Run a blocking call on the repository thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args))
+
+    async def close(self) -> None:
+        """Wait for pending calls, then close the article store and the embedding cache."""
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+        self.article_store.close()
+        self.keyword_index.close()
+        self.facet_index.close()
+        if self.search_cache is not None:
+            self.search_cache.close()
+        if isinstance(self.embeddings, CachedEmbeddings):
+            self.embeddings.close()
+
     def _create_document(self, content: Content) -> List[Document]:
-        """Create document for vector store."""
-        # Create document text combining important fields
-        doc_text = f"""Title: {content.title}
-        Summary: {content.summary}
-        Topics: {', '.join(content.topics)}
-        Keywords: {', '.join(content.keywords)}
-        Content: {content.content}"""
-        
-        # Split into chunks
-        chunks = self.text_splitter.split_text(doc_text)
-        
-        # Create documents with metadata
+        """Create chunk documents for vector store.
+        
+        Chunks carry the chunk text, the article's content id and the compact
+        fields search filters run on; the article itself is kept once in
+        the article store. The first chunk holds the title and analysis
+        fields, the rest the body text.
+        """
+        header = (
+            f"Title: {content.title}\n"
+            f"Summary: {content.summary}\n"
+            f"Topics: {', '.join(content.topics)}\n"
+            f"Keywords: {', '.join(content.keywords)}"
+        )
+        chunks = [header] + self.chunker.split(content.content)
+        metadata = self._chunk_metadata(content)
+        
         return [
-            Document(
-                page_content=chunk,
-                metadata={
-                    "url": content.url,
-                    "title": content.title,
-                    "source": content.source,
-                    "summary": content.summary,
-                    "content": content.content,
-                    "author": content.author,
-                    "published_at": str(content.published_at),
-                    "language": content.language,
-                    "sentiment": content.sentiment,
-                    "reading_time": content.reading_time,
-                    "topics": ", ".join(content.topics),
-                    "keywords": ", ".join(content.keywords)
-                }
-            ) for chunk in chunks
+            Document(page_content=chunk, metadata=dict(metadata))
+            for chunk in chunks
         ]
 
+    @staticmethod
+    def _chunk_metadata(content: Content) -> dict:
+        """Build the metadata stored with every chunk of an article."""
+        return {"content_id": content_id_for(content.url), **content.to_filter_metadata()}
+
+    @staticmethod
+    def _content_from_metadata(metadata: dict) -> Content:
+        """Rebuild content from a chunk in the legacy, denormalized layout."""
+        return Content(
+            url=metadata["url"],
+            title=metadata.get("title", ""),
+            source=metadata.get("source", ""),
+            content=metadata.get("content", ""),
+            summary=metadata.get("summary", ""),
+            author=metadata.get("author", ""),
+            published_at=metadata.get("published_at", ""),
+            language=metadata.get("language", ""),
+            sentiment=metadata.get("sentiment", "neutral"),
+            reading_time=metadata.get("reading_time", 0),
+            topics=metadata.get("topics", "").split(", ") if metadata.get("topics") else [],
+            keywords=metadata.get("keywords", "").split(", ") if metadata.get("keywords") else []
+        )
+
+    @staticmethod
+    def _chunk_id(content_id: str, index: int, text: str) -> str:
+        """Derive a deterministic chunk id from article, position and text."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+        return f"{content_id}:{index}:{digest}"
+
+    @staticmethod
+    def _metadata_update(stored: dict, metadata: dict) -> Optional[dict]:
+        """Return the metadata to write over a kept chunk, or None if unchanged.
+        
+        Chroma merges metadata on update and rejects None, so keys that are
+        no longer emitted (e.g. dropped topic slots) are blanked instead.
+        """
+        update = {**{key: "" for key in stored if key not in metadata}, **metadata}
+        return None if update == stored else update
+
+    def _plan_upsert(
+        self, content: Content
+    ) -> Tuple[List[Document], List[str], List[str], Dict[str, dict]]:
+        """Compare an article's chunks with the stored ones.
+        
+        Returns:
+            Tuple of the chunk documents to add, their ids, the ids of
+            stored chunks that no longer belong to the article and the new
+            metadata of kept chunks whose metadata changed.
+        """
+        documents = self._create_document(content)
+        content_id = content_id_for(content.url)
+        ids = [self._chunk_id(content_id, i, doc.page_content) for i, doc in enumerate(documents)]
+        
+        # Legacy chunks are matched by URL and replaced as well
+        stored = self.vectorstore.get(
+            where={"$or": [{"content_id": content_id}, {"url": content.url}]},
+            include=["metadatas"]
+        )
+        existing = dict(zip(stored["ids"], stored["metadatas"]))
+        
+        new = [(doc, id) for doc, id in zip(documents, ids) if id not in existing]
+        updates = {}
+        for doc, id in zip(documents, ids):
+            if id in existing:
+                update = self._metadata_update(existing[id] or {}, doc.metadata)
+                if update is not None:
+                    updates[id] = update
+        stale = sorted(set(existing).difference(ids))
+        return [doc for doc, _ in new], [id for _, id in new], stale, updates
+
+    def _update_metadata(self, updates: Dict[str, dict]) -> None:
+        """Rewrite the metadata of kept chunks without re-embedding them."""
+        if updates:
+            self.collection.update(ids=list(updates), metadatas=list(updates.values()))
+
+    def _apply_upsert(
+        self, documents: List[Document], ids: List[str], stale: List[str], updates: Dict[str, dict]
+    ) -> None:
+        """Add new chunks, then drop stale ones so an article never vanishes."""
+        if documents:
+            self.vectorstore.add_documents(documents, ids=ids)
+        self._update_metadata(updates)
+        if stale:
+            self.vectorstore.delete(ids=stale)
+
+    def _invalidate_search_cache(self) -> None:
+        """Make results cached before a write stale."""
+        if self.search_cache is not None:
+            self.search_cache.invalidate()
+
+    def _store_sync(self, content: Content) -> None:
+        """Upsert one article and its chunks; runs on the thread pool."""
+        documents, ids, stale, updates = self._plan_upsert(content)
+        self.article_store.upsert(content)
+        self.keyword_index.upsert(content)
+        self.facet_index.upsert(content)
+        self._apply_upsert(documents, ids, stale, updates)
+        self._invalidate_search_cache()
+
     async def store(self, content: Content) -> None:
-        """Store content in database."""
+        """Store content in database, replacing earlier versions of the URL.
+        
+        Unchanged chunks keep their ids and are not embedded again.
+        """
         try:
-            documents = self._create_document(content)
-            self.vectorstore.add_documents(documents)
+            await self._run(self._store_sync, content)
         except Exception as e:
             raise DatabaseError(f"Document storage failed: {str(e)}")
 
     async def store_multiple(self, contents: List[Content]) -> None:
-        """Store multiple content items in database."""
+        """Store multiple content items in database, replacing earlier versions.
+        
+        Items that fail are logged and skipped.
+        
+        Raises:
+            DatabaseError: If no item could be stored.
+        """
+        # The last occurrence of a URL wins
+        unique = list({content.url: content for content in contents}.values())
+        results = await self.store_batch(unique)
+        
+        failed = [result for result in results if not result.ok]
+        for result in failed:
+            logger.warning(f"Storing {result.url} failed: {result.error}")
+        if failed and len(failed) == len(results):
+            raise DatabaseError(f"Batch document storage failed: {failed[0].error}")
+
+    async def store_batch(self, contents: Union[Iterable[Content], AsyncIterable[Content]]) -> List[ProcessingResult]:
+        """Store content items through the streaming pipeline.
+        
+        Returns:
+            List[ProcessingResult]: One result per item, in input order.
+        """
+        return [result async for result in self.store_stream(contents)]
+
+    async def store_stream(
+        self,
+        contents: Union[Iterable[Content], AsyncIterable[Content]]
+    ) -> AsyncIterator[ProcessingResult]:
+        """Store content items as a stream, yielding one result per item.
+        
+        Chunks are embedded in token-budgeted batches while the previous
+        batch is written to Chroma. Queues between the stages are bounded,
+        so memory stays flat however many items are streamed. A failing
+        batch is retried item by item, so one bad article only fails itself.
+        Each URL should appear at most once per stream.
+        
+        Args:
+            contents: Content items, as a regular or an async iterable.
+            
+        Yields:
+            ProcessingResult: One result per item, in input order.
+            
+        Raises:
+            DatabaseError: If the pipeline itself fails.
+        """
+        batches = asyncio.Queue(maxsize=settings.ingest_queue_size)
+        embedded = asyncio.Queue(maxsize=settings.ingest_queue_size)
+        results = asyncio.Queue(maxsize=settings.embedding_batch_size)
+        stages = [
+            asyncio.create_task(self._run_stage(self._batch_stage(contents, batches), downstream=batches)),
+            asyncio.create_task(self._run_stage(self._embed_stage(batches, embedded), downstream=embedded)),
+            asyncio.create_task(self._run_stage(self._write_stage(embedded, results), downstream=results))
+        ]
+        try:
+            while (result := await results.get()) is not None:
+                yield result
+            for stage in stages:
+                if stage.done() and not stage.cancelled() and stage.exception():
+                    raise DatabaseError(f"Streaming storage failed: {str(stage.exception())}")
+        finally:
+            for stage in stages:
+                stage.cancel()
+
+    @staticmethod
+    async def _run_stage(stage, downstream: asyncio.Queue) -> None:
+        """Run a pipeline stage, then signal the end of its output downstream."""
         try:
-            all_documents = []
+            await stage
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            await downstream.put(None)
+            raise
+        await downstream.put(None)
+
+    @staticmethod
+    async def _iterate(contents: Union[Iterable[Content], AsyncIterable[Content]]) -> AsyncIterator[Content]:
+        """Iterate over a regular or an async iterable."""
+        if hasattr(contents, "__aiter__"):
+            async for content in contents:
+                yield content
+        else:
             for content in contents:
-                documents = self._create_document(content)
-                all_documents.extend(documents)
+                yield content
+
+    async def _batch_stage(self, contents, batches: asyncio.Queue) -> None:
+        """Plan upserts and group them into token-budgeted batches.
+        
+        Batch items are planned upserts, or failed results for items that
+        could not be planned.
+        """
+        batch, tokens, chunks = [], 0, 0
+        async for content in self._iterate(contents):
+            try:
+                item = (content, *await self._run(self._plan_upsert, content))
+                item_tokens = sum(self.chunker.count_tokens(doc.page_content) for doc in item[1])
+                item_chunks = len(item[1])
+            except Exception as e:
+                item = ProcessingResult(url=content.url, error=f"Document storage failed: {str(e)}")
+                item_tokens = item_chunks = 0
             
-            if all_documents:
-                self.vectorstore.add_documents(all_documents)
+            if batch and (tokens + item_tokens > settings.embedding_batch_tokens
+                          or chunks + item_chunks > settings.embedding_batch_size):
+                await batches.put(batch)
+                batch, tokens, chunks = [], 0, 0
+            batch.append(item)
+            tokens += item_tokens
+            chunks += item_chunks
+        
+        if batch:
+            await batches.put(batch)
+
+    async def _embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed chunk texts with the async embedding API."""
+        return await self.embeddings.aembed_documents(texts) if texts else []
+
+    async def _embed_batch(self, batch: list) -> list:
+        """Embed the new chunks of a batch in one call.
+        
+        Returns one list of vectors per batch item (None for failed items).
+        If the batch call fails, items are embedded one by one and an item
+        that still fails gets its exception instead of vectors.
+        """
+        upserts = [item for item in batch if not isinstance(item, ProcessingResult)]
+        try:
+            vectors = await self._embed_texts([doc.page_content for item in upserts for doc in item[1]])
         except Exception as e:
-            raise DatabaseError(f"Batch document storage failed: {str(e)}")
+            if len(upserts) == 1:
+                return [e if item is upserts[0] else None for item in batch]
+            per_item = []
+            for item in batch:
+                if isinstance(item, ProcessingResult):
+                    per_item.append(None)
+                    continue
+                try:
+                    per_item.append(await self._embed_texts([doc.page_content for doc in item[1]]))
+                except Exception as item_error:
+                    per_item.append(item_error)
+            return per_item
+        
+        per_item, position = [], 0
+        for item in batch:
+            if isinstance(item, ProcessingResult):
+                per_item.append(None)
+                continue
+            per_item.append(vectors[position:position + len(item[1])])
+            position += len(item[1])
+        return per_item
+
+    async def _embed_stage(self, batches: asyncio.Queue, embedded: asyncio.Queue) -> None:
+        """Embed batches while the write stage stores earlier ones."""
+        while (batch := await batches.get()) is not None:
+            await embedded.put((batch, await self._embed_batch(batch)))
+
+    def _write_upserts(self, upserts: List[Upsert], vectors: List[List[List[float]]]) -> None:
+        """Write articles and chunks with precomputed embeddings; runs on the thread pool."""
+        for content, *_ in upserts:
+            self.article_store.upsert(content)
+            self.keyword_index.upsert(content)
+            self.facet_index.upsert(content)
+        
+        documents = [doc for _, item_documents, *_ in upserts for doc in item_documents]
+        if documents:
+            self.collection.upsert(
+                ids=[id for _, _, ids, *_ in upserts for id in ids],
+                embeddings=[vector for item_vectors in vectors for vector in item_vectors],
+                documents=[doc.page_content for doc in documents],
+                metadatas=[doc.metadata for doc in documents]
+            )
+        
+        self._update_metadata({id: update for *_, updates in upserts for id, update in updates.items()})
+        
+        stale = [id for _, _, _, item_stale, _ in upserts for id in item_stale]
+        if stale:
+            self.collection.delete(ids=stale)
+        self._invalidate_search_cache()
 
-    async def search(self, query: str, limit: int = None) -> List[Content]:
-        """Search content in database."""
+    async def _write_batch(self, batch: list, vectors: list) -> List[ProcessingResult]:
+        """Write an embedded batch, isolating failures to single items."""
+        errors = {}
+        pending = []
+        for i, (item, item_vectors) in enumerate(zip(batch, vectors)):
+            if isinstance(item, ProcessingResult):
+                continue
+            if isinstance(item_vectors, Exception):
+                errors[i] = f"Embedding failed: {str(item_vectors)}"
+            else:
+                pending.append(i)
+        
         try:
-            # Get relevant documents using similarity search
-            relevant_docs = self.vectorstore.similarity_search(
-                query=query,
-                k=limit or settings.max_results
+            await self._run(self._write_upserts, [batch[i] for i in pending], [vectors[i] for i in pending])
+        except Exception as e:
+            if len(pending) == 1:
+                errors[pending[0]] = f"Document storage failed: {str(e)}"
+            else:
+                for i in pending:
+                    try:
+                        await self._run(self._write_upserts, [batch[i]], [vectors[i]])
+                    except Exception as item_error:
+                        errors[i] = f"Document storage failed: {str(item_error)}"
+        
+        results = []
+        for i, item in enumerate(batch):
+            if isinstance(item, ProcessingResult):
+                results.append(item)
+            elif i in errors:
+                results.append(ProcessingResult(url=item[0].url, error=errors[i]))
+            else:
+                results.append(ProcessingResult(url=item[0].url, content=item[0]))
+        return results
+
+    async def _write_stage(self, embedded: asyncio.Queue, results: asyncio.Queue) -> None:
+        """Write embedded batches and emit per-item results."""
+        while (item := await embedded.get()) is not None:
+            batch, vectors = item
+            for result in await self._write_batch(batch, vectors):
+                await results.put(result)
+
+    def _query_articles(
+        self,
+        query_vector: List[float],
+        wanted: int,
+        aggregation: str,
+        where: Optional[dict] = None
+    ) -> List[dict]:
+        """Fetch chunks and aggregate their scores per article.
+        
+        Starts with ``wanted * SEARCH_OVERFETCH_FACTOR`` chunks and doubles
+        the fetch until ``wanted`` distinct articles are found, the
+        collection is exhausted or SEARCH_MAX_CHUNKS is reached. ``where``
+        filters chunks inside Chroma.
+        
+        Returns:
+            List[dict]: Article hits sorted by score, each with ``content_id``,
+            ``score``, ``snippet``, ``embedding`` of the best chunk and, for
+            legacy chunks, their ``metadata``.
+        """
+        total = self.collection.count()
+        k = wanted * settings.search_overfetch_factor
+        while True:
+            k = min(k, total, settings.search_max_chunks)
+            if k <= 0:
+                return []
+            response = self.collection.query(
+                query_embeddings=[query_vector],
+                n_results=k,
+                where=where,
+                include=["documents", "metadatas", "distances", "embeddings"]
             )
             
-            if not relevant_docs:
-                return []
+            hits = {}
+            for document, metadata, distance, embedding in zip(
+                response["documents"][0], response["metadatas"][0],
+                response["distances"][0], response["embeddings"][0]
+            ):
+                metadata = metadata or {}
+                content_id = metadata.get("content_id")
+                if not content_id and metadata.get("url"):
+                    content_id = content_id_for(metadata["url"])
+                if not content_id:
+                    continue
+                
+                similarity = 1.0 / (1.0 + distance)
+                hit = hits.get(content_id)
+                if hit is None:
+                    # Chunks arrive best first, so the first one is the best match
+                    hits[content_id] = {
+                        "content_id": content_id,
+                        "score": similarity,
+                        "snippet": document,
+                        "embedding": embedding,
+                        "metadata": None if "content_id" in metadata else metadata
+                    }
+                elif aggregation == "sum":
+                    hit["score"] += similarity
+            
+            exhausted = len(response["ids"][0]) < k
+            if len(hits) >= wanted or exhausted or k >= total or k >= settings.search_max_chunks:
+                return sorted(hits.values(), key=lambda hit: hit["score"], reverse=True)
+            k *= 2
+
+    @staticmethod
+    def _diversify(hits: List[dict], limit: int, diversity: float) -> List[dict]:
+        """Reorder article hits by maximal marginal relevance.
+        
+        ``diversity`` weighs similarity to already selected articles against
+        relevance: 0 keeps the relevance order, 1 maximizes diversity.
+        """
+        embeddings = np.array([hit["embedding"] for hit in hits], dtype=float)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-12
+        relevance = np.array([hit["score"] for hit in hits])
+        relevance /= relevance.max() or 1.0
+        
+        selected = []
+        remaining = list(range(len(hits)))
+        while remaining and len(selected) < limit:
+            redundancy = (
+                (embeddings[remaining] @ embeddings[selected].T).max(axis=1)
+                if selected else np.zeros(len(remaining))
+            )
+            marginal = (1 - diversity) * relevance[remaining] - diversity * redundancy
+            selected.append(remaining.pop(int(np.argmax(marginal))))
+        return [hits[i] for i in selected]
+
+    def _snippet(self, text: str) -> str:
+        """Collapse whitespace and shorten a matched chunk."""
+        text = " ".join(text.split())
+        limit = settings.search_snippet_length
+        return text if len(text) <= limit else text[:limit].rsplit(" ", 1)[0] + "…"
+
+    def _vector_hits(
+        self,
+        query: str,
+        limit: int,
+        aggregation: str,
+        diversity: float,
+        filters: SearchFilters
+    ) -> List[dict]:
+        """Rank articles by embedding similarity to the query."""
+        query_vector = self.embeddings.embed_query(query)
+        
+        # MMR needs a larger candidate pool to pick diverse articles from
+        wanted = limit * 3 if diversity > 0 else limit
+        hits = self._query_articles(query_vector, wanted, aggregation, filters.to_where())
+        return self._diversify(hits, limit, diversity) if diversity > 0 and hits else hits
+
+    def _keyword_hits(self, query: str, limit: int, filters: SearchFilters) -> List[dict]:
+        """Rank articles by BM25 over the keyword index; needs no network call.
+        
+        The keyword index holds no metadata, so filters are applied to the
+        matched articles after an over-fetch.
+        """
+        fetch = limit if filters.is_empty() else limit * settings.search_overfetch_factor
+        hits = [
+            {"content_id": content_id, "score": score, "snippet": snippet, "metadata": None}
+            for content_id, score, snippet in self.keyword_index.search(query, fetch)
+        ]
+        if not filters.is_empty():
+            articles = self.article_store.get_many(hit["content_id"] for hit in hits)
+            hits = [
+                hit for hit in hits
+                if hit["content_id"] in articles and filters.matches(articles[hit["content_id"]])
+            ]
+        return hits[:limit]
+
+    @staticmethod
+    def _fuse(rankings: List[List[dict]], k: int) -> List[dict]:
+        """Merge rankings with reciprocal-rank fusion.
+        
+        Each article scores ``sum(1 / (k + rank))`` over the rankings it
+        appears in; its snippet comes from the first ranking that has it.
+        """
+        fused = {}
+        for ranking in rankings:
+            for rank, hit in enumerate(ranking, start=1):
+                entry = fused.setdefault(hit["content_id"], {**hit, "score": 0.0})
+                entry["score"] += 1.0 / (k + rank)
+        return sorted(fused.values(), key=lambda hit: hit["score"], reverse=True)
+
+    def _rank_sync(
+        self,
+        query: str,
+        limit: int,
+        aggregation: str,
+        diversity: float,
+        mode: str,
+        filters: SearchFilters
+    ) -> List[dict]:
+        """Rank the best ``limit`` articles for a query; runs on the thread pool.
+        
+        Hits are light: ids, scores and snippets, without article bodies.
+        """
+        if mode == "keyword":
+            hits = self._keyword_hits(query, limit, filters)
+        elif mode == "hybrid":
+            hits = self._fuse([
+                self._vector_hits(query, limit, aggregation, diversity, filters),
+                self._keyword_hits(query, limit * settings.search_overfetch_factor, filters)
+            ], settings.search_rrf_k)
+        else:
+            hits = self._vector_hits(query, limit, aggregation, diversity, filters)
+        
+        hits = hits[:limit]
+        for hit in hits:
+            hit.pop("embedding", None)
+        return hits
+
+    def _load_sync(self, hits: List[dict]) -> List[SearchResult]:
+        """Load the articles of ranked hits; runs on the thread pool."""
+        articles = self.article_store.get_many(
+            hit["content_id"] for hit in hits if hit["metadata"] is None
+        )
+        results = []
+        for hit in hits:
+            if hit["metadata"] is not None:
+                content = self._content_from_metadata(hit["metadata"])
+            elif hit["content_id"] in articles:
+                content = articles[hit["content_id"]]
+            else:
+                continue
+            results.append(SearchResult(
+                **content.model_dump(),
+                score=round(hit["score"], 6),
+                snippet=self._snippet(hit["snippet"])
+            ))
+        return results
+
+    async def _rank(
+        self,
+        query: str,
+        limit: Optional[int],
+        offset: int,
+        aggregation: Optional[str],
+        diversity: Optional[float],
+        mode: Optional[str],
+        filters: Optional[SearchFilters]
+    ) -> List[dict]:
+        """Rank results up to ``offset + limit`` and return those after ``offset``."""
+        hits = await self._run(
+            self._rank_sync,
+            query,
+            offset + (limit or settings.max_results),
+            aggregation or settings.search_aggregation,
+            settings.search_diversity if diversity is None else diversity,
+            mode or settings.search_mode,
+            filters or SearchFilters()
+        )
+        return hits[offset:]
+
+    async def search(
+        self,
+        query: str,
+        limit: int = None,
+        aggregation: Optional[str] = None,
+        diversity: Optional[float] = None,
+        mode: Optional[str] = None,
+        filters: Optional[SearchFilters] = None,
+        offset: int = 0
+    ) -> List[SearchResult]:
+        """Search content in database at article level.
+        
+        Args:
+            query: Search query.
+            limit: Number of distinct articles to return.
+            aggregation: How chunk scores combine per article, "max" or "sum".
+            diversity: MMR diversity weight between 0 and 1; 0 disables MMR.
+                Applies to the vector ranking.
+            mode: "vector" for embedding similarity, "keyword" for BM25 over
+                the local keyword index (no network call), or "hybrid" for
+                both merged by reciprocal-rank fusion.
+            filters: Structured filters on source, sentiment, language,
+                topics and publication date.
+            offset: Number of top-ranked articles to skip, for paging.
             
-            # Get unique content items from metadata
-            seen_urls = set()
-            contents = []
-            
-            for doc in relevant_docs:
-                url = doc.metadata.get("url")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    contents.append(Content(
-                        url=url,
-                        title=doc.metadata.get("title", ""),
-                        source=doc.metadata.get("source", ""),
-                        content=doc.metadata.get("content", ""),
-                        summary=doc.metadata.get("summary", ""),
-                        author=doc.metadata.get("author", ""),
-                        published_at=doc.metadata.get("published_at", ""),
-                        language=doc.metadata.get("language", ""),
-                        sentiment=doc.metadata.get("sentiment", "neutral"),
-                        reading_time=doc.metadata.get("reading_time", 0),
-                        topics=doc.metadata.get("topics", "").split(", ") if doc.metadata.get("topics") else [],
-                        keywords=doc.metadata.get("keywords", "").split(", ") if doc.metadata.get("keywords") else []
-                    ))
-            
-            return contents
+        Returns:
+            List[SearchResult]: Up to ``limit`` distinct articles with their
+            score and best matching snippet.
+        """
+        try:
+            key = None
+            if self.search_cache is not None:
+                key = self.search_cache.key(
+                    query, limit=limit or settings.max_results, offset=offset,
+                    aggregation=aggregation or settings.search_aggregation,
+                    diversity=settings.search_diversity if diversity is None else diversity,
+                    mode=mode or settings.search_mode,
+                    filters=(filters or SearchFilters()).model_dump(mode="json")
+                )
+                cached = self.search_cache.get(key)
+                if cached is not None:
+                    return cached
             
+            hits = await self._rank(query, limit, offset, aggregation, diversity, mode, filters)
+            results = await self._run(self._load_sync, hits)
+            if key is not None:
+                self.search_cache.set(key, results)
+            return results
+        except Exception as e:
+            raise SearchError(f"Search failed: {str(e)}")
+
+    async def search_stream(
+        self,
+        query: str,
+        limit: int = None,
+        aggregation: Optional[str] = None,
+        diversity: Optional[float] = None,
+        mode: Optional[str] = None,
+        filters: Optional[SearchFilters] = None,
+        offset: int = 0,
+        batch_size: int = 50
+    ) -> AsyncIterator[SearchResult]:
+        """Search like ``search``, loading and yielding articles in batches.
+        
+        Only the light ranking is held in memory; article bodies are read
+        ``batch_size`` at a time as the consumer advances.
+        """
+        try:
+            hits = await self._rank(query, limit, offset, aggregation, diversity, mode, filters)
+            for start in range(0, len(hits), batch_size):
+                for result in await self._run(self._load_sync, hits[start:start + batch_size]):
+                    yield result
+        except Exception as e:
+            raise SearchError(f"Search failed: {str(e)}")
+
+    async def stats(self) -> dict:
+        """Get hit rates of the search and embedding caches."""
+        stats = {}
+        if self.search_cache is not None:
+            stats["search_cache"] = self.search_cache.stats()
+        if isinstance(self.embeddings, CachedEmbeddings):
+            stats["embedding_cache"] = self.embeddings.stats()
+        return stats
+
+    async def facets(self, facets: List[str] = None, limit: int = None) -> Dict[str, List[FacetCount]]:
+        """Get the most frequent facet values over all stored content.
+        
+        Reads the incrementally maintained counters; no search is run.
+        """
+        try:
+            counts = await self._run(self.facet_index.top, facets or list(FACETS), limit or settings.facet_limit)
+            return {
+                facet: [FacetCount(value=value, count=count) for value, count in values]
+                for facet, values in counts.items()
+            }
         except Exception as e:
-            raise SearchError(f"Search failed: {str(e)}") 
\ No newline at end of file
+            raise SearchError(f"Facet lookup failed: {str(e)}")
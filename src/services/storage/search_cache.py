@@ -0,0 +1,216 @@
+"""Cache of search results with write invalidation."""
+import hashlib
+import importlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional
+
+from src.models.content import SearchResult
+from src.core.config import get_settings
+
+settings = get_settings()
+
+GENERATION_KEY = "search:generation"
+
+
+class SearchCacheBackend(ABC):
+    """Storage for cached search results.
+
+    Implement this to share the cache between processes (e.g. on Redis)
+    and point SEARCH_CACHE_BACKEND at the class as ``module:ClassName``.
+    The class is constructed with ``max_entries`` and ``ttl`` keywords.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Get a value, or None if it is missing or expired."""
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        """Store a value."""
+        pass
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Atomically increment a counter and return its new value."""
+        pass
+
+    def size(self) -> Optional[int]:
+        """Number of cached entries, if the backend can tell cheaply."""
+        return None
+
+
+class MemoryBackend(SearchCacheBackend):
+    """In-process LRU cache whose entries expire after ``ttl`` seconds.
+
+    Its generation counter is only seen by this process; pair it with a
+    SharedGeneration when other processes write to the same store.
+    """
+
+    def __init__(self, max_entries: int = None, ttl: int = None):
+        """Initialize the MemoryBackend."""
+        self.max_entries = max_entries or settings.search_cache_size
+        self.ttl = ttl or settings.search_cache_ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._counters = {}
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a value, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if time.monotonic() > expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def incr(self, key: str) -> int:
+        """Increment a counter and return its new value."""
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def size(self) -> int:
+        """Number of cached entries, including expired ones not yet evicted."""
+        with self._lock:
+            return len(self._entries)
+
+
+class SharedGeneration:
+    """Write generation kept in a SQLite row, shared by every process using the file."""
+
+    def __init__(self, path: str):
+        """Initialize the SharedGeneration."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS search_generation (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                value INTEGER NOT NULL
+            )"""
+        )
+        self._conn.execute("INSERT OR IGNORE INTO search_generation (id, value) VALUES (0, 0)")
+        self._conn.commit()
+
+    def get(self) -> int:
+        """Get the current generation."""
+        with self._lock:
+            return self._conn.execute("SELECT value FROM search_generation WHERE id = 0").fetchone()[0]
+
+    def incr(self) -> int:
+        """Atomically increment the generation and return its new value."""
+        with self._lock:
+            value = self._conn.execute(
+                "UPDATE search_generation SET value = value + 1 WHERE id = 0 RETURNING value"
+            ).fetchone()[0]
+            self._conn.commit()
+            return value
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _load_backend(path: str) -> SearchCacheBackend:
+    """Instantiate a backend from a ``module:ClassName`` path."""
+    module_name, _, class_name = path.partition(":")
+    backend_class = getattr(importlib.import_module(module_name), class_name)
+    return backend_class(max_entries=settings.search_cache_size, ttl=settings.search_cache_ttl)
+
+
+class SearchCache:
+    """Search results keyed on the normalized query and search parameters.
+
+    Every key includes a generation counter that writes bump, so results
+    cached before a write are never served after it; they simply age out.
+    With a SharedGeneration the counter also sees writes made by other
+    processes; otherwise it is kept in the backend.
+    """
+
+    def __init__(self, backend: SearchCacheBackend = None, shared_generation: SharedGeneration = None):
+        """Initialize the SearchCache."""
+        if backend is None:
+            backend = _load_backend(settings.search_cache_backend) if settings.search_cache_backend else MemoryBackend()
+        self.backend = backend
+        self.shared_generation = shared_generation
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Normalize a query so trivially different spellings share an entry."""
+        return " ".join(query.lower().split())
+
+    def key(self, query: str, **params) -> str:
+        """Build the cache key for a search under the current generation."""
+        payload = json.dumps(
+            [self.generation(), self.normalize(query), params],
+            sort_keys=True,
+            default=str
+        )
+        return "search:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def generation(self) -> int:
+        """Current write generation, shared through the backend when possible."""
+        if self.shared_generation is not None:
+            return self.shared_generation.get()
+        shared = self.backend.get(GENERATION_KEY)
+        return int(shared) if shared is not None else self._generation
+
+    def invalidate(self) -> None:
+        """Bump the generation so all cached results become stale."""
+        if self.shared_generation is not None:
+            self._generation = self.shared_generation.incr()
+        else:
+            self._generation = self.backend.incr(GENERATION_KEY)
+
+    def get(self, key: str) -> Optional[List[SearchResult]]:
+        """Get cached results, or None on a miss."""
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return [SearchResult.model_validate(item) for item in json.loads(value)]
+
+    def set(self, key: str, results: List[SearchResult]) -> None:
+        """Cache search results."""
+        self.backend.set(key, json.dumps([result.model_dump(mode="json") for result in results]))
+
+    def stats(self) -> dict:
+        """Get hit/miss counters, the number of entries and the generation."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": self.backend.size(),
+            "generation": self.generation()
+        }
+
+    def close(self) -> None:
+        """Close the shared generation, if any."""
+        if self.shared_generation is not None:
+            self.shared_generation.close()
@@ -1,15 +1,16 @@
 """Tests for API routes."""
+import json
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 from datetime import datetime
-from fastapi import HTTPException
 
 from src.main import app
-from src.models.content import Content
+from src.models.content import Content, FacetCount
+from src.models.job import Job, JobItem
 from src.core.exceptions import ContentExtractionError, ContentAnalysisError, SearchError
-from src.core.factory import get_extractor, get_analyzer, get_repository
+from src.core.factory import get_extractor, get_analyzer, get_repository, get_job_workers
 
 
 @pytest.fixture
@@ -167,6 +168,102 @@ async def test_search_content_with_limit(client, mock_services):
     assert data[1]["url"] == test_contents[1].url
 
 
+@pytest.mark.asyncio
+async def test_search_content_with_filters(client, mock_services):
+    """Test that filter parameters reach the repository."""
+    mock_services["repository"].search.return_value = []
+    
+    response = client.get(
+        "/api/search/content?query=test&source=a.com&source=b.com&topics=AI"
+        "&published_after=2025-01-01T00:00:00&published_before=2025-02-01T00:00:00"
+    )
+    
+    assert response.status_code == 200
+    filters = mock_services["repository"].search.call_args.kwargs["filters"]
+    assert filters.source == ["a.com", "b.com"]
+    assert filters.topics == ["AI"]
+    assert filters.published_after == datetime(2025, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_search_content_invalid_date_range(client, mock_services):
+    """Test that an empty date range is rejected."""
+    response = client.get(
+        "/api/search/content?query=test&published_after=2025-02-01T00:00:00&published_before=2025-01-01T00:00:00"
+    )
+    
+    assert response.status_code == 422
+    mock_services["repository"].search.assert_not_called()
+
+
+def _search_results(count: int) -> list:
+    """Build search results for pagination tests."""
+    return [
+        Content(url=f"https://example{i}.com", title=f"Test {i}", content=f"Content {i}", source="example.com")
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_content_cursor_pagination(client, mock_services):
+    """Test that a full page returns a cursor for the next one."""
+    mock_services["repository"].search.return_value = _search_results(3)
+    
+    response = client.get("/api/search/content?query=test&limit=2")
+    
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    cursor = response.headers["X-Next-Cursor"]
+    assert mock_services["repository"].search.call_args.args[1] == 3
+    
+    mock_services["repository"].search.return_value = _search_results(1)
+    response = client.get(f"/api/search/content?query=test&limit=2&cursor={cursor}")
+    
+    assert response.status_code == 200
+    assert "X-Next-Cursor" not in response.headers
+    assert mock_services["repository"].search.call_args.kwargs["offset"] == 2
+
+
+@pytest.mark.asyncio
+async def test_search_content_cursor_other_query(client, mock_services):
+    """Test that a cursor is rejected for a different search."""
+    mock_services["repository"].search.return_value = _search_results(3)
+    cursor = client.get("/api/search/content?query=test&limit=2").headers["X-Next-Cursor"]
+    
+    response = client.get(f"/api/search/content?query=other&limit=2&cursor={cursor}")
+    
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_content_fields_projection(client, mock_services):
+    """Test that fields limits the returned fields."""
+    mock_services["repository"].search.return_value = _search_results(1)
+    
+    response = client.get("/api/search/content?query=test&fields=title,score")
+    
+    assert response.status_code == 200
+    assert response.json() == [{"url": "https://example0.com", "title": "Test 0"}]
+    assert client.get("/api/search/content?query=test&fields=bogus").status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_search_content_ndjson(client, mock_services):
+    """Test streaming results as NDJSON."""
+    async def stream(query, limit, **kwargs):
+        for result in _search_results(3):
+            yield result
+    
+    mock_services["repository"].search_stream = stream
+    
+    response = client.get("/api/search/content?query=test&format=ndjson&fields=title")
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = response.text.strip().split("\n")
+    assert [json.loads(line)["title"] for line in lines] == ["Test 0", "Test 1", "Test 2"]
+
+
 @pytest.mark.asyncio
 async def test_search_content_empty_results(client, mock_services):
     """Test content search with no results."""
@@ -309,4 +406,122 @@ async def test_process_url_validation_error(client, mock_services):
     )
     
     assert response.status_code == 500
-    assert "Exactly one of 'url' or 'urls' must be provided" in response.json()["detail"] 
\ No newline at end of file
+    assert "Exactly one of 'url' or 'urls' must be provided" in response.json()["detail"] 
+
+
+@pytest.mark.asyncio
+async def test_search_facets(client, mock_services):
+    """Test the facet counts endpoint."""
+    mock_services["repository"].facets.return_value = {
+        "topics": [FacetCount(value="AI", count=3)]
+    }
+    
+    response = client.get("/api/search/facets?facet=topics&limit=5")
+    
+    assert response.status_code == 200
+    assert response.json() == {"topics": [{"value": "AI", "count": 3}]}
+    mock_services["repository"].facets.assert_called_once_with(["topics"], 5)
+
+
+@pytest.mark.asyncio
+async def test_search_stats(client, mock_services):
+    """Test the cache statistics endpoint."""
+    stats = {"search_cache": {"hits": 3, "misses": 1, "hit_rate": 0.75, "entries": 1, "generation": 2}}
+    mock_services["repository"].stats.return_value = stats
+    
+    response = client.get("/api/search/stats")
+    
+    assert response.status_code == 200
+    assert response.json() == stats
+
+
+@pytest.fixture
+def mock_jobs():
+    """Mock the job worker pool."""
+    jobs = AsyncMock()
+    app.dependency_overrides[get_job_workers] = lambda: jobs
+    yield jobs
+    app.dependency_overrides = {}
+
+
+@pytest.mark.asyncio
+async def test_create_job(client, mock_jobs):
+    """Test that jobs are queued and returned immediately."""
+    now = datetime.now()
+    mock_jobs.submit.return_value = Job(
+        id="abc", created_at=now, updated_at=now,
+        items=[JobItem(url="https://example.com/1"), JobItem(url="https://example.com/2")]
+    )
+    
+    response = client.post(
+        "/api/content/jobs",
+        json={"urls": ["https://example.com/1", "https://example.com/2"]}
+    )
+    
+    assert response.status_code == 202
+    assert response.json()["id"] == "abc"
+    assert response.json()["status"] == "pending"
+    mock_jobs.submit.assert_awaited_once_with(["https://example.com/1", "https://example.com/2"])
+
+
+@pytest.mark.asyncio
+async def test_create_job_invalid_request(client, mock_jobs):
+    """Test that a job needs exactly one of url or urls."""
+    response = client.post("/api/content/jobs", json={})
+    
+    assert response.status_code == 400
+    mock_jobs.submit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_job(client, mock_jobs):
+    """Test per-URL job status and results."""
+    now = datetime.now()
+    mock_jobs.get.return_value = Job(
+        id="abc", created_at=now, updated_at=now,
+        items=[
+            JobItem(url="https://example.com/1", status="done",
+                    content=Content(url="https://example.com/1", title="Test", content="Body", source="example.com")),
+            JobItem(url="https://example.com/2", status="failed", error="Failed to extract content")
+        ]
+    )
+    
+    response = client.get("/api/content/jobs/abc")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "completed"
+    assert data["items"][0]["content"]["title"] == "Test"
+    assert data["items"][1]["error"] == "Failed to extract content"
+
+
+@pytest.mark.asyncio
+async def test_get_job_not_found(client, mock_jobs):
+    """Test that unknown jobs return 404."""
+    mock_jobs.get.return_value = None
+    
+    response = client.get("/api/content/jobs/missing")
+    
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_process_urls_ndjson(client, mock_services):
+    """Test that batch processing streams one result per URL."""
+    mock_services["extractor"].extract_content.side_effect = lambda url: Content(
+        url=url, title="Test", content="Content", source="example.com"
+    )
+    mock_services["analyzer"].analyze_content.side_effect = lambda content: content
+    mock_services["repository"].store.side_effect = [None, SearchError("Store failed")]
+    
+    response = client.post(
+        "/api/content/process?format=ndjson",
+        json={"urls": ["https://example.com/1", "https://example.com/2"]}
+    )
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 2
+    assert sorted(line["error"] is None for line in lines) == [False, True]
+    mock_services["extractor"].extract_multiple.assert_not_awaited()
@@ -1,9 +1,41 @@
 """Tests for factory functions."""
 import pytest
-from src.core.factory import get_extractor, get_analyzer, get_repository
+from unittest.mock import AsyncMock, patch
+from src.core.config import get_settings
+from src.core.exceptions import DatabaseError
+from src.core.factory import (
+    get_extractor, get_analyzer, get_repository, get_job_workers, settings,
+    SERVICE_FACTORIES, init_services, shutdown_services
+)
+from src.main import app, lifespan
+from src.services.extraction.browser_pool import BrowserPool, get_browser_pool
+from src.services.extraction.http_extractor import get_http_client
 from src.services.extraction.extractor import PlaywrightExtractor
+from src.services.extraction.tiered_extractor import TieredExtractor
 from src.services.analysis.analyzer import OpenAIAnalyzer
 from src.services.storage.repository import ChromaRepository
+from src.services.jobs.workers import JobWorkers
+
+
+@pytest.fixture(autouse=True)
+def isolated_settings(tmp_path):
+    """Keep service databases in a temporary directory and provide an API key."""
+    with patch.object(settings, "chroma_persist_dir", str(tmp_path / "chroma")), \
+         patch.object(settings, "analysis_cache_path", str(tmp_path / "cache" / "analysis.sqlite3")), \
+         patch.object(settings, "embedding_cache_path", str(tmp_path / "cache" / "embeddings.sqlite3")), \
+         patch.object(settings, "job_queue_path", str(tmp_path / "jobs.sqlite3")), \
+         patch.object(settings, "openai_api_key", "sk-test"):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_service_cache():
+    """Start every test without cached service instances."""
+    for factory in SERVICE_FACTORIES:
+        factory.cache_clear()
+    yield
+    for factory in SERVICE_FACTORIES:
+        factory.cache_clear()
 
 
 def test_get_extractor():
@@ -21,4 +53,93 @@ def test_get_analyzer():
 def test_get_repository():
     """Test get_repository returns correct instance."""
     repository = get_repository()
-    assert isinstance(repository, ChromaRepository) 
\ No newline at end of file
+    assert isinstance(repository, ChromaRepository)
+
+
+def test_get_job_workers():
+    """Test get_job_workers shares the other service instances."""
+    workers = get_job_workers()
+    assert isinstance(workers, JobWorkers)
+    assert workers.repository is get_repository()
+
+
+def test_get_extractor_tiered():
+    """Test get_extractor returns the tiered extractor when configured."""
+    with patch.object(settings, "extraction_mode", "tiered"):
+        extractor = get_extractor()
+    assert isinstance(extractor, TieredExtractor)
+
+
+def test_services_are_singletons():
+    """Test factories return the same shared instance on every call."""
+    assert get_extractor() is get_extractor()
+    assert get_analyzer() is get_analyzer()
+    assert get_repository() is get_repository()
+
+
+def test_settings_are_cached():
+    """Test settings are parsed once and shared."""
+    assert get_settings() is get_settings()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_services():
+    """Test shutdown closes the shared instances and drops them."""
+    init_services()
+    services = [factory() for factory in SERVICE_FACTORIES]
+    
+    with patch.object(type(services[0]), "close", new_callable=AsyncMock) as close_extractor, \
+         patch.object(type(services[1]), "close", new_callable=AsyncMock) as close_analyzer, \
+         patch.object(type(services[2]), "close", new_callable=AsyncMock) as close_repository, \
+         patch.object(type(services[3]), "close", new_callable=AsyncMock) as close_workers:
+        await shutdown_services()
+    
+    close_extractor.assert_awaited_once()
+    close_analyzer.assert_awaited_once()
+    close_repository.assert_awaited_once()
+    close_workers.assert_awaited_once()
+    assert all(factory.cache_info().currsize == 0 for factory in SERVICE_FACTORIES)
+
+
+@pytest.mark.asyncio
+async def test_shutdown_closes_shared_clients():
+    """Test shutdown closes the HTTP client and browser pool and drops them."""
+    client = get_http_client()
+    pool = get_browser_pool()
+    
+    with patch.object(BrowserPool, "stop", new_callable=AsyncMock) as stop_pool:
+        await shutdown_services()
+    
+    assert client.is_closed
+    stop_pool.assert_awaited_once()
+    assert get_http_client() is not client
+    assert get_browser_pool() is not pool
+    await shutdown_services()
+
+
+@pytest.mark.asyncio
+async def test_lifespan_releases_resources_on_startup_failure():
+    """Test that a failing startup still closes what was already created."""
+    client = get_http_client()
+    get_browser_pool()
+    
+    with patch.object(BrowserPool, "stop", new_callable=AsyncMock) as stop_pool, \
+         patch("src.main.init_services", side_effect=DatabaseError("Vector store initialization failed")):
+        with pytest.raises(DatabaseError):
+            async with lifespan(app):
+                pass
+    
+    assert client.is_closed
+    stop_pool.assert_awaited_once()
+    assert get_http_client.cache_info().currsize == 0
+
+
+@pytest.mark.asyncio
+async def test_lifespan_starts_browser_pool_lazily():
+    """Test that startup does not launch Chromium before a page needs it."""
+    with patch.object(BrowserPool, "start", new_callable=AsyncMock) as start_pool, \
+         patch.object(settings, "job_workers", 0):
+        async with lifespan(app):
+            pass
+    
+    start_pool.assert_not_awaited()
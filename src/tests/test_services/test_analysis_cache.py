@@ -0,0 +1,78 @@
+"""Tests for the analysis cache."""
+import pytest
+from unittest.mock import patch
+from src.services.analysis.cache import AnalysisCache
+from src.models.analyze import ContentAnalysis
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache in a temporary directory."""
+    cache = AnalysisCache(path=str(tmp_path / "analysis.sqlite3"), ttl=60, max_entries=3)
+    yield cache
+    cache.close()
+
+
+def make_analysis(summary: str) -> ContentAnalysis:
+    """Create an analysis with the given summary."""
+    return ContentAnalysis(summary=summary, topics=["topic"], keywords=["key"], sentiment="neutral")
+
+
+def test_make_key_normalizes_whitespace():
+    """Test that formatting differences map to the same key."""
+    key = AnalysisCache.make_key("Breaking  news\n\ntoday ", "gpt-4o-mini", 0.0, "1")
+    assert key == AnalysisCache.make_key("Breaking news today", "gpt-4o-mini", 0.0, "1")
+
+
+def test_make_key_depends_on_parameters():
+    """Test that model, temperature and prompt version change the key."""
+    key = AnalysisCache.make_key("text", "gpt-4o-mini", 0.0, "1")
+    assert key != AnalysisCache.make_key("text", "gpt-4o", 0.0, "1")
+    assert key != AnalysisCache.make_key("text", "gpt-4o-mini", 0.5, "1")
+    assert key != AnalysisCache.make_key("text", "gpt-4o-mini", 0.0, "2")
+
+
+def test_get_and_set(cache):
+    """Test round trip and hit/miss counters."""
+    assert cache.get("key") is None
+    cache.set("key", make_analysis("Summary"))
+    
+    assert cache.get("key").summary == "Summary"
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "entries": 1}
+
+
+def test_persistence(tmp_path):
+    """Test that entries survive reopening the cache."""
+    path = str(tmp_path / "analysis.sqlite3")
+    cache = AnalysisCache(path=path, ttl=60, max_entries=10)
+    cache.set("key", make_analysis("Summary"))
+    cache.close()
+    
+    reopened = AnalysisCache(path=path, ttl=60, max_entries=10)
+    assert reopened.get("key").summary == "Summary"
+    reopened.close()
+
+
+def test_expired_entries_miss(cache):
+    """Test that entries older than the TTL are not returned."""
+    with patch("src.services.analysis.cache.time.time", return_value=1000.0):
+        cache.set("key", make_analysis("Summary"))
+    with patch("src.services.analysis.cache.time.time", return_value=1061.0):
+        assert cache.get("key") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction(cache):
+    """Test that the least recently used entry is evicted when full."""
+    for i, key in enumerate(["a", "b", "c"]):
+        with patch("src.services.analysis.cache.time.time", return_value=1000.0 + i):
+            cache.set(key, make_analysis(key))
+    with patch("src.services.analysis.cache.time.time", return_value=1010.0):
+        cache.get("a")
+    with patch("src.services.analysis.cache.time.time", return_value=1011.0):
+        cache.set("d", make_analysis("d"))
+        
+        assert cache.get("b") is None
+        assert cache.get("a").summary == "a"
+        assert cache.get("d").summary == "d"
+    assert cache.stats()["entries"] == 3
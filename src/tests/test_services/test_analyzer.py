@@ -1,25 +1,33 @@
 """Tests for content analyzer."""
+import asyncio
+import json
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
+from langchain.output_parsers import PydanticOutputParser
+from openai.lib._parsing import type_to_response_format_param
 from src.services.analysis.analyzer import OpenAIAnalyzer
 from src.models.content import Content
 from src.models.analysis import ContentAnalysis
+from src.models import analyze
 from src.core.exceptions import ContentAnalysisError
+from src.services.analysis.cache import AnalysisCache
 
 
 @pytest.fixture
 def analyzer():
     """Create analyzer instance with mocked dependencies."""
     with patch("src.services.analysis.analyzer.ChatOpenAI") as mock_chat, \
-         patch("src.services.analysis.analyzer.RecursiveCharacterTextSplitter") as mock_splitter, \
+         patch("src.services.analysis.analyzer.get_chunker") as mock_chunker, \
          patch("src.services.analysis.analyzer.PydanticOutputParser") as mock_parser, \
-         patch("src.services.analysis.analyzer.ChatPromptTemplate") as mock_prompt:
+         patch("src.services.analysis.analyzer.ChatPromptTemplate") as mock_prompt, \
+         patch("src.services.analysis.analyzer.settings.analysis_cache_enabled", False):
         
         # Configure mocks
         mock_chat.return_value = MagicMock()
-        text_splitter = MagicMock()
-        text_splitter.split_text = MagicMock(return_value=["Test chunk"])
-        mock_splitter.return_value = text_splitter
+        chunker = MagicMock()
+        chunker.split = MagicMock(return_value=["Test chunk"])
+        chunker.count_tokens = lambda text: len(text) // 4
+        mock_chunker.return_value = chunker
         
         mock_parser.return_value = MagicMock(
             parse=lambda x: ContentAnalysis(
@@ -82,7 +90,7 @@ async def test_analyze_content_success(analyzer):
 @pytest.mark.asyncio
 async def test_analyze_content_no_chunks(analyzer):
     """Test content analysis when no chunks are produced."""
-    analyzer.text_splitter.split_text = MagicMock(return_value=[])
+    analyzer.chunker.split = MagicMock(return_value=[])
     content = Content(
         url="http://test.com",
         title="Test",
@@ -218,4 +226,304 @@ async def test_analyze_multiple(analyzer, test_content):
         
         results = await analyzer.analyze_multiple(contents)
         assert len(results) == 2
-        assert mock_analyze.call_count == 2 
\ No newline at end of file
+        assert mock_analyze.call_count == 2 
+
+@pytest.mark.asyncio
+async def test_analyze_batch_reports_errors_in_order(analyzer):
+    """Test batch analysis returns per-item errors in input order."""
+    contents = [
+        Content(url=f"http://test{i}.com", title=f"Test {i}", content=f"Test content {i}", source=f"test{i}.com")
+        for i in range(3)
+    ]
+    analyzer.analysis_chain.ainvoke.side_effect = [
+        MagicMock(content="ok"),
+        Exception("Failed"),
+        MagicMock(content="ok")
+    ]
+    
+    results = await analyzer.analyze_batch(contents)
+    
+    assert [r.url for r in results] == [c.url for c in contents]
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[0].content.summary == "Test summary"
+    assert "Failed" in results[1].error
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch_concurrency_limit(analyzer):
+    """Test that no more than the configured number of analyses run at once."""
+    active = 0
+    peak = 0
+    
+    async def ainvoke_mock(text):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return MagicMock(content="ok")
+    
+    analyzer.analysis_chain.ainvoke.side_effect = ainvoke_mock
+    contents = [
+        Content(url=f"http://test{i}.com", title="Test", content="Test content", source="test.com")
+        for i in range(6)
+    ]
+    
+    results = await analyzer.analyze_batch(contents, concurrency=2)
+    
+    assert all(r.ok for r in results)
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_analyze_content_uses_cache(analyzer, tmp_path):
+    """Test that repeated analysis of the same text is served from the cache."""
+    analyzer.cache = AnalysisCache(path=str(tmp_path / "analysis.sqlite3"))
+    contents = [
+        Content(url=f"http://test{i}.com", title="Test", content="Test content", source="test.com")
+        for i in range(2)
+    ]
+    
+    first = await analyzer.analyze_content(contents[0])
+    second = await analyzer.analyze_content(contents[1])
+    
+    assert analyzer.analysis_chain.ainvoke.await_count == 1
+    assert second.summary == first.summary == "Test summary"
+    assert analyzer.cache.stats()["hits"] == 1
+    analyzer.cache.close()
+
+
+@pytest.mark.asyncio
+async def test_analyze_content_adaptive_short_text(analyzer):
+    """Test that short texts are analyzed whole in one call."""
+    analyzer.chunker.split = MagicMock(return_value=["Test", "content"])
+    content = Content(url="http://test.com", title="Test", content="Test content", source="test.com")
+    
+    with patch("src.services.analysis.analyzer.settings.analysis_mode", "adaptive"):
+        await analyzer.analyze_content(content)
+    
+    analyzer.analysis_chain.ainvoke.assert_awaited_once_with("Test content")
+
+
+@pytest.mark.asyncio
+async def test_analyze_content_first_chunk_mode(analyzer):
+    """Test that first_chunk mode only analyzes the first chunk."""
+    analyzer.chunker.split = MagicMock(return_value=["Test", "content"])
+    content = Content(url="http://test.com", title="Test", content="Test content", source="test.com")
+    
+    with patch("src.services.analysis.analyzer.settings.analysis_mode", "first_chunk"):
+        await analyzer.analyze_content(content)
+    
+    analyzer.analysis_chain.ainvoke.assert_awaited_once_with("Test")
+
+
+@pytest.mark.asyncio
+async def test_analyze_content_map_reduce(analyzer):
+    """Test that long texts are analyzed per section and merged."""
+    analyzer.map_chunker.split = MagicMock(return_value=["Section 1", "Section 2", "Section 3"])
+    analyzer.reduce_chain = AsyncMock()
+    analyzer.reduce_chain.ainvoke.return_value = MagicMock(content="merged")
+    content = Content(url="http://test.com", title="Test", content="x" * 100, source="test.com")
+    
+    with patch("src.services.analysis.analyzer.settings.analysis_mode", "adaptive"), \
+         patch("src.services.analysis.analyzer.settings.analysis_map_reduce_threshold", 10):
+        result = await analyzer.analyze_content(content)
+    
+    sections = sorted(call.args[0] for call in analyzer.analysis_chain.ainvoke.await_args_list)
+    assert sections == ["Section 1", "Section 2", "Section 3"]
+    analyzer.reduce_chain.ainvoke.assert_awaited_once()
+    assert "Test summary" in analyzer.reduce_chain.ainvoke.await_args.args[0]
+    # Reading times of the sections add up
+    assert result.reading_time == 15
+    assert result.summary == "Test summary"
+
+
+@pytest.mark.asyncio
+async def test_map_reduce_token_budget(analyzer):
+    """Test that sections over the budget are sampled evenly."""
+    sections = [f"Section {i}" for i in range(10)]
+    
+    with patch("src.services.analysis.analyzer.settings.analysis_map_token_budget",
+               3 * analyzer._estimate_tokens(sections[0])):
+        selected = analyzer._within_budget(sections)
+    
+    assert selected == ["Section 0", "Section 4", "Section 9"]
+
+
+def packed_response(*summaries, numbers=None) -> MagicMock:
+    """Build a packed chain response holding one numbered analysis per summary."""
+    numbers = numbers or range(1, len(summaries) + 1)
+    return MagicMock(content="```json\n" + json.dumps([
+        {"article": number, "summary": summary, "topics": ["packed"], "sentiment": "neutral",
+         "keywords": [], "reading_time": 1}
+        if summary else {"article": number, "summary": ["not", "a", "string"]}
+        for number, summary in zip(numbers, summaries)
+    ]) + "\n```")
+
+
+@pytest.fixture
+def short_contents():
+    """Create short contents eligible for packing."""
+    return [
+        Content(url=f"http://test{i}.com", title="Test", content=f"Short article {i}", source="test.com")
+        for i in range(3)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch_packs_short_contents(analyzer, short_contents):
+    """Test that short contents share one request."""
+    analyzer.packed_chain = AsyncMock()
+    analyzer.packed_chain.ainvoke.return_value = packed_response("Third", "First", "Second", numbers=[3, 1, 2])
+    
+    with patch("src.services.analysis.analyzer.settings.analysis_packing_enabled", True):
+        results = await analyzer.analyze_batch(short_contents)
+    
+    assert [r.content.summary for r in results] == ["First", "Second", "Third"]
+    analyzer.packed_chain.ainvoke.assert_awaited_once()
+    assert "=== Article 3 ===\nShort article 2" in analyzer.packed_chain.ainvoke.await_args.args[0]
+    analyzer.analysis_chain.ainvoke.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch_packing_falls_back(analyzer, short_contents):
+    """Test that items with an unusable packed analysis are analyzed one by one."""
+    analyzer.packed_chain = AsyncMock()
+    analyzer.packed_chain.ainvoke.return_value = packed_response("First", None, "Third")
+    
+    with patch("src.services.analysis.analyzer.settings.analysis_packing_enabled", True):
+        results = await analyzer.analyze_batch(short_contents)
+    
+    assert [r.content.summary for r in results] == ["First", "Test summary", "Third"]
+    assert analyzer.analysis_chain.ainvoke.await_count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("response", [
+    packed_response("First", "Second"),
+    packed_response("First", "Second", "Third", numbers=[1, 1, 2]),
+    MagicMock(content=json.dumps([{"summary": "First"}, {"summary": "Second"}, {"summary": "Third"}]))
+])
+async def test_analyze_batch_packing_rejects_unmatched_array(analyzer, short_contents, response):
+    """Test that a packed array not numbering every article once is discarded."""
+    analyzer.packed_chain = AsyncMock()
+    analyzer.packed_chain.ainvoke.return_value = response
+    
+    with patch("src.services.analysis.analyzer.settings.analysis_packing_enabled", True):
+        results = await analyzer.analyze_batch(short_contents)
+    
+    assert [r.content.summary for r in results] == ["Test summary"] * 3
+    assert analyzer.analysis_chain.ainvoke.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch_packing_request_fails(analyzer, short_contents):
+    """Test that a failed packed request falls back for the whole pack."""
+    analyzer.packed_chain = AsyncMock()
+    analyzer.packed_chain.ainvoke.side_effect = Exception("Invalid request")
+    
+    with patch("src.services.analysis.analyzer.settings.analysis_packing_enabled", True), \
+         patch("src.services.analysis.analyzer.settings.openai_max_retries", 0):
+        results = await analyzer.analyze_batch(short_contents)
+    
+    assert all(r.ok for r in results)
+    assert analyzer.analysis_chain.ainvoke.await_count == 3
+
+
+def test_pack_respects_budgets(analyzer):
+    """Test that long contents are left out and packs stay within budget."""
+    contents = [
+        Content(url=f"http://test{i}.com", title="Test", content="x" * size, source="test.com")
+        for i, size in enumerate([40, 40, 400, 40, 40])
+    ]
+    
+    with patch("src.services.analysis.analyzer.settings.analysis_packing_item_tokens", 50), \
+         patch("src.services.analysis.analyzer.settings.analysis_packing_max_tokens", 25):
+        packs = analyzer._pack(contents)
+    
+    assert packs == [[0, 1], [3, 4]]
+
+
+def test_format_instructions_built_once():
+    """Test that the prompt prefix is rendered once, not per call."""
+    with patch.object(PydanticOutputParser, "get_format_instructions",
+                      autospec=True, return_value="FORMAT") as get_format_instructions, \
+         patch("src.services.analysis.analyzer.settings.analysis_cache_enabled", False):
+        analyzer = OpenAIAnalyzer()
+        calls = get_format_instructions.call_count
+        prompt = analyzer.analysis_chain.middle[0]
+        first = prompt.format(text="First article")
+        prompt.format(text="Second article")
+    
+    assert calls == 1
+    assert get_format_instructions.call_count == 1
+    assert "FORMAT" in first and "First article" in first
+
+
+@pytest.mark.asyncio
+async def test_analyze_content_repairs_json(analyzer):
+    """Test that near-valid JSON is repaired instead of failing the analysis."""
+    analyzer.parser = PydanticOutputParser(pydantic_object=analyze.ContentAnalysis)
+    analyzer.analysis_chain.ainvoke.return_value = MagicMock(
+        content='```json\n{"summary": "Repaired", "topics": ["a", "b",], "sentiment": "neutral"\n```'
+    )
+    content = Content(url="http://test.com", title="Test", content="Test content", source="test.com")
+    
+    result = await analyzer.analyze_content(content)
+    
+    assert result.summary == "Repaired"
+    assert result.topics == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_analyze_content_structured_output(analyzer):
+    """Test results of a structured output chain, parsed or raw."""
+    analyzer.parser = PydanticOutputParser(pydantic_object=analyze.ContentAnalysis)
+    analyzer.analysis_chain.ainvoke.side_effect = [
+        {"raw": MagicMock(), "parsed": analyze.ContentAnalysisSchema(
+            title="Test", summary="Parsed", topics=[], sentiment="neutral", keywords=[], reading_time=1, author=""
+        ), "parsing_error": None},
+        {"raw": MagicMock(content='{"summary": "Raw",}'), "parsed": None, "parsing_error": ValueError()},
+        {"raw": MagicMock(content='```json\n{"summary": "Repaired"}\n```'),
+         "parsed": {"summary": ["not", "a", "string"]}, "parsing_error": None}
+    ]
+    contents = [
+        Content(url=f"http://test{i}.com", title="Test", content=f"Test content {i}", source="test.com")
+        for i in range(3)
+    ]
+    
+    results = [await analyzer.analyze_content(content) for content in contents]
+    
+    assert [r.summary for r in results] == ["Parsed", "Raw", "Repaired"]
+
+
+def test_structured_chain_uses_json_schema():
+    """Test that structured mode asks the model for the analysis schema."""
+    with patch("src.services.analysis.analyzer.ChatOpenAI") as mock_chat, \
+         patch("src.services.analysis.analyzer.settings.analysis_output_mode", "structured"), \
+         patch("src.services.analysis.analyzer.settings.analysis_cache_enabled", False):
+        analyzer = OpenAIAnalyzer()
+    
+    mock_chat.return_value.with_structured_output.assert_any_call(
+        analyze.ContentAnalysisSchema, method="json_schema", include_raw=True
+    )
+    assert "Format" not in analyzer.analysis_chain.middle[0].format(text="Article")
+
+
+def test_structured_schema_is_strict_compatible():
+    """Test that the structured response format uses only keywords strict mode accepts."""
+    response_format = type_to_response_format_param(analyze.ContentAnalysisSchema)
+    schema = response_format["json_schema"]["schema"]
+    
+    def keywords(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                yield key
+                yield from keywords(value)
+        elif isinstance(node, list):
+            for value in node:
+                yield from keywords(value)
+    
+    assert response_format["json_schema"]["strict"] is True
+    assert not {"default", "minItems", "maxItems"} & set(keywords(schema))
+    assert set(schema["required"]) == set(schema["properties"])
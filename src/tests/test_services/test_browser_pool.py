@@ -0,0 +1,99 @@
+"""Tests for the shared browser pool."""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from src.services.extraction.browser_pool import BrowserPool
+from src.core.exceptions import ContentExtractionError
+
+
+def make_browser():
+    """Create a mock browser that reports itself as connected."""
+    browser = MagicMock()
+    browser.is_connected = MagicMock(return_value=True)
+    browser.new_context = AsyncMock(side_effect=lambda **kwargs: AsyncMock())
+    browser.close = AsyncMock()
+    return browser
+
+
+@pytest.fixture
+def mock_playwright():
+    """Create mock playwright driver launching fresh mock browsers."""
+    playwright = MagicMock()
+    playwright.chromium.launch = AsyncMock(side_effect=lambda **kwargs: make_browser())
+    playwright.stop = AsyncMock()
+
+    starter = MagicMock()
+    starter.start = AsyncMock(return_value=playwright)
+
+    with patch("src.services.extraction.browser_pool.async_playwright", return_value=starter):
+        yield playwright
+
+
+@pytest.mark.asyncio
+async def test_start_launches_pool_size_browsers(mock_playwright):
+    """Test that starting the pool launches one browser per slot."""
+    pool = BrowserPool(size=3, max_pages=10)
+    await pool.start()
+
+    assert pool.started
+    assert mock_playwright.chromium.launch.await_count == 3
+
+    await pool.stop()
+    assert not pool.started
+    mock_playwright.stop.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_context_reuses_browser(mock_playwright):
+    """Test that contexts are created on the long-lived browser."""
+    pool = BrowserPool(size=1, max_pages=10)
+
+    async with pool.context() as first:
+        pass
+    async with pool.context() as second:
+        pass
+
+    assert mock_playwright.chromium.launch.await_count == 1
+    first.close.assert_awaited_once()
+    second.close.assert_awaited_once()
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_browser_recycled_after_max_pages(mock_playwright):
+    """Test that a browser is replaced after serving max_pages pages."""
+    pool = BrowserPool(size=1, max_pages=2)
+
+    for _ in range(3):
+        async with pool.context():
+            pass
+
+    assert mock_playwright.chromium.launch.await_count == 2
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_crashed_browser_replaced(mock_playwright):
+    """Test that a disconnected browser is relaunched on next use."""
+    pool = BrowserPool(size=1, max_pages=10)
+    await pool.start()
+
+    crashed = pool._slots[0].browser
+    crashed.is_connected.return_value = False
+
+    async with pool.context():
+        pass
+
+    assert pool._slots[0].browser is not crashed
+    assert mock_playwright.chromium.launch.await_count == 2
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_start_failure(mock_playwright):
+    """Test that launch failures are raised as extraction errors."""
+    mock_playwright.chromium.launch.side_effect = Exception("No browser")
+    pool = BrowserPool(size=1, max_pages=10)
+
+    with pytest.raises(ContentExtractionError, match="Browser pool startup failed: No browser"):
+        await pool.start()
+    assert not pool.started
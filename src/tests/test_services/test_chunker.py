@@ -0,0 +1,67 @@
+"""Tests for the token-aware chunker."""
+import pytest
+import tiktoken
+from unittest.mock import patch
+from src.services.chunking.chunker import TextChunker, get_chunker
+
+
+@pytest.fixture
+def byte_encoding():
+    """Create an offline encoding with one token per byte."""
+    return tiktoken.Encoding(
+        name="bytes",
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={}
+    )
+
+
+def test_chunks_fit_token_budget(byte_encoding):
+    """Test that chunks are filled up to, but not over, the token budget."""
+    chunker = TextChunker(chunk_tokens=50, overlap_tokens=0, encoding=byte_encoding)
+    text = "\n\n".join(f"Paragraph {i} " + "word " * 8 for i in range(20))
+    
+    chunks = chunker.split(text)
+    
+    assert len(chunks) > 1
+    assert all(chunker.count_tokens(chunk) <= 50 for chunk in chunks)
+    assert "".join(chunks).replace(" ", "").replace("\n", "") == text.replace(" ", "").replace("\n", "")
+
+
+def test_split_is_memoized(byte_encoding):
+    """Test that splitting the same text twice reuses the first result."""
+    chunker = TextChunker(chunk_tokens=50, overlap_tokens=0, encoding=byte_encoding)
+    text = "word " * 100
+    
+    with patch.object(chunker._splitter, "split_text", wraps=chunker._splitter.split_text) as split_text:
+        first = chunker.split(text)
+        second = chunker.split(text)
+    
+    assert first == second
+    assert split_text.call_count == 1
+    assert (chunker.hits, chunker.misses) == (1, 1)
+
+
+def test_cache_is_bounded(byte_encoding):
+    """Test that the least recently split texts are evicted."""
+    chunker = TextChunker(chunk_tokens=50, overlap_tokens=0, encoding=byte_encoding, cache_size=2)
+    for text in ("a", "b", "c"):
+        chunker.split(text)
+    
+    chunker.split("a")
+    
+    assert chunker.misses == 4
+
+
+def test_estimate_without_encoding():
+    """Test the fallback estimate when no tokenizer can be loaded."""
+    with patch("src.services.chunking.chunker.load_encoding", return_value=None):
+        chunker = TextChunker(chunk_tokens=50, overlap_tokens=0)
+    
+    assert chunker.count_tokens("x" * 40) == 10
+
+
+def test_get_chunker_is_shared():
+    """Test that services asking for the same chunk size share a chunker."""
+    assert get_chunker() is get_chunker()
+    assert get_chunker(100) is not get_chunker()
@@ -0,0 +1,108 @@
+"""Tests for the embedding cache."""
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+from langchain_core.embeddings import Embeddings
+from src.services.storage.embedding_cache import CachedEmbeddings
+
+
+class CountingEmbeddings(Embeddings):
+    """Fake embedding model recording every call."""
+
+    model = "fake-embedding"
+
+    def __init__(self):
+        self.calls = []
+
+    def _vector(self, text: str) -> list:
+        return [float(len(text)), 0.5, -1.25]
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [self._vector(text) for text in texts]
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts):
+        return self.embed_documents(texts)
+
+
+@pytest.fixture
+def model():
+    """Create the fake embedding model."""
+    return CountingEmbeddings()
+
+
+@pytest.fixture
+def cached(model, tmp_path):
+    """Create a cached embedder in a temporary directory."""
+    embeddings = CachedEmbeddings(model, path=str(tmp_path / "embeddings.sqlite3"), query_cache_size=2)
+    yield embeddings
+    embeddings.close()
+
+
+def test_embed_documents_batches_only_misses(cached, model):
+    """Test that only uncached, unique texts reach the model in one call."""
+    cached.embed_documents(["alpha", "beta"])
+    vectors = cached.embed_documents(["alpha", "gamma", "gamma", "beta"])
+    
+    assert model.calls == [["alpha", "beta"], ["gamma"]]
+    assert vectors == [[5.0, 0.5, -1.25], [5.0, 0.5, -1.25], [5.0, 0.5, -1.25], [4.0, 0.5, -1.25]]
+
+
+def test_embed_query_served_from_memory(cached, model):
+    """Test that repeated queries skip the model and the disk store."""
+    cached.embed_query("tag query")
+    cached.store.get_many = MagicMock(side_effect=AssertionError("disk lookup"))
+    
+    assert cached.embed_query("tag query") == [9.0, 0.5, -1.25]
+    assert len(model.calls) == 1
+
+
+def test_query_cache_thread_safe(cached):
+    """Test that concurrent queries keep the LRU bounded and consistent."""
+    queries = [f"query {i % 5}" for i in range(400)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        vectors = list(pool.map(cached.embed_query, queries))
+    
+    assert vectors == [[7.0, 0.5, -1.25]] * len(queries)
+    assert len(cached._queries) == 2
+    assert cached.hits + cached.misses >= len(queries)
+
+
+def test_vectors_persist_across_instances(model, tmp_path):
+    """Test that vectors are read back from disk as float32."""
+    path = str(tmp_path / "embeddings.sqlite3")
+    first = CachedEmbeddings(model, path=path)
+    first.embed_documents(["persisted"])
+    first.close()
+    
+    second = CachedEmbeddings(model, path=path)
+    assert second.embed_documents(["persisted"]) == [[9.0, 0.5, -1.25]]
+    assert len(model.calls) == 1
+    second.close()
+
+
+def test_model_name_is_part_of_key(model, tmp_path):
+    """Test that vectors of different models do not mix."""
+    path = str(tmp_path / "embeddings.sqlite3")
+    first = CachedEmbeddings(model, path=path)
+    first.embed_documents(["text"])
+    first.close()
+    
+    other = CountingEmbeddings()
+    other.model = "other-embedding"
+    second = CachedEmbeddings(other, path=path)
+    second.embed_documents(["text"])
+    assert other.calls == [["text"]]
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_async_embeddings(cached, model):
+    """Test async document and query embedding through the cache."""
+    await cached.aembed_documents(["alpha"])
+    assert await cached.aembed_query("alpha") == [5.0, 0.5, -1.25]
+    assert model.calls == [["alpha"]]
+    assert cached.stats()["hits"] == 1
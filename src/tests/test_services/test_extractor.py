@@ -1,18 +1,16 @@
 """Tests for content extractor."""
+import asyncio
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock, call
-from src.services.extraction.extractor import PlaywrightExtractor
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch, MagicMock
+from datetime import datetime, timezone
+from src.services.extraction.extractor import PlaywrightExtractor, READABILITY_SCRIPT
+from src.services.extraction.blocking import ResourceBlockPolicy
 from src.core.exceptions import ContentExtractionError
 from src.models.content import Content
+from src.core.config import get_settings
 
-
-@pytest.fixture
-def extractor():
-    """Create extractor instance with mocked dependencies."""
-    with patch("src.services.extraction.extractor.RecursiveCharacterTextSplitter") as mock_splitter:
-        # Configure text splitter mock
-        mock_splitter.return_value = MagicMock()
-        return PlaywrightExtractor()
+extractor_settings = get_settings()
 
 
 @pytest.fixture
@@ -20,62 +18,52 @@ def mock_page():
     """Create mock page with default successful responses."""
     page = AsyncMock()
     
-    # Create a mock evaluate function that returns different values based on input
-    async def evaluate_mock(script):
-        if script == "document.title":
-            return "Test Title"
-        elif "getElementsByTagName" in script:
-            return "Test Content"
-        return None
-    
-    page.evaluate = AsyncMock(side_effect=evaluate_mock)
+    page.evaluate = AsyncMock(return_value={
+        "title": "Test Title",
+        "byline": "",
+        "published": "",
+        "content": "Test Content"
+    })
     page.goto = AsyncMock()
     return page
 
 
 @pytest.fixture
-def mock_browser(mock_page):
-    """Create mock browser that returns our mock page."""
-    browser = AsyncMock()
-    browser.new_page = AsyncMock(return_value=mock_page)
-    browser.close = AsyncMock()
-    return browser
+def mock_context(mock_page):
+    """Create mock browser context that returns our mock page."""
+    context = AsyncMock()
+    context.new_page = AsyncMock(return_value=mock_page)
+    return context
 
 
 @pytest.fixture
-def mock_playwright_context(mock_browser):
-    """Create mock playwright context."""
-    context = MagicMock()
-    context.chromium.launch = AsyncMock(return_value=mock_browser)
-    return context
+def mock_pool(mock_context):
+    """Create mock browser pool handing out our mock context."""
+    @asynccontextmanager
+    async def context():
+        yield mock_context
+    
+    pool = MagicMock()
+    pool.context = context
+    return pool
 
 
 @pytest.fixture
-def mock_playwright(mock_playwright_context):
-    """Create mock playwright."""
-    async def aenter():
-        return mock_playwright_context
-    
-    async def aexit(*args):
-        pass
-    
-    playwright = AsyncMock()
-    playwright.__aenter__ = AsyncMock(side_effect=aenter)
-    playwright.__aexit__ = AsyncMock(side_effect=aexit)
-    return playwright
+def extractor(mock_pool):
+    """Create extractor instance with mocked dependencies."""
+    return PlaywrightExtractor(browser_pool=mock_pool)
 
 
 def test_initialization():
     """Test extractor initialization."""
-    with patch("src.services.extraction.extractor.RecursiveCharacterTextSplitter") as mock_splitter:
-        extractor = PlaywrightExtractor()
-        assert mock_splitter.called
-        assert extractor.text_splitter == mock_splitter.return_value
+    pool = MagicMock()
+    extractor = PlaywrightExtractor(browser_pool=pool)
+    assert extractor.browser_pool is pool
 
 
 def test_extract_domain():
     """Test domain extraction from URL."""
-    extractor = PlaywrightExtractor()
+    extractor = PlaywrightExtractor(browser_pool=MagicMock())
     test_cases = [
         ("https://example.com", "example.com"),
         ("http://sub.example.com/path", "sub.example.com"),
@@ -87,77 +75,95 @@ def test_extract_domain():
 
 
 @pytest.mark.asyncio
-async def test_extract_content_success(extractor, mock_playwright):
+async def test_extract_content_success(extractor, mock_context, mock_page):
     """Test successful content extraction."""
-    with patch("src.services.extraction.extractor.async_playwright", return_value=mock_playwright):
-        content = await extractor.extract_content("https://example.com")
-        
-        assert content.url == "https://example.com"
-        assert content.title == "Test Title"
-        assert content.content == "Test Content"
-        assert content.source == "example.com"
+    content = await extractor.extract_content("https://example.com")
+    
+    assert content.url == "https://example.com"
+    assert content.title == "Test Title"
+    assert content.content == "Test Content"
+    assert content.source == "example.com"
+    mock_context.new_page.assert_awaited_once()
+    mock_page.goto.assert_awaited_once_with(
+        "https://example.com",
+        wait_until=extractor_settings.page_wait_until,
+        timeout=extractor_settings.page_timeout_ms
+    )
+    mock_page.evaluate.assert_awaited_once_with(READABILITY_SCRIPT)
 
 
 @pytest.mark.asyncio
-async def test_extract_content_empty_title(extractor, mock_playwright, mock_page):
-    """Test content extraction with empty title."""
-    async def evaluate_mock(script):
-        if script == "document.title":
-            return ""  # Empty title
-        elif "getElementsByTagName" in script:
-            return "Test Content"
-        return None
+async def test_extract_content_byline_and_published(extractor, mock_page):
+    """Test byline and publish date are mapped onto the content."""
+    mock_page.evaluate = AsyncMock(return_value={
+        "title": "Test Title",
+        "byline": "Jane Reporter",
+        "published": "2025-02-23T14:30:00Z",
+        "content": "Test Content"
+    })
     
-    mock_page.evaluate = AsyncMock(side_effect=evaluate_mock)
+    content = await extractor.extract_content("https://example.com")
     
-    with patch("src.services.extraction.extractor.async_playwright", return_value=mock_playwright):
-        with pytest.raises(ContentExtractionError, match="Failed to extract content: Empty title or content"):
-            await extractor.extract_content("https://example.com")
+    assert content.author == "Jane Reporter"
+    assert content.published_at == datetime(2025, 2, 23, 14, 30, tzinfo=timezone.utc)
+
+
+def test_parse_published_invalid(extractor):
+    """Test that unparseable publish dates are ignored."""
+    assert extractor._parse_published("") is None
+    assert extractor._parse_published("last Tuesday") is None
 
 
 @pytest.mark.asyncio
-async def test_extract_content_empty_content(extractor, mock_playwright, mock_page):
-    """Test content extraction with empty content."""
-    async def evaluate_mock(script):
-        if script == "document.title":
-            return "Test Title"
-        elif "getElementsByTagName" in script:
-            return ""  # Empty content
-        return None
+async def test_extract_content_empty_title(extractor, mock_page):
+    """Test content extraction with empty title."""
+    mock_page.evaluate = AsyncMock(return_value={
+        "title": "",  # Empty title
+        "content": "Test Content"
+    })
     
-    mock_page.evaluate = AsyncMock(side_effect=evaluate_mock)
+    with pytest.raises(ContentExtractionError, match="Failed to extract content: Empty title or content"):
+        await extractor.extract_content("https://example.com")
+
+
+@pytest.mark.asyncio
+async def test_extract_content_empty_content(extractor, mock_page):
+    """Test content extraction with empty content."""
+    mock_page.evaluate = AsyncMock(return_value={
+        "title": "Test Title",
+        "content": ""  # Empty content
+    })
     
-    with patch("src.services.extraction.extractor.async_playwright", return_value=mock_playwright):
-        with pytest.raises(ContentExtractionError, match="Failed to extract content: Empty title or content"):
-            await extractor.extract_content("https://example.com")
+    with pytest.raises(ContentExtractionError, match="Failed to extract content: Empty title or content"):
+        await extractor.extract_content("https://example.com")
 
 
 @pytest.mark.asyncio
-async def test_extract_content_page_error(extractor, mock_playwright, mock_page):
+async def test_extract_content_page_error(extractor, mock_page):
     """Test content extraction when page evaluation fails."""
     async def evaluate_mock(script):
         raise Exception("Failed to evaluate page")
     
     mock_page.evaluate = AsyncMock(side_effect=evaluate_mock)
     
-    with patch("src.services.extraction.extractor.async_playwright", return_value=mock_playwright):
-        with pytest.raises(ContentExtractionError, match="Failed to extract content: Failed to evaluate page"):
-            await extractor.extract_content("https://example.com")
+    with pytest.raises(ContentExtractionError, match="Failed to extract content: Failed to evaluate page"):
+        await extractor.extract_content("https://example.com")
 
 
 @pytest.mark.asyncio
-async def test_extract_content_browser_error(extractor):
-    """Test content extraction when browser launch fails."""
-    async def aenter():
+async def test_extract_content_browser_error():
+    """Test content extraction when the browser pool fails."""
+    @asynccontextmanager
+    async def context():
         raise Exception("Browser error")
+        yield
     
-    mock_playwright = AsyncMock()
-    mock_playwright.__aenter__ = AsyncMock(side_effect=aenter)
-    mock_playwright.__aexit__ = AsyncMock()
+    pool = MagicMock()
+    pool.context = context
+    extractor = PlaywrightExtractor(browser_pool=pool)
     
-    with patch("src.services.extraction.extractor.async_playwright", return_value=mock_playwright):
-        with pytest.raises(ContentExtractionError, match="Failed to extract content: Browser error"):
-            await extractor.extract_content("https://example.com")
+    with pytest.raises(ContentExtractionError, match="Failed to extract content: Browser error"):
+        await extractor.extract_content("https://example.com")
 
 
 @pytest.mark.asyncio
@@ -213,4 +219,119 @@ async def test_extract_multiple_all_fail(extractor):
         
         contents = await extractor.extract_multiple(urls)
         assert len(contents) == 0
-        assert mock_extract.call_count == 2 
\ No newline at end of file
+        assert mock_extract.call_count == 2 
+
+@pytest.mark.asyncio
+async def test_extract_batch_preserves_order_and_reports_failures(extractor):
+    """Test that batch results keep input order and carry per-URL errors."""
+    urls = ["https://slow.com", "https://broken.com", "https://fast.com"]
+    delays = {"https://slow.com": 0.05, "https://fast.com": 0}
+    
+    async def extract_mock(url):
+        if url == "https://broken.com":
+            raise ContentExtractionError("Page crashed")
+        await asyncio.sleep(delays[url])
+        return Content(url=url, title="Title", content="Content", source=url)
+    
+    with patch.object(extractor, "extract_content", side_effect=extract_mock):
+        results = await extractor.extract_batch(urls)
+    
+    assert [r.url for r in results] == urls
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[0].content.url == "https://slow.com"
+    assert results[1].content is None
+    assert "Page crashed" in results[1].error
+
+
+@pytest.mark.asyncio
+async def test_extract_batch_concurrency_limits(extractor):
+    """Test global and per-host concurrency caps."""
+    urls = [f"https://a.com/{i}" for i in range(4)] + [f"https://b.com/{i}" for i in range(4)]
+    active = {"total": 0, "a.com": 0, "b.com": 0}
+    peak = {"total": 0, "a.com": 0, "b.com": 0}
+    
+    async def extract_mock(url):
+        host = extractor._extract_domain(url)
+        for key in ("total", host):
+            active[key] += 1
+            peak[key] = max(peak[key], active[key])
+        await asyncio.sleep(0.01)
+        for key in ("total", host):
+            active[key] -= 1
+        return Content(url=url, title="Title", content="Content", source=host)
+    
+    with patch.object(extractor, "extract_content", side_effect=extract_mock):
+        results = await extractor.extract_batch(urls, concurrency=3, per_host_concurrency=1)
+    
+    assert all(r.ok for r in results)
+    assert peak["total"] <= 3
+    assert peak["a.com"] == 1
+    assert peak["b.com"] == 1
+
+
+@pytest.mark.asyncio
+async def test_extract_batch_host_delay(extractor):
+    """Test minimum delay between page loads on the same host."""
+    urls = ["https://a.com/1", "https://a.com/2", "https://a.com/3"]
+    starts = []
+    
+    async def extract_mock(url):
+        starts.append(asyncio.get_running_loop().time())
+        return Content(url=url, title="Title", content="Content", source="a.com")
+    
+    with patch.object(extractor, "extract_content", side_effect=extract_mock):
+        await extractor.extract_batch(urls, per_host_concurrency=3, host_delay=0.02)
+    
+    gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+    assert all(gap >= 0.019 for gap in gaps)
+
+
+@pytest.mark.asyncio
+async def test_extract_content_registers_route_interception(mock_pool, mock_context):
+    """Test that the blocking policy is installed on the context."""
+    policy = ResourceBlockPolicy(resource_types=["image"])
+    extractor = PlaywrightExtractor(browser_pool=mock_pool, resource_policy=policy)
+    
+    await extractor.extract_content("https://example.com")
+    
+    mock_context.route.assert_awaited_once_with("**/*", policy.handle)
+
+
+@pytest.mark.asyncio
+async def test_extract_content_without_blocking(mock_pool, mock_context):
+    """Test that no interception is installed when nothing is blocked."""
+    extractor = PlaywrightExtractor(browser_pool=mock_pool, resource_policy=ResourceBlockPolicy())
+    
+    await extractor.extract_content("https://example.com")
+    
+    mock_context.route.assert_not_awaited()
+
+
+def test_resource_policy_should_block():
+    """Test blocking by resource type and by domain, including subdomains."""
+    policy = ResourceBlockPolicy(resource_types=["image", "font"], domains=["doubleclick.net"])
+    
+    assert policy.should_block("image", "https://example.com/photo.jpg")
+    assert policy.should_block("script", "https://ad.doubleclick.net/tag.js")
+    assert policy.should_block("xhr", "https://doubleclick.net/ping")
+    assert not policy.should_block("script", "https://notdoubleclick.net/app.js")
+    assert not policy.should_block("document", "https://example.com/article")
+
+
+@pytest.mark.asyncio
+async def test_resource_policy_handle():
+    """Test that blocked routes are aborted and others continued."""
+    policy = ResourceBlockPolicy(resource_types=["media"])
+    
+    blocked = AsyncMock()
+    blocked.request = MagicMock(resource_type="media", url="https://example.com/video.mp4")
+    allowed = AsyncMock()
+    allowed.request = MagicMock(resource_type="document", url="https://example.com/")
+    
+    await policy.handle(blocked)
+    await policy.handle(allowed)
+    
+    blocked.abort.assert_awaited_once()
+    blocked.continue_.assert_not_awaited()
+    allowed.continue_.assert_awaited_once()
+    allowed.abort.assert_not_awaited()
@@ -0,0 +1,190 @@
+"""Tests for HTTP and tiered content extraction."""
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.services.extraction.http_extractor import HttpExtractor
+from src.services.extraction.tiered_extractor import TieredExtractor, TierMemory, BROWSER_TIER, HTTP_TIER
+from src.services.extraction.readability import extract_article
+from src.core.exceptions import ContentExtractionError, RenderingRequiredError
+from src.models.content import Content
+
+PARAGRAPH = "The council approved the transit budget on Tuesday, after months of debate, officials said."
+
+ARTICLE_HTML = f"""<!DOCTYPE html>
+<html>
+<head>
+  <title>Transit budget | Example News</title>
+  <meta name="author" content="Jane Reporter">
+  <meta property="article:published_time" content="2025-02-23T14:30:00Z">
+</head>
+<body>
+  <nav><a href="/">Home and all the other sections of the site</a></nav>
+  <div class="sidebar"><p>Sidebar promotion text that should never be extracted.</p></div>
+  <main><div class="wrap"><div class="wrap"><article>
+    <h1>Council approves transit budget</h1>
+    <div class="article-body">
+      {"".join(f"<p>{PARAGRAPH} Part {i}.</p>" for i in range(8))}
+    </div>
+  </article></div></div></main>
+  <section class="comments"><p>A reader comment that is long enough to be a block.</p></section>
+  <footer><p>Copyright Example News, all rights reserved worldwide.</p></footer>
+</body>
+</html>"""
+
+APP_SHELL_HTML = """<!DOCTYPE html>
+<html><head><title>App</title></head>
+<body><div id="root"></div><noscript>Please enable JavaScript to view this site.</noscript>
+<script src="/bundle.js"></script></body></html>"""
+
+
+def make_client(handler) -> httpx.AsyncClient:
+    """Create an HTTP client answering requests with the given handler."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def html_response(body: str, status_code: int = 200) -> httpx.Response:
+    """Create an HTML response."""
+    return httpx.Response(status_code, text=body, headers={"content-type": "text/html; charset=utf-8"})
+
+
+def test_extract_article_main_content():
+    """Test readability extraction keeps the article and drops boilerplate."""
+    article = extract_article(ARTICLE_HTML)
+
+    assert article["title"] == "Council approves transit budget"
+    assert article["byline"] == "Jane Reporter"
+    assert article["published"] == "2025-02-23T14:30:00Z"
+    assert article["content"].count(PARAGRAPH) == 8
+    assert "Sidebar" not in article["content"]
+    assert "reader comment" not in article["content"]
+    assert "Copyright" not in article["content"]
+
+
+def test_extract_article_no_duplicated_text():
+    """Test nested text is emitted once regardless of DOM depth."""
+    nested = "<div>" * 50 + f"<p>{PARAGRAPH} <b><i>{PARAGRAPH}</i></b></p>" + "</div>" * 50
+    article = extract_article(f"<html><body>{nested}</body></html>")
+
+    assert article["content"].count(PARAGRAPH) == 2
+
+
+def test_extract_article_without_positive_candidate():
+    """Test that all blocks are kept when no container scores above zero."""
+    links = "".join(f'<p><a href="/{i}">{PARAGRAPH}</a></p>' for i in range(3))
+    article = extract_article(f"<html><body><div>{links}</div><section>{links}</section></body></html>")
+
+    assert article["content"].count(PARAGRAPH) == 6
+
+
+def test_extract_article_empty_document():
+    """Test unparseable documents return None."""
+    assert extract_article("") is None
+
+
+@pytest.mark.asyncio
+async def test_http_extract_content_success():
+    """Test successful extraction of a server-rendered page."""
+    extractor = HttpExtractor(client=make_client(lambda request: html_response(ARTICLE_HTML)))
+
+    content = await extractor.extract_content("https://example.com/news")
+
+    assert content.title == "Council approves transit budget"
+    assert content.author == "Jane Reporter"
+    assert content.source == "example.com"
+    assert content.published_at.year == 2025
+
+
+@pytest.mark.asyncio
+async def test_http_extract_content_js_rendered():
+    """Test that app shells require browser rendering."""
+    extractor = HttpExtractor(client=make_client(lambda request: html_response(APP_SHELL_HTML)))
+
+    with pytest.raises(RenderingRequiredError, match="requires JavaScript rendering"):
+        await extractor.extract_content("https://example.com/app")
+
+
+@pytest.mark.asyncio
+async def test_http_extract_content_http_error():
+    """Test that HTTP errors are raised as extraction errors."""
+    extractor = HttpExtractor(client=make_client(lambda request: html_response("Forbidden", 403)))
+
+    with pytest.raises(ContentExtractionError, match="Failed to fetch content"):
+        await extractor.extract_content("https://example.com/news")
+
+
+@pytest.mark.asyncio
+async def test_http_extract_content_not_html():
+    """Test that non-HTML responses are rejected."""
+    client = make_client(lambda request: httpx.Response(200, json={"a": 1}))
+    extractor = HttpExtractor(client=client)
+
+    with pytest.raises(ContentExtractionError, match="not HTML"):
+        await extractor.extract_content("https://example.com/api")
+
+
+@pytest.fixture
+def test_content():
+    """Create test content."""
+    return Content(url="https://example.com/news", title="Title", content="Content", source="example.com")
+
+
+@pytest.fixture
+def tiers():
+    """Create mocked HTTP and browser tiers."""
+    return MagicMock(http=AsyncMock(), browser=AsyncMock())
+
+
+@pytest.mark.asyncio
+async def test_tiered_uses_http_first(tiers, test_content):
+    """Test that the browser is not used when HTTP extraction works."""
+    tiers.http.extract_content.return_value = test_content
+    memory = TierMemory()
+    extractor = TieredExtractor(http_extractor=tiers.http, browser_extractor=tiers.browser, tier_memory=memory)
+
+    content = await extractor.extract_content("https://example.com/news")
+
+    assert content is test_content
+    tiers.browser.extract_content.assert_not_awaited()
+    assert memory.get("example.com") == HTTP_TIER
+
+
+@pytest.mark.asyncio
+async def test_tiered_escalates_and_remembers(tiers, test_content):
+    """Test escalation to the browser and skipping HTTP on later fetches."""
+    tiers.http.extract_content.side_effect = RenderingRequiredError("needs JS")
+    tiers.browser.extract_content.return_value = test_content
+    memory = TierMemory()
+    extractor = TieredExtractor(http_extractor=tiers.http, browser_extractor=tiers.browser, tier_memory=memory)
+
+    await extractor.extract_content("https://example.com/one")
+    await extractor.extract_content("https://example.com/two")
+
+    assert tiers.http.extract_content.await_count == 1
+    assert tiers.browser.extract_content.await_count == 2
+    assert memory.get("example.com") == BROWSER_TIER
+
+
+@pytest.mark.asyncio
+async def test_tiered_both_tiers_fail(tiers):
+    """Test that failures of both tiers are raised and not remembered."""
+    tiers.http.extract_content.side_effect = ContentExtractionError("HTTP failed")
+    tiers.browser.extract_content.side_effect = ContentExtractionError("Browser failed")
+    memory = TierMemory()
+    extractor = TieredExtractor(http_extractor=tiers.http, browser_extractor=tiers.browser, tier_memory=memory)
+
+    with pytest.raises(ContentExtractionError, match="Browser failed"):
+        await extractor.extract_content("https://example.com/news")
+    assert memory.get("example.com") is None
+
+
+def test_tier_memory_bounded():
+    """Test that the tier memory evicts the least recently used domains."""
+    memory = TierMemory(max_domains=2)
+    memory.remember("a.com", HTTP_TIER)
+    memory.remember("b.com", HTTP_TIER)
+    memory.remember("a.com", BROWSER_TIER)
+    memory.remember("c.com", HTTP_TIER)
+
+    assert memory.get("b.com") is None
+    assert memory.get("a.com") == BROWSER_TIER
+    assert memory.get("c.com") == HTTP_TIER
@@ -0,0 +1,190 @@
+"""Tests for the ingestion job queue and workers."""
+import asyncio
+import sqlite3
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+from src import worker
+from src.core.exceptions import DatabaseError
+from src.models.content import Content
+from src.services.jobs.queue import JobQueue
+from src.services.jobs.workers import JobWorkers
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """Create a job queue in a temporary directory."""
+    queue = JobQueue(path=str(tmp_path / "jobs.sqlite3"), lease=60, max_attempts=2)
+    yield queue
+    queue.close()
+
+
+@pytest.fixture
+def content():
+    """Create processed content."""
+    return Content(
+        url="https://example.com/1",
+        title="Test Article",
+        content="Body",
+        source="example.com"
+    )
+
+
+def test_enqueue_and_claim_in_order(queue):
+    """Test that items are claimed oldest first, each only once."""
+    job = queue.enqueue(["https://example.com/1", "https://example.com/2"])
+    
+    assert job.status == "pending"
+    assert queue.claim() == (job.id, 0, "https://example.com/1")
+    assert queue.claim() == (job.id, 1, "https://example.com/2")
+    assert queue.claim() is None
+    assert queue.get(job.id).status == "running"
+
+
+def test_complete_and_fail(queue, content):
+    """Test that per-item results and errors are kept."""
+    job = queue.enqueue(["https://example.com/1", "https://example.com/2"])
+    queue.claim()
+    queue.claim()
+    
+    queue.complete(job.id, 0, content)
+    queue.fail(job.id, 1, "Failed to extract content")
+    
+    job = queue.get(job.id)
+    assert job.status == "completed"
+    assert [item.status for item in job.items] == ["done", "failed"]
+    assert job.items[0].content == content
+    assert job.items[1].error == "Failed to extract content"
+
+
+def test_expired_claims_are_retried(queue):
+    """Test that items of a dead worker are retried up to max_attempts."""
+    job = queue.enqueue(["https://example.com/1"])
+    queue.claim()
+    now = time.time()
+    
+    with patch("src.services.jobs.queue.time.time", return_value=now + 100):
+        assert queue.claim() == (job.id, 0, "https://example.com/1")
+    with patch("src.services.jobs.queue.time.time", return_value=now + 200):
+        assert queue.claim() is None
+    
+    item = queue.get(job.id).items[0]
+    assert item.status == "failed"
+    assert item.error == "Gave up after 2 attempts"
+
+
+def test_queue_survives_restart(tmp_path):
+    """Test that queued and released items are claimed after reopening."""
+    path = str(tmp_path / "jobs.sqlite3")
+    queue = JobQueue(path=path)
+    job = queue.enqueue(["https://example.com/1"])
+    queue.claim()
+    queue.release(job.id, 0)
+    queue.close()
+    
+    queue = JobQueue(path=path)
+    assert queue.claim() == (job.id, 0, "https://example.com/1")
+    queue.close()
+
+
+def test_get_unknown_job(queue):
+    """Test that unknown jobs are reported as missing."""
+    assert queue.get("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_workers_process_jobs(queue, content):
+    """Test that workers run the pipeline and record each URL's outcome."""
+    extractor = AsyncMock()
+    extractor.extract_content.side_effect = [content, None]
+    analyzer = AsyncMock()
+    analyzer.analyze_content.side_effect = lambda item: item
+    repository = AsyncMock()
+    workers = JobWorkers(extractor, analyzer, repository, queue=queue, workers=1, poll_interval=0.01)
+    
+    workers.start()
+    job = await workers.submit(["https://example.com/1", "https://example.com/2"])
+    for _ in range(100):
+        if (await workers.get(job.id)).status == "completed":
+            break
+        await asyncio.sleep(0.01)
+    
+    job = await workers.get(job.id)
+    assert [item.status for item in job.items] == ["done", "failed"]
+    assert job.items[1].error == "Failed to extract content"
+    repository.store.assert_awaited_once_with(content)
+    
+    await workers.close()
+
+
+def fail_once(method):
+    """Wrap a queue method so its first call raises a locked-database error."""
+    calls = []
+    
+    def wrapper(*args):
+        calls.append(args)
+        if len(calls) == 1:
+            raise sqlite3.OperationalError("database is locked")
+        return method(*args)
+    return wrapper
+
+
+@pytest.mark.asyncio
+async def test_workers_survive_queue_errors(queue, content):
+    """Test that failing queue calls are logged and backed off instead of killing a worker."""
+    extractor = AsyncMock()
+    extractor.extract_content.return_value = content
+    analyzer = AsyncMock()
+    analyzer.analyze_content.side_effect = lambda item: item
+    workers = JobWorkers(extractor, analyzer, AsyncMock(), queue=queue, workers=1, poll_interval=0.01)
+    
+    with patch.object(queue, "claim", side_effect=fail_once(queue.claim)), \
+         patch.object(queue, "complete", side_effect=fail_once(queue.complete)) as mock_complete:
+        workers.start()
+        await workers.submit(["https://example.com/1"])
+        job = await workers.submit(["https://example.com/2"])
+        for _ in range(100):
+            if (await workers.get(job.id)).status == "completed":
+                break
+            await asyncio.sleep(0.01)
+    
+    assert (await workers.get(job.id)).items[0].status == "done"
+    assert mock_complete.call_count == 2
+    assert not workers._tasks[0].done()
+    
+    await workers.close()
+
+
+@pytest.mark.asyncio
+async def test_workers_release_items_on_close(tmp_path, content):
+    """Test that an item interrupted by shutdown goes back to the queue."""
+    queue = JobQueue(path=str(tmp_path / "jobs.sqlite3"))
+    started = asyncio.Event()
+    
+    async def extract(url):
+        started.set()
+        await asyncio.sleep(60)
+    
+    extractor = AsyncMock()
+    extractor.extract_content.side_effect = extract
+    workers = JobWorkers(extractor, AsyncMock(), AsyncMock(), queue=queue, workers=1, poll_interval=0.01)
+    workers.start()
+    job = await workers.submit(["https://example.com/1"])
+    await started.wait()
+    
+    await workers.close()
+    
+    queue = JobQueue(path=str(tmp_path / "jobs.sqlite3"))
+    assert queue.get(job.id).items[0].status == "pending"
+    queue.close()
+
+
+@pytest.mark.asyncio
+async def test_standalone_worker_requires_chroma_server():
+    """Test that a standalone worker refuses to share an embedded Chroma store."""
+    with patch("src.worker.settings.chroma_host", ""), \
+         patch("src.worker.init_services") as mock_init:
+        with pytest.raises(DatabaseError):
+            await worker.main()
+    
+    mock_init.assert_not_called()
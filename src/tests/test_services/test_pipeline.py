@@ -0,0 +1,66 @@
+"""Tests for the streaming processing pipeline."""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+from src.models.content import Content
+from src.core.exceptions import ContentAnalysisError
+from src.services.jobs.pipeline import ProcessingPipeline
+
+
+def make_content(url: str) -> Content:
+    """Create extracted content for a URL."""
+    return Content(url=url, title="Test Article", content="Body", source="example.com")
+
+
+@pytest.mark.asyncio
+async def test_results_per_url():
+    """Test that every URL gets a result and failures stop at their stage."""
+    extractor = AsyncMock()
+    extractor.extract_content.side_effect = lambda url: None if url.endswith("/2") else make_content(url)
+    analyzer = AsyncMock()
+    
+    async def analyze(content):
+        if content.url.endswith("/3"):
+            raise ContentAnalysisError("Analysis failed")
+        return content
+    
+    analyzer.analyze_content.side_effect = analyze
+    repository = AsyncMock()
+    pipeline = ProcessingPipeline(extractor, analyzer, repository)
+    
+    urls = [f"https://example.com/{i}" for i in range(1, 5)]
+    results = {result.url: result async for result in pipeline.process(urls)}
+    
+    assert set(results) == set(urls)
+    assert results["https://example.com/1"].ok and results["https://example.com/4"].ok
+    assert results["https://example.com/2"].error == "Failed to extract content"
+    assert results["https://example.com/3"].error == "Analysis failed"
+    assert repository.store.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stages_overlap():
+    """Test that a URL is stored before the next one has been extracted."""
+    first_stored = asyncio.Event()
+    
+    async def extract(url):
+        if url.endswith("/2"):
+            # Would time out if extraction had to finish for all URLs first
+            await asyncio.wait_for(first_stored.wait(), 1)
+        return make_content(url)
+    
+    async def store(content):
+        first_stored.set()
+    
+    extractor = AsyncMock()
+    extractor.extract_content.side_effect = extract
+    analyzer = AsyncMock()
+    analyzer.analyze_content.side_effect = lambda content: content
+    repository = AsyncMock()
+    repository.store.side_effect = store
+    pipeline = ProcessingPipeline(extractor, analyzer, repository)
+    
+    results = [result async for result in pipeline.process(["https://example.com/1", "https://example.com/2"])]
+    
+    assert [result.url for result in results] == ["https://example.com/1", "https://example.com/2"]
+    assert all(result.ok for result in results)
@@ -0,0 +1,113 @@
+"""Tests for LLM rate limiting and retries."""
+import asyncio
+import time
+import httpx
+import openai
+import pytest
+from unittest.mock import AsyncMock, patch
+from src.services.analysis.rate_limit import TokenBucket, RateLimiter, is_retryable, with_retries
+
+
+def api_error(status_code: int) -> openai.APIStatusError:
+    """Create an OpenAI API error with the given HTTP status."""
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status_code, request=request)
+    return openai.APIStatusError("API error", response=response, body=None)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_up_to_capacity():
+    """Test that a full bucket serves its capacity without waiting."""
+    bucket = TokenBucket(capacity=5, refill_rate=1)
+    started = time.monotonic()
+    for _ in range(5):
+        await bucket.acquire()
+    assert time.monotonic() - started < 0.05
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_for_refill():
+    """Test that an empty bucket waits for tokens to refill."""
+    bucket = TokenBucket(capacity=2, refill_rate=50)
+    await bucket.acquire(2)
+    started = time.monotonic()
+    await bucket.acquire(1)
+    assert time.monotonic() - started >= 0.015
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_caps_oversized_requests():
+    """Test that a request larger than the bucket does not wait forever."""
+    bucket = TokenBucket(capacity=10, refill_rate=1)
+    await asyncio.wait_for(bucket.acquire(100), timeout=0.5)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waiters_sleep_concurrently():
+    """Test that waiters do not queue up behind one sleeping waiter."""
+    bucket = TokenBucket(capacity=10, refill_rate=20)
+    await bucket.acquire(10)
+    large = asyncio.create_task(bucket.acquire(10))
+    await asyncio.sleep(0)
+    
+    # A waiter holding the lock while sleeping would delay this for 0.5s
+    started = time.monotonic()
+    await bucket.acquire(1)
+    assert time.monotonic() - started < 0.25
+    large.cancel()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_zero_limits_are_unlimited():
+    """Test that limits configured as zero do not throttle or fail."""
+    limiter = RateLimiter(requests_per_minute=0, tokens_per_minute=0)
+    await asyncio.wait_for(limiter.acquire(10_000), timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_takes_request_and_tokens():
+    """Test that the limiter draws from both buckets."""
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=1000)
+    await limiter.acquire(400)
+    assert limiter.requests._tokens == pytest.approx(59, abs=0.1)
+    assert limiter.tokens._tokens == pytest.approx(600, abs=1)
+
+
+def test_is_retryable():
+    """Test which errors are retried."""
+    assert is_retryable(api_error(429))
+    assert is_retryable(api_error(503))
+    assert not is_retryable(api_error(400))
+    assert not is_retryable(ValueError("bad"))
+
+
+@pytest.mark.asyncio
+async def test_with_retries_recovers_from_rate_limit():
+    """Test that 429 errors are retried until the call succeeds."""
+    call = AsyncMock(side_effect=[api_error(429), api_error(500), "ok"])
+    with patch("src.services.analysis.rate_limit.asyncio.sleep", new_callable=AsyncMock) as sleep:
+        result = await with_retries(call, max_retries=3, base_delay=1, max_delay=10)
+    
+    assert result == "ok"
+    assert call.await_count == 3
+    assert sleep.await_count == 2
+    assert all(0 <= c.args[0] <= 2 for c in sleep.await_args_list)
+
+
+@pytest.mark.asyncio
+async def test_with_retries_gives_up():
+    """Test that retries stop after max_retries."""
+    call = AsyncMock(side_effect=api_error(429))
+    with patch("src.services.analysis.rate_limit.asyncio.sleep", new_callable=AsyncMock):
+        with pytest.raises(openai.APIStatusError):
+            await with_retries(call, max_retries=2, base_delay=1, max_delay=10)
+    assert call.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_with_retries_does_not_retry_client_errors():
+    """Test that non-retryable errors are raised immediately."""
+    call = AsyncMock(side_effect=api_error(400))
+    with pytest.raises(openai.APIStatusError):
+        await with_retries(call, max_retries=5, base_delay=1, max_delay=10)
+    assert call.await_count == 1
@@ -0,0 +1,24 @@
+"""Tests for the JSON repair of model output."""
+import json
+import pytest
+from src.services.analysis.repair import repair_json
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('```json\n{"summary": "A", "topics": ["x", "y",],}\n```', {"summary": "A", "topics": ["x", "y"]}),
+    ('Here is the analysis:\n{"author": None, "ok": True}\nHope this helps!', {"author": None, "ok": True}),
+    ('{"summary": "A summary that got cut', {"summary": "A summary that got cut"}),
+    ('[{"summary": "A"}, {"topics": ["x"', [{"summary": "A"}, {"topics": ["x"]}]),
+    ('{“summary”: “A”}', {"summary": "A"}),
+    ('{"summary": "True story, None of it"}', {"summary": "True story, None of it"}),
+])
+def test_repair_json(text, expected):
+    """Test that common defects of model output are fixed."""
+    assert json.loads(repair_json(text)) == expected
+
+
+def test_valid_json_is_unchanged():
+    """Test that valid JSON passes through."""
+    text = '{"summary": "A {braced} [bracketed] \\"quoted\\" text", "topics": []}'
+    
+    assert repair_json(text) == text
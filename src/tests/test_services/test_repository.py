@@ -1,19 +1,26 @@
 """Tests for content repository."""
+import asyncio
+import time
 import pytest
 import pytest_asyncio
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import patch
 from datetime import datetime
-from langchain.schema import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
 from src.services.storage.repository import ChromaRepository
-from src.models.content import Content
+from src.services.storage.article_store import content_id_for
+from src.services.storage.migration import backfill_filter_metadata, migrate_legacy_layout, rebuild_indexes
+from src.models.content import Content, SearchFilters
 from src.core.exceptions import DatabaseError, SearchError
 
 
 @pytest_asyncio.fixture(scope="function")
-async def repository():
-    """Create repository instance."""
-    with patch("chromadb.PersistentClient"):
-        return ChromaRepository()
+async def repository(tmp_path):
+    """Create a repository with a mocked Chroma client in a temporary directory."""
+    with patch("chromadb.PersistentClient"), \
+         patch("src.services.storage.repository.settings.embedding_cache_enabled", False):
+        repository = ChromaRepository(persist_dir=str(tmp_path / "chroma"))
+    yield repository
+    await repository.close()
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -52,48 +59,473 @@ async def test_store_content_failure(repository, test_content):
 
 
 @pytest.mark.asyncio
-async def test_store_multiple_success(repository, test_content):
-    """Test storing multiple content items."""
-    contents = [test_content, test_content]
+async def test_chroma_server_client(tmp_path):
+    """Test that a configured Chroma server is used instead of the embedded client."""
+    with patch("chromadb.HttpClient") as mock_http, \
+         patch("chromadb.PersistentClient") as mock_persistent, \
+         patch("src.services.storage.repository.settings.chroma_host", "chroma"), \
+         patch("src.services.storage.repository.settings.chroma_port", 8001), \
+         patch("src.services.storage.repository.settings.embedding_cache_enabled", False):
+        repository = ChromaRepository(persist_dir=str(tmp_path / "chroma"))
     
-    with patch.object(repository.vectorstore, "add_documents") as mock_add:
-        await repository.store_multiple(contents)
-        assert mock_add.called
+    mock_http.assert_called_once_with(host="chroma", port=8001)
+    mock_persistent.assert_not_called()
+    await repository.close()
 
 
 @pytest.mark.asyncio
 async def test_search_success(repository):
     """Test successful content search."""
     now = datetime.now()
-    test_docs = [
-        Document(
-            page_content="Test content",
-            metadata={
-                "url": "https://example.com",
-                "title": "Test",
-                "content": "Content",
-                "source": "example.com",
-                "summary": "Test summary",
-                "topics": "topic1, topic2",
-                "keywords": "key1, key2",
-                "sentiment": "positive",
-                "reading_time": 2,
-                "published_at": now.isoformat(),
-                "language": "en",
-                "author": ""
-            }
-        )
-    ]
+    legacy_metadata = {
+        "url": "https://example.com",
+        "title": "Test",
+        "content": "Content",
+        "source": "example.com",
+        "summary": "Test summary",
+        "topics": "topic1, topic2",
+        "keywords": "key1, key2",
+        "sentiment": "positive",
+        "reading_time": 2,
+        "published_at": now.isoformat(),
+        "language": "en",
+        "author": ""
+    }
+    repository.collection.count.return_value = 1
+    repository.collection.query.return_value = {
+        "ids": [["chunk-1"]],
+        "documents": [["Test content"]],
+        "metadatas": [[legacy_metadata]],
+        "distances": [[0.25]],
+        "embeddings": [[[0.1, 0.2]]]
+    }
     
-    with patch.object(repository.vectorstore, "similarity_search", return_value=test_docs):
+    with patch.object(type(repository.embeddings), "embed_query", return_value=[0.1, 0.2]):
         results = await repository.search("test query")
         assert len(results) == 1
         assert results[0].url == "https://example.com"
+        assert results[0].score == pytest.approx(0.8)
+        assert results[0].snippet == "Test content"
 
 
 @pytest.mark.asyncio
 async def test_search_failure(repository):
     """Test search failure."""
-    with patch.object(repository.vectorstore, "similarity_search", side_effect=Exception("Search failed")):
+    repository.collection.count.return_value = 1
+    repository.collection.query.side_effect = Exception("Search failed")
+    with patch.object(type(repository.embeddings), "embed_query", return_value=[0.1, 0.2]):
         with pytest.raises(SearchError):
-            await repository.search("test query") 
\ No newline at end of file
+            await repository.search("test query") 
+
+
+@pytest.mark.asyncio
+async def test_search_runs_off_event_loop(repository):
+    """Test that a slow vector search does not block the event loop."""
+    def slow_embed(self, text):
+        time.sleep(0.3)
+        return [0.1, 0.2]
+    
+    repository.collection.count.return_value = 0
+    with patch.object(type(repository.embeddings), "embed_query", slow_embed):
+        task = asyncio.create_task(repository.search("test query"))
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        assert time.perf_counter() - started < 0.2
+        assert await task == []
+
+
+@pytest.fixture
+def local_repository(tmp_path):
+    """Create a repository on a real local Chroma store with fake embeddings."""
+    with patch("src.services.storage.repository.OpenAIEmbeddings",
+               side_effect=lambda **kwargs: DeterministicFakeEmbedding(size=32)), \
+         patch("src.services.storage.repository.settings.embedding_cache_enabled", False):
+        repository = ChromaRepository(persist_dir=str(tmp_path / "chroma"))
+    yield repository
+    repository.article_store.close()
+    repository.keyword_index.close()
+    repository.facet_index.close()
+
+
+def test_create_document_normalized(repository, test_content):
+    """Test that chunks carry only the content id and chunk text."""
+    documents = repository._create_document(test_content)
+    
+    assert documents
+    assert all(doc.metadata["content_id"] == content_id_for(test_content.url) for doc in documents)
+    assert all(isinstance(doc.metadata["published_at"], int) for doc in documents)
+    assert all("content" not in doc.metadata and "summary" not in doc.metadata for doc in documents)
+
+
+@pytest.mark.asyncio
+async def test_store_and_search_normalized(local_repository, test_content):
+    """Test that articles are stored once and fetched for search hits."""
+    await local_repository.store(test_content)
+    
+    stored = local_repository.article_store.get(test_content.url)
+    assert stored.content == test_content.content
+    
+    results = await local_repository.search("Test content")
+    assert len(results) == 1
+    assert results[0].url == test_content.url
+    assert results[0].content == test_content.content
+    assert results[0].summary == test_content.summary
+
+
+@pytest.mark.asyncio
+async def test_migrate_legacy_layout(local_repository, test_content):
+    """Test migrating denormalized chunks to the normalized layout."""
+    collection = local_repository.chroma_client.get_or_create_collection("content")
+    legacy_metadata = {
+        "url": test_content.url,
+        "title": test_content.title,
+        "source": test_content.source,
+        "summary": test_content.summary,
+        "content": test_content.content,
+        "author": "",
+        "published_at": str(test_content.published_at),
+        "language": "en",
+        "sentiment": "positive",
+        "reading_time": 2,
+        "topics": "topic1",
+        "keywords": "key1"
+    }
+    collection.add(
+        ids=["chunk-1", "chunk-2"],
+        embeddings=[[0.1] * 32, [0.2] * 32],
+        documents=["first chunk", "second chunk"],
+        metadatas=[legacy_metadata, legacy_metadata]
+    )
+    
+    assert migrate_legacy_layout(local_repository, batch_size=1) == 2
+    
+    migrated = collection.get(include=["metadatas", "documents", "embeddings"])
+    assert sorted(migrated["ids"]) == ["chunk-1", "chunk-2"]
+    assert all(m == ChromaRepository._chunk_metadata(test_content) for m in migrated["metadatas"])
+    assert local_repository.article_store.get(test_content.url).topics == ["topic1"]
+    
+    # Running again is a no-op
+    assert migrate_legacy_layout(local_repository) == 0
+
+
+@pytest.mark.asyncio
+async def test_store_is_idempotent(local_repository, test_content):
+    """Test that storing the same URL twice does not duplicate chunks."""
+    collection = local_repository.chroma_client.get_or_create_collection("content")
+    
+    await local_repository.store(test_content)
+    first = sorted(collection.get(include=[])["ids"])
+    embed_documents = DeterministicFakeEmbedding.embed_documents
+    with patch.object(DeterministicFakeEmbedding, "embed_documents",
+                      autospec=True, side_effect=embed_documents) as mock_embed:
+        await local_repository.store_multiple([test_content, test_content])
+    
+    assert sorted(collection.get(include=[])["ids"]) == first
+    assert all(id.startswith(content_id_for(test_content.url) + ":") for id in first)
+    mock_embed.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_store_unchanged_article_keeps_chunk_ids(local_repository, test_content):
+    """Test that re-processing an unchanged URL reuses ids and embeddings."""
+    collection = local_repository.chroma_client.get_or_create_collection("content")
+    fields = test_content.model_dump(exclude={"published_at"})
+    
+    await local_repository.store(Content(**fields))
+    first = sorted(collection.get(include=[])["ids"])
+    embed_documents = DeterministicFakeEmbedding.embed_documents
+    with patch.object(DeterministicFakeEmbedding, "embed_documents",
+                      autospec=True, side_effect=embed_documents) as mock_embed:
+        await local_repository.store(Content(**fields))
+        await local_repository.store_multiple([Content(**fields)])
+    
+    assert sorted(collection.get(include=[])["ids"]) == first
+    mock_embed.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_store_metadata_change_updates_in_place(local_repository, test_content):
+    """Test that a metadata-only change rewrites metadata without re-embedding."""
+    collection = local_repository.chroma_client.get_or_create_collection("content")
+    content = test_content.model_copy(update={"topics": ["topic1", "topic2"]})
+    
+    await local_repository.store(content)
+    first = sorted(collection.get(include=[])["ids"])
+    embed_documents = DeterministicFakeEmbedding.embed_documents
+    with patch.object(DeterministicFakeEmbedding, "embed_documents",
+                      autospec=True, side_effect=embed_documents) as mock_embed:
+        await local_repository.store_multiple([content.model_copy(update={"sentiment": "negative"})])
+        mock_embed.assert_not_called()
+        stored = collection.get(include=["metadatas"])
+        assert sorted(stored["ids"]) == first
+        assert all(m["sentiment"] == "negative" for m in stored["metadatas"])
+        
+        # Only the header chunk spells out the topics, so only it is re-embedded
+        changed = content.model_copy(update={"topics": ["topic3"]})
+        await local_repository.store(changed)
+    
+    header = local_repository._create_document(changed)[0].page_content
+    assert [call.args[1] for call in mock_embed.call_args_list] == [[header]]
+    assert collection.count() == len(first)
+    assert not collection.get(where={"topic_1": "topic2"}, include=[])["ids"]
+    assert len(collection.get(where={"topic_0": "topic3"}, include=[])["ids"]) == len(first)
+
+
+@pytest.mark.asyncio
+async def test_store_removes_stale_chunks(local_repository, test_content):
+    """Test that a shortened article drops its stale chunks."""
+    collection = local_repository.chroma_client.get_or_create_collection("content")
+    long_content = test_content.model_copy(update={"content": "Lorem ipsum dolor sit amet. " * 400})
+    
+    await local_repository.store(long_content)
+    assert collection.count() > 1
+    
+    await local_repository.store(test_content)
+    assert collection.count() == len(local_repository._create_document(test_content))
+    
+    results = await local_repository.search("Test content")
+    assert [r.content for r in results] == [test_content.content]
+
+
+@pytest.mark.asyncio
+async def test_store_multiple_success(local_repository, test_content):
+    """Test storing multiple content items."""
+    contents = [test_content, test_content.model_copy(update={"url": "https://example.com/other"})]
+    
+    await local_repository.store_multiple(contents)
+    
+    assert local_repository.collection.count() == 2 * len(local_repository._create_document(test_content))
+    assert local_repository.article_store.get("https://example.com/other") is not None
+
+
+@pytest.mark.asyncio
+async def test_store_batch_isolates_failures(local_repository, test_content):
+    """Test that one failing article does not fail the rest of its batch."""
+    contents = [
+        test_content.model_copy(update={"url": f"https://example.com/{i}", "content": f"Article {i}"})
+        for i in range(3)
+    ]
+    aembed_documents = DeterministicFakeEmbedding.aembed_documents
+    
+    async def flaky_embed(self, texts):
+        if any("Article 1" in text for text in texts):
+            raise ValueError("bad chunk")
+        return await aembed_documents(self, texts)
+    
+    with patch.object(DeterministicFakeEmbedding, "aembed_documents", flaky_embed):
+        results = await local_repository.store_batch(contents)
+    
+    assert [r.url for r in results] == [c.url for c in contents]
+    assert [r.ok for r in results] == [True, False, True]
+    assert "bad chunk" in results[1].error
+    assert local_repository.article_store.get("https://example.com/1") is None
+    assert local_repository.collection.count() == 2 * len(local_repository._create_document(contents[0]))
+
+
+@pytest.mark.asyncio
+async def test_store_stream_batches_by_budget(local_repository, test_content):
+    """Test that a streamed ingestion embeds in bounded batches."""
+    async def contents():
+        for i in range(5):
+            yield test_content.model_copy(update={"url": f"https://example.com/{i}"})
+    
+    aembed_documents = DeterministicFakeEmbedding.aembed_documents
+    chunks = len(local_repository._create_document(test_content))
+    with patch("src.services.storage.repository.settings.embedding_batch_size", 2 * chunks), \
+         patch.object(DeterministicFakeEmbedding, "aembed_documents",
+                      autospec=True, side_effect=aembed_documents) as mock_embed:
+        results = [result async for result in local_repository.store_stream(contents())]
+    
+    assert all(result.ok for result in results)
+    assert len(results) == 5
+    assert mock_embed.call_count == 3
+    assert max(len(call.args[1]) for call in mock_embed.call_args_list) <= 2 * chunks
+
+
+@pytest.mark.asyncio
+async def test_search_returns_limit_distinct_articles(local_repository, test_content):
+    """Test that a long article owning the top chunks does not crowd out others."""
+    long_content = test_content.model_copy(update={"content": "Lorem ipsum dolor sit amet. " * 800})
+    others = [
+        test_content.model_copy(update={"url": f"https://example.com/{i}", "content": f"Article {i}"})
+        for i in range(3)
+    ]
+    await local_repository.store_multiple([long_content, *others])
+    
+    with patch("src.services.storage.repository.settings.search_overfetch_factor", 1):
+        results = await local_repository.search("Lorem ipsum", limit=4)
+    
+    assert len({r.url for r in results}) == 4
+    assert [r.score for r in results] == sorted((r.score for r in results), reverse=True)
+    assert all(r.snippet for r in results)
+
+
+@pytest.mark.asyncio
+async def test_search_diversity(local_repository, test_content):
+    """Test that MMR diversity demotes near-duplicate articles."""
+    duplicate = test_content.model_copy(update={"url": "https://example.com/copy"})
+    different = test_content.model_copy(update={"url": "https://example.com/other", "title": "Other"})
+    await local_repository.store_multiple([test_content, duplicate, different])
+    query = local_repository._create_document(test_content)[0].page_content
+    
+    plain = await local_repository.search(query, limit=2, diversity=0.0)
+    diverse = await local_repository.search(query, limit=2, diversity=0.9)
+    
+    assert {r.url for r in plain} == {test_content.url, duplicate.url}
+    assert different.url in {r.url for r in diverse}
+
+
+@pytest.mark.asyncio
+async def test_keyword_search_needs_no_embedding(local_repository, test_content):
+    """Test that keyword mode ranks exact matches without embedding the query."""
+    contents = [
+        test_content.model_copy(update={"url": "https://example.com/a", "content": "Central bank raises interest rates"}),
+        test_content.model_copy(update={"url": "https://example.com/b", "content": "Local team wins the football final"})
+    ]
+    await local_repository.store_multiple(contents)
+    
+    with patch.object(DeterministicFakeEmbedding, "embed_query", side_effect=AssertionError("network call")):
+        results = await local_repository.search("football", mode="keyword")
+    
+    assert [r.url for r in results] == ["https://example.com/b"]
+    assert "football" in results[0].snippet
+    assert results[0].score > 0
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_fuses_rankings(local_repository, test_content):
+    """Test that hybrid mode merges vector and keyword rankings."""
+    contents = [
+        test_content.model_copy(update={"url": f"https://example.com/{i}", "content": f"Article number {i}"})
+        for i in range(4)
+    ] + [test_content.model_copy(update={"url": "https://example.com/kw", "content": "Quantum computing breakthrough"})]
+    await local_repository.store_multiple(contents)
+    
+    results = await local_repository.search("quantum", limit=5, mode="hybrid")
+    
+    assert results[0].url == "https://example.com/kw"
+    assert len({r.url for r in results}) == 5
+
+
+def test_fuse_reciprocal_rank():
+    """Test reciprocal-rank fusion scores."""
+    first = [{"content_id": "a", "score": 0.9, "snippet": "", "metadata": None},
+             {"content_id": "b", "score": 0.8, "snippet": "", "metadata": None}]
+    second = [{"content_id": "b", "score": 7.0, "snippet": "", "metadata": None}]
+    
+    fused = ChromaRepository._fuse([first, second], k=60)
+    
+    assert [hit["content_id"] for hit in fused] == ["b", "a"]
+    assert fused[0]["score"] == pytest.approx(1 / 62 + 1 / 61)
+
+
+@pytest.mark.asyncio
+async def test_rebuild_indexes(local_repository, test_content):
+    """Test rebuilding the keyword index from the article store."""
+    local_repository.article_store.upsert(test_content)
+    assert local_repository.keyword_index.count() == 0
+    
+    assert rebuild_indexes(local_repository) == 1
+    assert (await local_repository.search("storage", mode="keyword"))[0].url == test_content.url
+
+
+@pytest.mark.asyncio
+async def test_search_filters_pushed_down(local_repository, test_content):
+    """Test filtering by source, topics and publication date inside Chroma."""
+    contents = [
+        test_content.model_copy(update={
+            "url": f"https://example.com/{i}",
+            "source": "a.com" if i % 2 else "b.com",
+            "topics": ["Politics"] if i < 2 else ["Sports"],
+            "published_at": datetime(2025, 1, 1 + i)
+        }) for i in range(4)
+    ]
+    await local_repository.store_multiple(contents)
+    
+    with patch.object(local_repository.collection, "query", wraps=local_repository.collection.query) as mock_query:
+        results = await local_repository.search("Test", limit=4, filters=SearchFilters(source=["a.com"]))
+    assert {r.url for r in results} == {"https://example.com/1", "https://example.com/3"}
+    assert mock_query.call_args.kwargs["where"] == {"source": {"$in": ["a.com"]}}
+    
+    results = await local_repository.search("Test", limit=4, filters=SearchFilters(
+        topics=["politics"], published_after=datetime(2025, 1, 2)
+    ))
+    assert [r.url for r in results] == ["https://example.com/1"]
+    
+    results = await local_repository.search("Test", limit=4, mode="keyword", filters=SearchFilters(
+        published_before=datetime(2025, 1, 1, 12)
+    ))
+    assert [r.url for r in results] == ["https://example.com/0"]
+
+
+@pytest.mark.asyncio
+async def test_backfill_filter_metadata(local_repository, test_content):
+    """Test adding filter fields to chunks that only carry a content id."""
+    local_repository.article_store.upsert(test_content)
+    local_repository.collection.add(
+        ids=["chunk-1"],
+        embeddings=[[0.1] * 32],
+        documents=["first chunk"],
+        metadatas=[{"content_id": content_id_for(test_content.url)}]
+    )
+    
+    assert backfill_filter_metadata(local_repository) == 1
+    assert local_repository.collection.get(ids=["chunk-1"])["metadatas"][0] == ChromaRepository._chunk_metadata(test_content)
+    assert backfill_filter_metadata(local_repository) == 0
+
+
+@pytest.mark.asyncio
+async def test_facets_counted_at_store_time(local_repository, test_content):
+    """Test that facet counters follow stored and re-stored articles."""
+    first = test_content.model_copy(update={"url": "https://example.com/1", "topics": ["AI", "Chips"]})
+    second = test_content.model_copy(update={"url": "https://example.com/2", "topics": ["AI"]})
+    await local_repository.store_multiple([first, second])
+    
+    facets = await local_repository.facets()
+    assert [(f.value, f.count) for f in facets["topics"]] == [("AI", 2), ("Chips", 1)]
+    assert [(f.value, f.count) for f in facets["source"]] == [("example.com", 2)]
+    
+    # Re-storing an article moves only the counts that changed
+    await local_repository.store(first.model_copy(update={"topics": ["Chips"], "sentiment": "negative"}))
+    facets = await local_repository.facets(["topics", "sentiment"], limit=1)
+    assert [(f.value, f.count) for f in facets["topics"]] == [("AI", 1)]
+    assert [(f.value, f.count) for f in facets["sentiment"]] == [("negative", 1)]
+
+
+@pytest.mark.asyncio
+async def test_search_offset_and_stream(local_repository, test_content):
+    """Test paging with offset and streaming results in batches."""
+    contents = [
+        test_content.model_copy(update={"url": f"https://example.com/{i}", "content": f"Article {i}"})
+        for i in range(5)
+    ]
+    await local_repository.store_multiple(contents)
+    
+    everything = [r.url for r in await local_repository.search("Article", limit=5, mode="keyword")]
+    first = [r.url for r in await local_repository.search("Article", limit=2, mode="keyword")]
+    second = [r.url for r in await local_repository.search("Article", limit=2, mode="keyword", offset=2)]
+    streamed = [r.url async for r in local_repository.search_stream("Article", limit=5, mode="keyword", batch_size=2)]
+    
+    assert first + second == everything[:4]
+    assert streamed == everything
+
+
+@pytest.mark.asyncio
+async def test_search_cache(local_repository, test_content):
+    """Test that repeated searches are cached until the next write."""
+    await local_repository.store(test_content)
+    
+    with patch.object(local_repository, "_rank", wraps=local_repository._rank) as rank:
+        first = await local_repository.search("Test  Article", mode="keyword")
+        second = await local_repository.search("test article", mode="keyword")
+        assert rank.call_count == 1
+        assert first == second
+        
+        await local_repository.store(test_content.model_copy(update={"url": "https://example.com/2"}))
+        third = await local_repository.search("test article", mode="keyword")
+        assert rank.call_count == 2
+        assert len(third) == 2
+    
+    stats = await local_repository.stats()
+    assert stats["search_cache"]["hits"] == 1
+    assert stats["search_cache"]["misses"] == 2
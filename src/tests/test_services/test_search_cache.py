@@ -0,0 +1,92 @@
+"""Tests for the search result cache."""
+import pytest
+from unittest.mock import patch
+from src.models.content import SearchResult
+from src.services.storage.search_cache import MemoryBackend, SearchCache, SharedGeneration
+
+
+class SharedBackend(MemoryBackend):
+    """Backend stand-in for a cache shared between processes."""
+
+
+@pytest.fixture
+def result():
+    """Create a cached search result."""
+    return SearchResult(
+        url="https://example.com",
+        title="Test Article",
+        content="Body",
+        source="example.com",
+        score=0.9,
+        snippet="Body"
+    )
+
+
+def test_key_normalizes_query():
+    """Test that case and whitespace do not change the key."""
+    cache = SearchCache(MemoryBackend(max_entries=10, ttl=60))
+    
+    assert cache.key("  Machine   Learning ", limit=10) == cache.key("machine learning", limit=10)
+    assert cache.key("machine learning", limit=10) != cache.key("machine learning", limit=5)
+
+
+def test_hit_and_miss_counts(result):
+    """Test that cached results round-trip and hit rates are counted."""
+    cache = SearchCache(MemoryBackend(max_entries=10, ttl=60))
+    key = cache.key("test", limit=10)
+    
+    assert cache.get(key) is None
+    cache.set(key, [result])
+    
+    assert cache.get(key) == [result]
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "entries": 1, "generation": 0}
+
+
+def test_invalidate_changes_keys(result):
+    """Test that bumping the generation hides earlier results."""
+    cache = SearchCache(MemoryBackend(max_entries=10, ttl=60))
+    cache.set(cache.key("test", limit=10), [result])
+    
+    cache.invalidate()
+    
+    assert cache.get(cache.key("test", limit=10)) is None
+    assert cache.stats()["generation"] == 1
+
+
+def test_shared_generation_sees_other_processes(tmp_path, result):
+    """Test that a write through one cache invalidates another sharing the file."""
+    path = str(tmp_path / "articles.sqlite3")
+    api = SearchCache(MemoryBackend(max_entries=10, ttl=60), shared_generation=SharedGeneration(path))
+    worker = SearchCache(MemoryBackend(max_entries=10, ttl=60), shared_generation=SharedGeneration(path))
+    api.set(api.key("test", limit=10), [result])
+    
+    worker.invalidate()
+    
+    assert api.get(api.key("test", limit=10)) is None
+    assert api.stats()["generation"] == 1
+    api.close()
+    worker.close()
+
+
+def test_memory_backend_lru_and_ttl():
+    """Test eviction of least recently used and expired entries."""
+    backend = MemoryBackend(max_entries=2, ttl=60)
+    backend.set("a", "1")
+    backend.set("b", "2")
+    backend.get("a")
+    backend.set("c", "3")
+    
+    assert backend.get("b") is None
+    assert backend.get("a") == "1"
+    
+    with patch("src.services.storage.search_cache.time.monotonic", return_value=float("inf")):
+        assert backend.get("a") is None
+
+
+def test_backend_from_settings():
+    """Test that a shared backend is loaded from its import path."""
+    with patch("src.services.storage.search_cache.settings.search_cache_backend",
+               f"{__name__}:SharedBackend"):
+        cache = SearchCache()
+    
+    assert isinstance(cache.backend, SharedBackend)
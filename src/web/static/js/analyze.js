@@ -1,4 +1,47 @@
 // Content processing
+const JOB_POLLING = {
+    initialDelay: 1000,     // ms before the first status check
+    maxDelay: 10000,        // cap of the growing delay between checks
+    timeout: 10 * 60 * 1000,
+    maxErrors: 5            // consecutive failed checks before giving up
+};
+
+// Poll a job with backoff until it completes, fails to load or times out
+async function waitForJob(job) {
+    const deadline = Date.now() + JOB_POLLING.timeout;
+    let delay = JOB_POLLING.initialDelay;
+    let errors = 0;
+    
+    while (job.status !== 'completed') {
+        if (Date.now() + delay > deadline) {
+            throw new Error('Timed out waiting for the job; no worker may be running. Try again later.');
+        }
+        await new Promise(resolve => setTimeout(resolve, delay));
+        delay = Math.min(delay * 2, JOB_POLLING.maxDelay);
+        
+        let jobResponse;
+        try {
+            jobResponse = await fetch(`/api/content/jobs/${job.id}`);
+        } catch (error) {
+            jobResponse = null;
+        }
+        if (jobResponse && jobResponse.status === 404) {
+            throw new Error('Job not found; it may have been removed.');
+        }
+        if (!jobResponse || !jobResponse.ok) {
+            errors += 1;
+            if (errors >= JOB_POLLING.maxErrors) {
+                const reason = jobResponse ? jobResponse.statusText : 'network error';
+                throw new Error(`Could not check the job status: ${reason}`);
+            }
+            continue;
+        }
+        errors = 0;
+        job = await jobResponse.json();
+    }
+    return job;
+}
+
 async function processUrls(event) {
     event.preventDefault();
     
@@ -22,12 +65,12 @@ async function processUrls(event) {
             throw new Error('Please enter at least one valid URL');
         }
         
-        // Prepare request body
+        // Queue the URLs as a job
         const body = urls.length === 1 
             ? { url: urls[0] }
             : { urls: urls };
         
-        const response = await fetch('/api/content/process', {
+        const response = await fetch('/api/content/jobs', {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             body: JSON.stringify(body)
@@ -38,13 +81,23 @@ async function processUrls(event) {
             throw new Error(errorData.detail || `Error: ${response.statusText}`);
         }
         
-        const data = await response.json();
-        const contents = Array.isArray(data) ? data : [data];
+        // Poll the job until every URL is processed
+        const job = await waitForJob(await response.json());
         
         // Render results
-        contents.forEach(content => renderContent(content));
+        job.items
+            .filter(item => item.status === 'done')
+            .forEach(item => renderContent(item.content));
         elements.process.results.style.display = 'block';
         
+        const failed = job.items.filter(item => item.status === 'failed');
+        if (failed.length > 0) {
+            elements.process.error.textContent = failed
+                .map(item => `${item.url}: ${item.error}`)
+                .join('; ');
+            elements.process.error.style.display = 'block';
+        }
+        
     } catch (error) {
         elements.process.error.textContent = error.message;
         elements.process.error.style.display = 'block';
@@ -10,7 +10,7 @@ async function searchArticles(event) {
     spinner.style.display = 'inline-block';
     
     try {
-        const response = await fetch(`/api/search/content?query=${encodeURIComponent(elements.search.input.value)}`);
+        const response = await fetch(`/api/search/content?mode=hybrid&query=${encodeURIComponent(elements.search.input.value)}`);
         if (!response.ok) throw new Error(`Error: ${response.statusText}`);
         
         const articles = await response.json();
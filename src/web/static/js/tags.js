@@ -1,12 +1,10 @@
 async function loadAvailableTags() {
     try {
-        const response = await fetch('/api/search/content?query=*');
+        const response = await fetch('/api/search/facets?facet=topics&limit=50');
         if (!response.ok) throw new Error('Failed to load tags');
         
-        const articles = await response.json();
-        articles.forEach(article => {
-            article.topics.forEach(topic => state.allTags.add(topic));
-        });
+        const facets = await response.json();
+        facets.topics.forEach(({ value }) => state.allTags.add(value));
         
         renderAvailableTags();
     } catch (error) {
@@ -67,7 +65,7 @@ async function searchByTags(tags) {
     try {
         // Combine all tags into a single search query
         const query = tags.join(' ');
-        const response = await fetch(`/api/search/content?query=${encodeURIComponent(query)}`);
+        const response = await fetch(`/api/search/content?mode=keyword&query=${encodeURIComponent(query)}`);
         
         if (!response.ok) throw new Error(`Error: ${response.statusText}`);
         
@@ -0,0 +1,37 @@
+"""Standalone job worker process.
+
+Runs the ingestion job workers without the API, e.g. with JOB_WORKERS=0
+set for the API processes:
+
+    CHROMA_HOST=chroma JOB_WORKERS=4 python -m src.worker
+
+The embedded Chroma client keeps its index in process memory, so writes
+from another process would never reach the API's searches; standalone
+workers therefore require a Chroma server.
+"""
+import asyncio
+
+from src.core.config import get_settings
+from src.core.exceptions import DatabaseError
+from src.core.factory import init_services, shutdown_services, get_job_workers
+
+settings = get_settings()
+
+
+async def main() -> None:
+    """Process queued jobs until interrupted."""
+    if not settings.chroma_host:
+        raise DatabaseError("Standalone workers need a Chroma server shared with the API; set CHROMA_HOST")
+    try:
+        init_services()
+        get_job_workers().start()
+        await asyncio.Event().wait()
+    finally:
+        await shutdown_services()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass